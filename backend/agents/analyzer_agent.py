@@ -1 +1,62 @@
-# Analyzer Agent (Planner: Nouns/Verbs)
+# Analyzer Agent (Planner + Summary in a single LLM call)
+from typing import Any, Dict, List, Tuple
+from backend.agents.base import MeetingAnalyzerAgent
+from backend.agents.planner_runner import normalize_planner_output
+from backend.services.base import LLMService
+
+
+SYSTEM_PROMPT = """You are an executive meeting assistant.
+From the meeting transcript, extract actionable tasks AND write a meeting summary.
+
+For each task, identify:
+- title: Short summary of the task (3-6 words)
+- description: Detailed explanation of what needs to be done. Include context.
+- owner: Who is responsible (if mentioned)
+- deadline: When it's due (if mentioned)
+- type: Category (e.g., "Feature request", "Bug fix", "Documentation")
+
+The summary must contain:
+- title
+- overview (2–3 sentences)
+- key_points (list)
+- decisions (list, empty if none)
+- action_items (list, one entry per task)
+- next_steps (string)
+
+Output ONLY valid JSON of the form:
+{"tasks": [...], "summary": {...}}
+"""
+
+
+class GeminiMeetingAnalyzerAgent(MeetingAnalyzerAgent):
+    """Extracts tasks and summary with one structured-output Gemini call."""
+
+    def __init__(self, llm_service: LLMService):
+        """
+        Initialize analyzer with LLM service.
+
+        Args:
+            llm_service: LLM service for combined extraction
+        """
+        self.llm_service = llm_service
+
+    def analyze_meeting(self, transcript: str) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+        """Return (tasks, summary). Either may be empty if the call fails."""
+        try:
+            result = self.llm_service.generate_json(
+                prompt=transcript,
+                system_prompt=SYSTEM_PROMPT
+            )
+        except Exception as e:
+            print(f"❌ Error analyzing meeting: {e}")
+            return [], {}
+
+        if not isinstance(result, dict):
+            print("⚠️ Analyzer returned unexpected JSON shape.")
+            return [], {}
+
+        summary = result.get("summary")
+        if not isinstance(summary, dict):
+            summary = {}
+
+        return normalize_planner_output(result.get("tasks", [])), summary
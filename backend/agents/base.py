@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Tuple
 
 
 class Agent(ABC):
@@ -45,3 +45,12 @@ class SummaryAgent(ABC):
     def generate_summary(self, transcript: str, tasks: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Generate a structured summary from transcript and extracted tasks."""
         pass
+
+
+class MeetingAnalyzerAgent(ABC):
+    """Interface for agents that extract tasks and summary in a single pass."""
+    
+    @abstractmethod
+    def analyze_meeting(self, transcript: str) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+        """Return (tasks, summary) for a transcript."""
+        pass
@@ -49,15 +49,13 @@ class NotionExecutorAgent(ExecutorAgent):
                 
                 meeting_page_id = self.task_storage.create_meeting_row(meeting_id_to_use)
                 print(f"✅ meeting row established: {meeting_id_to_use} -> {meeting_page_id}")
-                
-                # Return state update if possible (requires graph node capability)
-                return {"notion_page_id": meeting_page_id}
             except Exception as e:
                 import traceback
                 with open("error_log.txt", "w") as f:
                     f.write(str(e))
                 print(f"⚠️ Failed to create meeting row: {e}")
 
+        storage_tasks = []
         for task in tasks:
             # Convert Pydantic model to dict if needed
             task_data = task
@@ -67,21 +65,32 @@ class NotionExecutorAgent(ExecutorAgent):
                  task_data = task.dict()
             
             # Map agent task format to storage format
-            storage_task = self._map_task(task_data, meeting_id)
-            
-            try:
-                # Pass both page_id (for relation if supported) and sequence_id (for number link)
-                if hasattr(self.task_storage, 'create_task') and 'meeting_sequence_id' in self.task_storage.create_task.__code__.co_varnames:
-                     task_id = self.task_storage.create_task(storage_task, meeting_page_id=meeting_page_id, meeting_sequence_id=meeting_sequence_id)
+            storage_tasks.append(self._map_task(task_data, meeting_id))
+        
+        if hasattr(self.task_storage, 'create_tasks'):
+            # Bulk path: concurrent, rate-limited creation with per-task results in order
+            results = self.task_storage.create_tasks(
+                storage_tasks, meeting_page_id=meeting_page_id, meeting_sequence_id=meeting_sequence_id
+            )
+            for result in results:
+                if result["error"]:
+                    print(f"❌ Failed to create task: {result['title']}: {result['error']}")
                 else:
-                     task_id = self.task_storage.create_task(storage_task, meeting_page_id=meeting_page_id)
-                
-                print(f"✅ Created task: {storage_task['title']} (ID: {task_id})")
-            except Exception as e:
-                import traceback
-                with open("error_log.txt", "w") as f:
-                    f.write(str(e))
-                print(f"❌ Failed to create task: {storage_task['title']}: {e}")
+                    print(f"✅ Created task: {result['title']} (ID: {result['id']})")
+        else:
+            for storage_task in storage_tasks:
+                try:
+                    # Pass both page_id (for relation if supported) and sequence_id (for number link)
+                    if hasattr(self.task_storage, 'create_task') and 'meeting_sequence_id' in self.task_storage.create_task.__code__.co_varnames:
+                         task_id = self.task_storage.create_task(storage_task, meeting_page_id=meeting_page_id, meeting_sequence_id=meeting_sequence_id)
+                    else:
+                         task_id = self.task_storage.create_task(storage_task, meeting_page_id=meeting_page_id)
+                    
+                    print(f"✅ Created task: {storage_task['title']} (ID: {task_id})")
+                except Exception as e:
+                    with open("error_log.txt", "w") as f:
+                        f.write(str(e))
+                    print(f"❌ Failed to create task: {storage_task['title']}: {e}")
         
         return {"notion_page_id": meeting_page_id} if meeting_page_id else {}
     
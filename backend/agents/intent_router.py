@@ -0,0 +1,166 @@
+"""
+Local Intent Router
+
+Decides SEARCH / SUMMARY / ANSWER for a meeting question without an LLM call
+in the common cases: regex rules first, then a nearest-centroid classifier
+over bag-of-words + bigram vectors built from labelled examples. Returns
+None when not confident, so the caller can fall back to the LLM router.
+Counters record how often each path is taken.
+"""
+import math
+import os
+import re
+import threading
+import time
+from collections import Counter, defaultdict
+from typing import Dict, List, Optional, Tuple
+
+INTENT_MIN_SIMILARITY = float(os.getenv("INTENT_MIN_SIMILARITY", "0.3"))
+INTENT_MIN_MARGIN = float(os.getenv("INTENT_MIN_MARGIN", "0.1"))
+
+GREETING_RE = re.compile(r"^\s*(hi|hello|hey|yo|good (morning|afternoon|evening))\b[\s!.,]*(there)?[\s!.]*$", re.I)
+THANKS_RE = re.compile(
+    r"^\s*((thanks|thank you|thx|cheers|great|awesome|perfect|ok(ay)?|cool|got it)( so much| a lot)?[\s!.,]*)+$", re.I
+)
+HELP_RE = re.compile(r"^\s*(help|what can you do|who are you|how do(es)? (this|you) work)\??\s*$", re.I)
+SUMMARY_RE = re.compile(
+    r"\b(summari[sz]e|summary|recap|overview|tl;?dr|key (takeaways|points)|takeaways|highlights|main points)\b", re.I
+)
+SEARCH_RE = re.compile(r"^\s*(who|when|where|which|whose|did|does|do|was|were|has|have|is|are)\b\s+\S+\s+\S+", re.I)
+
+CANNED_ANSWERS = {
+    "greeting": "Hi! Ask me anything about your past meetings: tasks, decisions, or who said what.",
+    "thanks": "You're welcome! Let me know if you have other questions about your meetings.",
+    "help": "I answer questions about your recorded meetings. Try \"Summarize the last meeting\" "
+            "or \"What did we decide about the budget?\"",
+}
+
+TRAINING_EXAMPLES: Dict[str, List[str]] = {
+    "SUMMARY": [
+        "summarize the meeting",
+        "give me a recap",
+        "what were the key takeaways",
+        "overview of yesterday's meeting",
+        "what were the main points discussed",
+        "what happened in the meeting",
+        "what did we talk about in the sync",
+        "brief me on the last meeting",
+        "what was the meeting about",
+        "catch me up on the standup",
+    ],
+    "SEARCH": [
+        "what did amr advise",
+        "who is responsible for the login bug",
+        "when is the deadline for the report",
+        "which tasks were assigned to priya",
+        "did we decide on the budget",
+        "what was said about hiring",
+        "what are my action items",
+        "who owns the launch checklist",
+        "what did we agree about pricing",
+        "what advice did the mentor give about interviews",
+        "find the discussion about the database migration",
+        "what did paarth say about the release",
+    ],
+}
+
+
+def _features(text: str) -> Counter:
+    tokens = re.findall(r"[a-z0-9']+", (text or "").lower())
+    return Counter(tokens + [f"{a} {b}" for a, b in zip(tokens, tokens[1:])])
+
+
+def _normalize(vector: Dict[str, float]) -> Dict[str, float]:
+    norm = math.sqrt(sum(v * v for v in vector.values()))
+    return {k: v / norm for k, v in vector.items()} if norm else {}
+
+
+class IntentRouter:
+    """Rules + nearest-centroid router with per-path counters."""
+
+    def __init__(self, examples: Dict[str, List[str]] = None, min_similarity: float = INTENT_MIN_SIMILARITY,
+                 min_margin: float = INTENT_MIN_MARGIN):
+        self.min_similarity = min_similarity
+        self.min_margin = min_margin
+        self.centroids: Dict[str, Dict[str, float]] = {}
+        for intent, texts in (examples or TRAINING_EXAMPLES).items():
+            total: Dict[str, float] = defaultdict(float)
+            for text in texts:
+                for feature, weight in _normalize(_features(text)).items():
+                    total[feature] += weight
+            self.centroids[intent] = _normalize(total)
+
+        self._lock = threading.Lock()
+        self.counters: Counter = Counter()
+        self._local_seconds = 0.0
+
+    def classify(self, query: str) -> Tuple[Optional[str], float]:
+        """Nearest centroid and its margin over the runner-up (0 when unknown)."""
+        vector = _normalize(_features(query))
+        if not vector:
+            return None, 0.0
+        similarities = sorted(
+            ((sum(weight * centroid.get(feature, 0.0) for feature, weight in vector.items()), intent)
+             for intent, centroid in self.centroids.items()),
+            reverse=True
+        )
+        best, intent = similarities[0]
+        runner_up = similarities[1][0] if len(similarities) > 1 else 0.0
+        if best < self.min_similarity:
+            return None, 0.0
+        return intent, best - runner_up
+
+    def _rules(self, query: str) -> Optional[str]:
+        if GREETING_RE.match(query):
+            return f"ANSWER: {CANNED_ANSWERS['greeting']}"
+        if THANKS_RE.match(query):
+            return f"ANSWER: {CANNED_ANSWERS['thanks']}"
+        if HELP_RE.match(query):
+            return f"ANSWER: {CANNED_ANSWERS['help']}"
+        if SUMMARY_RE.search(query):
+            return "SUMMARY"
+        if SEARCH_RE.match(query):
+            return f"SEARCH: {query.strip()}"
+        return None
+
+    def route(self, query: str) -> Optional[str]:
+        """
+        Return a decision in the LLM router's format ("SEARCH: <query>",
+        "SUMMARY" or "ANSWER: <text>"), or None to defer to the LLM.
+        """
+        start = time.perf_counter()
+        decision, path = self._rules(query), "rule"
+        if decision is None:
+            intent, margin = self.classify(query)
+            path = "classifier"
+            # Chit-chat needs a generated reply, so only SEARCH/SUMMARY are taken locally
+            if intent == "SUMMARY" and margin >= self.min_margin:
+                decision = "SUMMARY"
+            elif intent == "SEARCH" and margin >= self.min_margin:
+                decision = f"SEARCH: {query.strip()}"
+        elapsed = time.perf_counter() - start
+
+        with self._lock:
+            self._local_seconds += elapsed
+            if decision is None:
+                self.counters["llm"] += 1
+            else:
+                self.counters[path] += 1
+                self.counters[f"intent:{decision.split(':')[0]}"] += 1
+        return decision
+
+    def record_llm_decision(self, decision: str) -> None:
+        with self._lock:
+            self.counters[f"intent:{(decision or 'UNKNOWN').split(':')[0].strip()}"] += 1
+
+    def stats(self) -> Dict[str, float]:
+        with self._lock:
+            total = self.counters["rule"] + self.counters["classifier"] + self.counters["llm"]
+            stats = dict(self.counters)
+            stats["total"] = total
+            stats["local_rate"] = round((total - self.counters["llm"]) / total, 3) if total else 0.0
+            stats["avg_local_us"] = round(self._local_seconds / total * 1e6, 1) if total else 0.0
+        return stats
+
+
+intent_router = IntentRouter()
@@ -1,8 +1,16 @@
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Iterator, Tuple
+import asyncio
 import json
 import os
+from concurrent.futures import ThreadPoolExecutor
 from backend.services.mem0_service import Mem0Service
 from backend.services.llm_service import GeminiLLMService
+from backend.services.retrieval import HybridRetriever
+from backend.agents.intent_router import intent_router
+
+# Routing LLM calls run here so retrieval can proceed on the request thread meanwhile
+_decision_executor = ThreadPoolExecutor(max_workers=int(os.getenv("AGENT_DECISION_WORKERS", "8")),
+                                        thread_name_prefix="agent-decision")
 
 class MeetingQueryAgent:
     """
@@ -13,13 +21,90 @@ class MeetingQueryAgent:
     def __init__(self, llm_service: GeminiLLMService, mem0_service: Mem0Service):
         self.llm = llm_service
         self.mem0 = mem0_service
+        self.retriever = HybridRetriever(mem0_service)
+        self.router = intent_router
         
     def run(self, query: str, user_id: str, filters: Optional[Dict[str, Any]] = None) -> (str, list[str]):
         """
         Run the agent for a user query.
         Returns: answer (str), sources (list[str])
         """
+        answer, final_prompt, sources = self._prepare(query, user_id, filters)
+        if final_prompt is None:
+            return answer, sources
+        return self.llm.generate(final_prompt), sources
         
+    async def arun(self, query: str, user_id: str, filters: Optional[Dict[str, Any]] = None) -> (str, list[str]):
+        """
+        Async version of run(): both LLM calls are awaited (llm.agenerate)
+        instead of holding a thread, and the blocking memory lookups run in
+        worker threads.
+        """
+        decision = self.router.route(query)
+        retrieved = None
+        if decision is not None:
+            print(f"⚡ Routed locally: {decision.split(':')[0]}")
+        else:
+            # Hybrid retrieval for the question runs while the LLM decides
+            retrieval = asyncio.create_task(
+                asyncio.to_thread(self.retriever.retrieve, query, user_id=user_id, filters=filters))
+            try:
+                decision = (await self.llm.agenerate(self._decision_prompt(query))).strip()
+            except Exception as e:
+                print(f"⚠️ Agent decision failed: {e}. Defaulting to search.")
+                decision = f"SEARCH: {query}"
+            retrieved = await retrieval
+            self.router.record_llm_decision(decision)
+
+        answer, final_prompt, sources = await asyncio.to_thread(
+            self._gather, query, decision, retrieved, user_id, filters)
+        if final_prompt is None:
+            return answer, sources
+        return await self.llm.agenerate(final_prompt), sources
+
+    def run_stream(self, query: str, user_id: str,
+                   filters: Optional[Dict[str, Any]] = None) -> Iterator[Tuple[str, Any]]:
+        """
+        Run the agent and stream the answer.
+        Yields ("sources", list[str]) once, then ("token", str) chunks.
+        """
+        answer, final_prompt, sources = self._prepare(query, user_id, filters)
+        yield "sources", sources
+        if final_prompt is None:
+            yield "token", answer
+            return
+        for chunk in self.llm.stream(final_prompt):
+            yield "token", chunk
+        
+    def _prepare(self, query: str, user_id: str,
+                 filters: Optional[Dict[str, Any]] = None) -> Tuple[Optional[str], Optional[str], list]:
+        """
+        Route the query and gather context.
+        Returns: (direct answer, None, []) or (None, final answer prompt, sources)
+        """
+        # Common intents are routed locally; the LLM router only sees low-confidence queries
+        retrieved = None
+        decision = self.router.route(query)
+        if decision is not None:
+            print(f"⚡ Routed locally: {decision.split(':')[0]}")
+        else:
+            # Hybrid retrieval for the question runs while the LLM decides, so a
+            # SEARCH answer does not wait on a second serial round trip.
+            decision_future = _decision_executor.submit(self.llm.generate, self._decision_prompt(query))
+            retrieved = self.retriever.retrieve(query, user_id=user_id, filters=filters)
+            
+            try:
+                decision = decision_future.result().strip()
+            except Exception as e:
+                # Fallback to search if decision fails
+                print(f"⚠️ Agent decision failed: {e}. Defaulting to search.")
+                decision = f"SEARCH: {query}"
+            self.router.record_llm_decision(decision)
+            
+        return self._gather(query, decision, retrieved, user_id, filters)
+
+    def _decision_prompt(self, query: str) -> str:
+        """Prompt asking the LLM to route the query (SEARCH / SUMMARY / ANSWER)."""
         # Step 1: Decide if we need to search memory
         # For now, we assume ANY question about meetings requires search.
         # But we can let the LLM refine the search query?
@@ -27,7 +112,7 @@ class MeetingQueryAgent:
         # "User asked: {query}. To answer this, should I search for specific keywords? 
         # Output SEARCH: <keywords> or ANSWER: <text>"
         
-        decision_prompt = f"""
+        return f"""
         You are an intelligent assistant. The user asked: "{query}"
         
         Your task is to decide if you need to search past meeting records to answer this.
@@ -51,14 +136,14 @@ class MeetingQueryAgent:
         SUMMARY
         ANSWER: <direct response>
         """
-        
-        try:
-            decision = self.llm.generate(decision_prompt).strip()
-        except Exception as e:
-            # Fallback to search if decision fails
-            print(f"⚠️ Agent decision failed: {e}. Defaulting to search.")
-            decision = f"SEARCH: {query}"
-            
+
+    def _gather(self, query: str, decision: str, retrieved: Optional[list], user_id: str,
+                filters: Optional[Dict[str, Any]] = None) -> Tuple[Optional[str], Optional[str], list]:
+        """
+        Act on the routing decision. `retrieved` holds hits for the raw query
+        fetched while the LLM decided (None when routed locally).
+        Returns: (direct answer, None, []) or (None, final answer prompt, sources)
+        """
         # Log decision for debugging
         try:
             with open("backend/agent.log", "a", encoding="utf-8") as f:
@@ -74,54 +159,33 @@ class MeetingQueryAgent:
             # Use get_all_memories to fetch recent context directly (skipping vector search).
             # This works for both filtered (specific meeting) and unfiltered (all recent) cases.
             print(f"   Fetching recent memories (Limit 20, Filters: {filters})")
-            memories = self.mem0.get_all_memories(
-                user_id=user_id,
-                filters=filters,
-                limit=20
-            )
+            memories = self.retriever.recent(user_id=user_id, filters=filters, limit=20)
 
         elif decision.startswith("SEARCH:"):
-            search_query = decision.replace("SEARCH:", "").strip()
+            search_query = decision.replace("SEARCH:", "").strip() or query
             print(f"🤖 Agent decided to search for: '{search_query}'")
             
-            # Execute Tool: Mem0 Search (vector)
-            memories = self.mem0.search_memory(
-                query=search_query,
-                user_id=user_id,
-                filters=filters,
-                limit=5
-            )
-            
-            # --- Keyword Fallback Logic ---
-            # If explicit name "Amr" or other capitalized entities are in query, ensure we find them.
-            # This handles cases where vector search misses specific entities.
-            keywords = [w for w in search_query.split() if w[0].isupper() and len(w) > 2] # Simple heuristic
-            if keywords:
-                print(f"🔍 DEBUG: Keyword Fallback for: {keywords}")
-                all_memories = self.mem0.get_all_memories(user_id=user_id)
-                found_count = 0
-                for mem in all_memories:
-                    # mem is string (handled by get_all_memories)
-                    if any(k.lower() in mem.lower() for k in keywords):
-                        if mem not in memories:
-                            memories.append(mem)
-                            found_count += 1
-                if found_count > 0:
-                    print(f"✅ Keyword Fallback added {found_count} memories.")
+            # Vector, keyword (BM25) and metadata hits, fused with RRF
+            if retrieved is None or search_query != query:
+                memories = self.retriever.retrieve(search_query, user_id=user_id, filters=filters)
+                if retrieved:
+                    # Keep the hits for the raw question fetched while the LLM decided
+                    memories = self.retriever.merge([memories, retrieved])
+            else:
+                memories = retrieved
             
         elif decision.startswith("ANSWER:"):
             answer = decision.replace("ANSWER:", "").strip()
-            return answer, []
+            return answer, None, []
             
         else:
              # Fallback
-             return "I didn't understand that request.", []
+             return "I didn't understand that request.", None, []
 
         if not memories:
-            return "I couldn't find any relevant meeting information matching your request.", []
+            return "I couldn't find any relevant meeting information matching your request.", None, []
             
-        # Prepare context (De-duplicate)
-        memories = list(set(memories))
+        # Prepare context (already de-duplicated in rank order)
         context = "\n\n---\n\n".join(memories)
             
         # Extract sources
@@ -133,7 +197,7 @@ class MeetingQueryAgent:
                     sources.append(title)
                         
         # Step 2: Generate Final Answer
-            final_prompt = f"""
+        final_prompt = f"""
             You are an expert meeting assistant.
             User Question: {query}
             
@@ -149,7 +213,6 @@ class MeetingQueryAgent:
             6. CRITICAL: If the context contains information from DIFFERENT meetings or UNRELATED topics (e.g. Finance vs Cooking), SEPARATE them clearly in your answer. Do not mix them.
             """
             
-            answer = self.llm.generate(final_prompt)
-            return answer, sources
+        return None, final_prompt, sources
             
 
@@ -1,6 +1,10 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, List
 from backend.agents.base import PlannerAgent
 from backend.services.base import LLMService
+from backend.utils.chunking import split_transcript
+from backend.utils.normalization import merge_duplicate_tasks
 
 
 SYSTEM_PROMPT = """You are a task extraction agent.
@@ -20,52 +24,89 @@ Output ONLY valid JSON array of tasks.
 class GeminiPlannerAgent(PlannerAgent):
     """Planner agent using Gemini LLM service."""
     
-    def __init__(self, llm_service: LLMService):
+    def __init__(self, llm_service: LLMService, chunk_chars: int = None, overlap_chars: int = None,
+                 max_concurrency: int = None):
         """
         Initialize planner with LLM service.
         
         Args:
             llm_service: LLM service for task extraction
+            chunk_chars: Transcripts longer than this are split and processed map-reduce
+                (default: PLANNER_CHUNK_CHARS or 12000)
+            overlap_chars: Context repeated between consecutive chunks
+                (default: PLANNER_CHUNK_OVERLAP or 500)
+            max_concurrency: Parallel chunk extractions (default: PLANNER_MAX_CONCURRENCY or 4)
         """
         self.llm_service = llm_service
+        self.chunk_chars = chunk_chars or int(os.getenv("PLANNER_CHUNK_CHARS", "12000"))
+        self.overlap_chars = overlap_chars if overlap_chars is not None else int(os.getenv("PLANNER_CHUNK_OVERLAP", "500"))
+        self.max_concurrency = max_concurrency or int(os.getenv("PLANNER_MAX_CONCURRENCY", "4"))
     
     def extract_tasks(self, transcript: str) -> List[Dict[str, Any]]:
         """Extract tasks from transcript using LLM."""
         try:
-            tasks = self.llm_service.generate_json(
-                prompt=transcript,
-                system_prompt=SYSTEM_PROMPT
-            )
-            
-            # Handle {"tasks": [...]} wrapper
-            if isinstance(tasks, dict) and "tasks" in tasks:
-                tasks = tasks["tasks"]
-            
-            # Map 'task' to 'title' (and copy to description if missing) for robustness
-            if isinstance(tasks, list):
-                for t in tasks:
-                    if "task" in t and "title" not in t:
-                        t["title"] = t["task"]
-                    if "description" not in t:
-                        t["description"] = t.get("title", "")
-            
-            # Ensure we return a list
-            if isinstance(tasks, dict):
-                return [tasks]
-            
-            # GUARD: Ensure at least one task exists
-            if not tasks:
-                print("⚠️ Planner returned 0 tasks. Injecting default task.")
-                return [{
-                    "title": "Review Meeting Notes",
-                    "description": "Review the summary and follow up on any unassigned items.",
-                    "owner": "Unassigned",
-                    "deadline": None,
-                    "type": "General"
-                }]
-                
-            return tasks
+            if len(transcript) <= self.chunk_chars:
+                tasks = self.llm_service.generate_json(
+                    prompt=transcript,
+                    system_prompt=SYSTEM_PROMPT
+                )
+                return normalize_planner_output(tasks)
             
+            return normalize_planner_output(self._extract_chunked(transcript))
         except Exception as e:
             print(f"❌ Error extracting tasks: {e}")
             return []
+    
+    def _extract_chunked(self, transcript: str) -> List[Dict[str, Any]]:
+        """Map: extract tasks per chunk in parallel. Reduce: merge duplicates across chunks."""
+        chunks = split_transcript(transcript, self.chunk_chars, self.overlap_chars)
+        print(f"✂️ Transcript split into {len(chunks)} chunks for task extraction")
+        
+        def extract_chunk(chunk: str) -> List[Dict[str, Any]]:
+            try:
+                raw = self.llm_service.generate_json(prompt=chunk, system_prompt=SYSTEM_PROMPT)
+                return normalize_planner_output(raw, inject_default=False)
+            except Exception as e:
+                print(f"⚠️ Chunk extraction failed: {e}")
+                return []
+        
+        with ThreadPoolExecutor(max_workers=min(self.max_concurrency, len(chunks))) as executor:
+            per_chunk = list(executor.map(extract_chunk, chunks))
+        
+        tasks = [t for chunk_tasks in per_chunk for t in chunk_tasks]
+        merged = merge_duplicate_tasks(tasks)
+        print(f"   Reduced {len(tasks)} chunk tasks to {len(merged)}")
+        return merged
+
+
+def normalize_planner_output(tasks: Any, inject_default: bool = True) -> List[Dict[str, Any]]:
+    """Coerce raw planner JSON into a list of task dicts with title/description."""
+    # Handle {"tasks": [...]} wrapper
+    if isinstance(tasks, dict) and "tasks" in tasks:
+        tasks = tasks["tasks"]
+    
+    # Map 'task' to 'title' (and copy to description if missing) for robustness
+    if isinstance(tasks, list):
+        tasks = [t for t in tasks if isinstance(t, dict)]
+        for t in tasks:
+            if "task" in t and "title" not in t:
+                t["title"] = t["task"]
+            if "description" not in t:
+                t["description"] = t.get("title", "")
+    
+    # Ensure we return a list
+    if isinstance(tasks, dict) and tasks:
+        return [tasks]
+    
+    # GUARD: Ensure at least one task exists
+    if not tasks and inject_default:
+        print("⚠️ Planner returned 0 tasks. Injecting default task.")
+        return [{
+            "title": "Review Meeting Notes",
+            "description": "Review the summary and follow up on any unassigned items.",
+            "owner": "Unassigned",
+            "deadline": None,
+            "type": "General"
+        }]
+        
+    return tasks or []
@@ -149,20 +149,39 @@ class SlackBroadcastAgent:
         """
         print("📣 Starting Slack Broadcast...")
         
-        # 1. Resolve IDs & Send DMs (DISABLED IN MVP)
-        # User lookup requires users:read scope which is restricted.
-        # We rely on the Manager Summary to notify everyone.
+        # 1. Queue per-assignee DMs. Slack user lookup needs the restricted
+        # users:read scope, so only tasks that already carry a Slack ID get a DM;
+        # everyone else is covered by the manager summary.
+        # Sends are queued on the Slack service and go out concurrently
+        # (paced per channel), so nothing here waits on Slack.
         for task in state.tasks:
-             print(f"   ℹ️ Task for {task.owner_name}: {task.title} (DM skipped in MVP)")
+            if not task.owner_slack_id:
+                print(f"   ℹ️ Task for {task.owner_name}: {task.title} (no Slack ID, DM skipped)")
+                continue
+            future = self.slack_service.send_dm(
+                task.owner_slack_id,
+                text=f"Your action item: {task.title}",
+                blocks=self.build_employee_blocks(task)
+            )
+            state.slack_messages[task.owner_slack_id] = "queued"
+            future.add_done_callback(self._log_result(f"DM to {task.owner_name}"))
 
         # 2. Send Manager Summary
         try:
-            self.slack_service.send_message(
+            future = self.slack_service.send_message(
                 channel=summary_channel,
                 blocks=self.build_manager_blocks(state)
             )
-            print(f"✅ Manager summary sent to {summary_channel}")
+            future.add_done_callback(self._log_result(f"Manager summary to {summary_channel}"))
+            print(f"📤 Manager summary queued for {summary_channel}")
         except Exception as e:
             print(f"❌ Failed to post summary: {e}")
             
         return state
+
+    @staticmethod
+    def _log_result(label: str):
+        def callback(future):
+            error = future.exception()
+            print(f"❌ {label} failed: {error}" if error else f"✅ {label} sent")
+        return callback
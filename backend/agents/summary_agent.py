@@ -1,21 +1,41 @@
-from typing import Any, Dict, List
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
 from backend.agents.base import SummaryAgent
 from backend.services.base import LLMService
+from backend.utils.chunking import split_transcript
+
 
 class GeminiSummaryAgent(SummaryAgent):
-    """Summary agent using Gemini LLM service."""
+    """
+    Summary agent using Gemini LLM service.
+    
+    Transcripts longer than `window_chars` are summarized hierarchically:
+    windows are summarized in parallel, then the partial summaries are
+    combined into the final JSON. Window prompts depend only on the window
+    text, so the LLM service's response cache answers unchanged windows and
+    re-summarizing a transcript that has only grown at the end (live
+    capture) only pays for the new tail windows.
+    """
     
-    def __init__(self, llm_service: LLMService):
+    def __init__(self, llm_service: LLMService, window_chars: int = None, max_concurrency: int = None):
         """
         Initialize summary agent with LLM service.
         
         Args:
             llm_service: LLM service for summary generation
+            window_chars: Window size for hierarchical mode (default: SUMMARY_WINDOW_CHARS or 12000)
+            max_concurrency: Parallel window summaries (default: SUMMARY_MAX_CONCURRENCY or 4)
         """
         self.llm_service = llm_service
+        self.window_chars = window_chars or int(os.getenv("SUMMARY_WINDOW_CHARS", "12000"))
+        self.max_concurrency = max_concurrency or int(os.getenv("SUMMARY_MAX_CONCURRENCY", "4"))
     
     def generate_summary(self, transcript: str, tasks: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Generate meeting summary."""
+        if len(transcript) > self.window_chars:
+            return self._generate_hierarchical(transcript, tasks)
+        
         prompt = self._build_summary_prompt(transcript, tasks)
         
         try:
@@ -24,16 +44,50 @@ class GeminiSummaryAgent(SummaryAgent):
             print(f"❌ Error generating summary: {e}")
             return {}
 
-    def _build_summary_prompt(self, transcript: str, tasks: List[Dict[str, Any]]) -> str:
+    def generate_summary_from_transcript(self, transcript: str) -> Dict[str, Any]:
+        """
+        Generate a summary without the extracted task list.
+        
+        Lets the summary run concurrently with task extraction; combine the
+        two afterwards with merge_tasks_into_summary.
+        """
+        return self.generate_summary(transcript, None)
+
+    def _generate_hierarchical(self, transcript: str, tasks: Optional[List[Dict[str, Any]]]) -> Dict[str, Any]:
+        """Summarize windows in parallel (unchanged windows hit the response cache), then reduce."""
+        # No overlap: window boundaries (and so the cached prompts) must stay stable as the transcript grows
+        windows = split_transcript(transcript, self.window_chars, overlap_chars=0)
+        print(f"🧩 Summarizing {len(windows)} windows")
+        
+        with ThreadPoolExecutor(max_workers=min(self.max_concurrency, len(windows))) as executor:
+            partials = list(executor.map(self._summarize_window, windows))
+        
+        if not all(partials):
+            print("❌ Error generating summary: one or more windows failed")
+            return {}
+        
+        try:
+            return self.llm_service.generate_json(self._build_reduce_prompt(partials, tasks))
+        except Exception as e:
+            print(f"❌ Error generating summary: {e}")
+            return {}
+    
+    def _summarize_window(self, window: str) -> Dict[str, Any]:
+        try:
+            partial = self.llm_service.generate_json(self._build_window_prompt(window))
+            return partial if isinstance(partial, dict) else {}
+        except Exception as e:
+            print(f"⚠️ Window summary failed: {e}")
+            return {}
+
+    def _build_summary_prompt(self, transcript: str, tasks: Optional[List[Dict[str, Any]]]) -> str:
+        tasks_section = f"\nTasks:\n{format_tasks_for_prompt(tasks)}\n" if tasks is not None else ""
         return f"""
 You are an executive meeting assistant.
 
 Transcript:
 {transcript}
-
-Tasks:
-{tasks}
-
+{tasks_section}
 Generate a meeting summary in JSON with:
 - title
 - overview (2–3 sentences)
@@ -45,6 +99,96 @@ Generate a meeting summary in JSON with:
 Return ONLY valid JSON.
 """
 
+    def _build_window_prompt(self, window: str) -> str:
+        return f"""
+You are an executive meeting assistant summarizing ONE PART of a longer meeting.
+
+Transcript excerpt:
+{window}
+
+Generate a partial summary in JSON with:
+- overview (1–2 sentences)
+- key_points (list)
+- decisions (list, empty if none)
+- action_items (list, empty if none)
+
+Return ONLY valid JSON.
+"""
+
+    def _build_reduce_prompt(self, partials: List[Dict[str, Any]], tasks: Optional[List[Dict[str, Any]]]) -> str:
+        parts = []
+        for i, partial in enumerate(partials, 1):
+            lines = [f"Part {i}: {partial.get('overview', '')}"]
+            for field in ("key_points", "decisions", "action_items"):
+                items = partial.get(field) or []
+                if items:
+                    lines.append(f"  {field}: " + "; ".join(str(x) for x in items))
+            parts.append("\n".join(lines))
+        
+        tasks_section = f"\nTasks:\n{format_tasks_for_prompt(tasks)}\n" if tasks is not None else ""
+        partials_text = "\n\n".join(parts)
+        return f"""
+You are an executive meeting assistant.
+
+The meeting was long, so it was summarized in consecutive parts:
+
+{partials_text}
+{tasks_section}
+Combine the parts into ONE meeting summary in JSON with:
+- title
+- overview (2–3 sentences)
+- key_points (list, merged and de-duplicated)
+- decisions (list, empty if none)
+- action_items (list)
+- next_steps (string)
+
+Return ONLY valid JSON.
+"""
+
+
+def format_tasks_for_prompt(tasks: Optional[List[Dict[str, Any]]]) -> str:
+    """Render tasks as compact bullet lines for prompts."""
+    if not tasks:
+        return "(none)"
+    lines = []
+    for t in tasks:
+        if hasattr(t, "model_dump"):
+            # Graph state holds pydantic Task models (owner stored under its "owner" alias)
+            t = t.model_dump(by_alias=True)
+        title = t.get("title") or t.get("task") or "Untitled"
+        details = [f"owner: {t['owner']}" if t.get("owner") else None,
+                   f"due: {t['deadline']}" if t.get("deadline") else None]
+        details = [d for d in details if d]
+        lines.append(f"- {title}" + (f" ({', '.join(details)})" if details else ""))
+    return "\n".join(lines)
+
+
+def merge_tasks_into_summary(summary: Dict[str, Any], tasks: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Use the planner's tasks as the summary's action items.
+    
+    Used when the summary was generated from the transcript alone, so the
+    action items stay consistent with the tasks that are actually saved.
+    """
+    if not isinstance(summary, dict) or not tasks:
+        return summary
+    
+    action_items = []
+    for t in tasks:
+        if hasattr(t, "model_dump"):
+            # Graph state holds pydantic Task models (owner stored under its "owner" alias)
+            t = t.model_dump(by_alias=True)
+        title = t.get("title") or t.get("task")
+        if not title:
+            continue
+        owner = t.get("owner")
+        action_items.append(f"{title} ({owner})" if owner and owner != "Unassigned" else title)
+    
+    if action_items:
+        summary["action_items"] = action_items
+    return summary
+
+
 def generate_meeting_summary(transcript: str, tasks: List[Dict[str, Any]]) -> Dict[str, Any]:
     """
     Helper function for backward compatibility.
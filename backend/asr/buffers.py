@@ -0,0 +1,43 @@
+"""
+In-Memory Audio Buffers
+
+Helpers for handing captured audio to ASR backends without a temp file:
+local Whisper models take 16kHz mono float32 arrays directly, and cloud
+APIs get a WAV built in a BytesIO.
+"""
+import io
+import wave
+from typing import Union
+
+import numpy as np
+
+SAMPLE_RATE = 16000
+
+AudioInput = Union[str, np.ndarray]
+
+
+def to_float32(audio: np.ndarray) -> np.ndarray:
+    """
+    Contiguous mono float32 view of `audio`.
+
+    Arrays that are already float32 and contiguous are returned as-is (no
+    copy); int16 PCM is scaled to [-1, 1).
+    """
+    if audio.dtype == np.int16:
+        return audio.astype(np.float32) / 32768.0
+    audio = np.ascontiguousarray(audio, dtype=np.float32)
+    return audio if audio.ndim == 1 else audio.reshape(-1)
+
+
+def wav_bytes(audio: np.ndarray, rate: int = SAMPLE_RATE) -> io.BytesIO:
+    """16-bit mono WAV of a float32 array, in memory and rewound for reading."""
+    pcm = (np.clip(audio, -1.0, 1.0) * 32767).astype(np.int16)
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as wf:
+        wf.setnchannels(1)
+        wf.setsampwidth(2)
+        wf.setframerate(rate)
+        wf.writeframes(pcm.data)
+    buffer.seek(0)
+    return buffer
+
@@ -0,0 +1,212 @@
+"""
+ASR Model Registry
+
+Process-wide cache of speech-to-text models. Models are loaded on first use
+(nothing is loaded at import time), shared by every caller asking for the
+same (backend, model, device, compute_type), optionally pre-warmed in a
+background thread at startup, and unloaded after sitting idle for
+ASR_IDLE_TIMEOUT seconds.
+
+Backends:
+    "openai-whisper"   whisper.load_model(name, device)
+    "faster-whisper"   faster_whisper.WhisperModel(name, device, compute_type)
+"""
+import os
+import time
+import threading
+import importlib.util
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+OPENAI_WHISPER = "openai-whisper"
+FASTER_WHISPER = "faster-whisper"
+
+ASR_DEVICE = os.getenv("ASR_DEVICE", "cpu")
+ASR_COMPUTE_TYPE = os.getenv("ASR_COMPUTE_TYPE", "int8")
+WHISPER_MODEL = os.getenv("WHISPER_MODEL", "base")
+FASTER_WHISPER_MODEL = os.getenv("FASTER_WHISPER_MODEL", "small")
+ASR_IDLE_TIMEOUT = float(os.getenv("ASR_IDLE_TIMEOUT", "900"))  # 0 keeps models loaded
+ASR_PREWARM = os.getenv("ASR_PREWARM", f"{OPENAI_WHISPER}:{WHISPER_MODEL}")
+
+ModelKey = Tuple[str, str, str, str]
+
+_MODULES = {OPENAI_WHISPER: "whisper", FASTER_WHISPER: "faster_whisper"}
+
+
+def backend_available(backend: str) -> bool:
+    """True if the backend's package is installed (checked without importing it)."""
+    return importlib.util.find_spec(_MODULES[backend]) is not None
+
+
+def _load(key: ModelKey) -> Any:
+    backend, name, device, compute_type = key
+    if backend == OPENAI_WHISPER:
+        import whisper
+        return whisper.load_model(name, device=device)
+    if backend == FASTER_WHISPER:
+        from faster_whisper import WhisperModel
+        return WhisperModel(name, device=device, compute_type=compute_type)
+    raise ValueError(f"Unknown ASR backend: {backend}")
+
+
+class _Entry:
+    def __init__(self):
+        self.lock = threading.Lock()  # Serializes the load so concurrent first users share it
+        self.model: Any = None
+        self.in_use = 0
+        self.last_used = 0.0
+
+
+class ModelRegistry:
+    """Lazily loaded, shared ASR models with idle unloading."""
+
+    def __init__(self, idle_timeout: float = ASR_IDLE_TIMEOUT, loader=_load):
+        """
+        Args:
+            idle_timeout: Seconds a model may sit unused before it is unloaded (0 = never)
+            loader: Builds a model from its key (injectable for tests)
+        """
+        self.idle_timeout = idle_timeout
+        self.loader = loader
+        self.loads = 0
+        self.unloads = 0
+        self._entries: Dict[ModelKey, _Entry] = {}
+        self._lock = threading.Lock()
+        self._reaper: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+
+    @staticmethod
+    def key(backend: str, name: str, device: str = ASR_DEVICE, compute_type: str = ASR_COMPUTE_TYPE) -> ModelKey:
+        # openai-whisper has no compute_type; normalize so equal models share one key
+        return (backend, name, device, compute_type if backend == FASTER_WHISPER else "default")
+
+    def _entry(self, key: ModelKey) -> _Entry:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                entry = self._entries[key] = _Entry()
+            return entry
+
+    def _acquire(self, key: ModelKey) -> Tuple[_Entry, Any]:
+        entry = self._entry(key)
+        with entry.lock:
+            if entry.model is None:
+                start = time.perf_counter()
+                print(f"🔄 Loading ASR model {key[0]}:{key[1]} ({key[2]}, {key[3]})...")
+                entry.model = self.loader(key)
+                with self._lock:
+                    self.loads += 1
+                print(f"✅ ASR model {key[0]}:{key[1]} ready in {time.perf_counter() - start:.1f}s")
+            entry.in_use += 1
+            entry.last_used = time.monotonic()
+            model = entry.model
+        self._ensure_reaper()
+        return entry, model
+
+    def _release(self, entry: _Entry) -> None:
+        with entry.lock:
+            entry.in_use -= 1
+            entry.last_used = time.monotonic()
+
+    @contextmanager
+    def use(self, backend: str, name: str, device: str = ASR_DEVICE,
+            compute_type: str = ASR_COMPUTE_TYPE) -> Iterator[Any]:
+        """Borrow a model; it is never unloaded while borrowed."""
+        entry, model = self._acquire(self.key(backend, name, device, compute_type))
+        try:
+            yield model
+        finally:
+            self._release(entry)
+
+    def get(self, backend: str, name: str, device: str = ASR_DEVICE, compute_type: str = ASR_COMPUTE_TYPE) -> Any:
+        """Load (if needed) and return a model without borrowing it."""
+        with self.use(backend, name, device, compute_type) as model:
+            return model
+
+    def unload_idle(self, now: Optional[float] = None) -> List[ModelKey]:
+        """Drop models unused for idle_timeout seconds. Returns the unloaded keys."""
+        if self.idle_timeout <= 0:
+            return []
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            entries = list(self._entries.items())
+        unloaded = []
+        for key, entry in entries:
+            with entry.lock:
+                if entry.model is not None and not entry.in_use and now - entry.last_used >= self.idle_timeout:
+                    entry.model = None
+                    unloaded.append(key)
+        if unloaded:
+            with self._lock:
+                self.unloads += len(unloaded)
+            for key in unloaded:
+                print(f"💤 Unloaded idle ASR model {key[0]}:{key[1]}")
+        return unloaded
+
+    def _ensure_reaper(self) -> None:
+        if self.idle_timeout <= 0:
+            return
+        with self._lock:
+            if self._reaper is None or not self._reaper.is_alive():
+                self._reaper = threading.Thread(target=self._reap, name="asr-model-reaper", daemon=True)
+                self._reaper.start()
+
+    def _reap(self) -> None:
+        interval = max(1.0, min(60.0, self.idle_timeout / 4))
+        while not self._stop.wait(interval):
+            self.unload_idle()
+
+    def prewarm(self, specs: List[Tuple[str, str]]) -> threading.Thread:
+        """Load (backend, name) models in a background thread; failures are logged, not raised."""
+        def run():
+            for backend, name in specs:
+                if not backend_available(backend):
+                    print(f"⚠️ Skipping ASR prewarm for {backend}:{name} (package not installed)")
+                    continue
+                try:
+                    self.get(backend, name)
+                except Exception as e:
+                    print(f"⚠️ ASR prewarm failed for {backend}:{name}: {e}")
+
+        thread = threading.Thread(target=run, name="asr-prewarm", daemon=True)
+        thread.start()
+        return thread
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            loaded = [f"{k[0]}:{k[1]}" for k, e in self._entries.items() if e.model is not None]
+            return {"loaded": loaded, "loads": self.loads, "unloads": self.unloads}
+
+    def close(self) -> None:
+        self._stop.set()
+
+
+_registry: Optional[ModelRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_model_registry() -> ModelRegistry:
+    """Process-wide ASR model registry."""
+    global _registry
+    with _registry_lock:
+        if _registry is None:
+            _registry = ModelRegistry()
+        return _registry
+
+
+def parse_prewarm(spec: str) -> List[Tuple[str, str]]:
+    """"openai-whisper:base,faster-whisper:small" -> [(backend, name), ...]"""
+    models = []
+    for item in (spec or "").split(","):
+        backend, _, name = item.strip().partition(":")
+        if backend in _MODULES and name:
+            models.append((backend, name))
+    return models
+
+
+def prewarm_models(spec: str = ASR_PREWARM) -> Optional[threading.Thread]:
+    """Start loading the ASR_PREWARM models in the background (called on app startup)."""
+    models = parse_prewarm(spec)
+    if not models:
+        return None
+    return get_model_registry().prewarm(models)
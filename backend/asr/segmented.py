@@ -0,0 +1,278 @@
+"""
+Segmented Transcription
+
+Splits a long recording at silences found by an energy VAD into segments of
+ASR_SEGMENT_MIN..ASR_SEGMENT_MAX seconds, transcribes them in parallel on the
+ASR worker pool, and stitches the results back in order with absolute
+timestamps. Files are decoded as a stream and segments are submitted while
+ffmpeg is still decoding. Where no silence is found a segment is cut hard with
+ASR_SEGMENT_OVERLAP seconds of overlap; words transcribed twice in the
+overlap are dropped when stitching.
+"""
+import os
+import re
+import threading
+from concurrent.futures import FIRST_COMPLETED, wait
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .buffers import AudioInput, SAMPLE_RATE, to_float32
+from .model_registry import OPENAI_WHISPER, WHISPER_MODEL, get_model_registry
+from .worker_pool import PRIORITY_NORMAL, ASRWorkerPool, get_asr_pool, transcribe_with_model
+
+try:
+    from ..audio.extract import probe_duration, stream_audio
+except ImportError:
+    # Imported as top-level `asr` (scripts that put backend/ on sys.path)
+    from audio.extract import probe_duration, stream_audio
+
+ASR_SEGMENTED = os.getenv("ASR_SEGMENTED", "auto").lower()  # auto: only when the worker pool is running
+ASR_SEGMENT_MIN = float(os.getenv("ASR_SEGMENT_MIN", "30"))
+ASR_SEGMENT_MAX = float(os.getenv("ASR_SEGMENT_MAX", "60"))
+ASR_SEGMENT_OVERLAP = float(os.getenv("ASR_SEGMENT_OVERLAP", "1.0"))
+VAD_FRAME_MS = 30
+VAD_MIN_SILENCE = 0.3   # Seconds of quiet that count as a boundary
+VAD_FLOOR = 0.003       # Same RMS silence threshold as live capture
+
+Segment = Tuple[float, float, str]
+_WORD_RE = re.compile(r"[\w']+")
+
+
+def speech_frames(audio: np.ndarray, rate: int = SAMPLE_RATE, frame_ms: int = VAD_FRAME_MS) -> np.ndarray:
+    """
+    Per-frame speech mask from RMS energy. The threshold adapts to the
+    recording: 3x its noise floor (10th-percentile frame energy), capped at
+    a fifth of its loud frames (90th percentile) so recordings that are
+    almost all speech still get boundaries.
+    """
+    frame = rate * frame_ms // 1000
+    count = len(audio) // frame
+    if not count:
+        return np.zeros(0, dtype=bool)
+    frames = audio[:count * frame].reshape(count, frame)
+    rms = np.sqrt(np.einsum("ij,ij->i", frames, frames) / frame)
+    noise, loud = np.percentile(rms, [10, 90])
+    threshold = max(VAD_FLOOR, min(3.0 * float(noise), 0.2 * float(loud)))
+    return rms > threshold
+
+
+def silence_runs(speech: np.ndarray, min_frames: int) -> List[Tuple[int, int]]:
+    """(start, end) frame ranges of at least `min_frames` consecutive non-speech frames."""
+    padded = np.concatenate(([True], speech, [True])).astype(np.int8)
+    edges = np.diff(padded)
+    starts = np.flatnonzero(edges == -1)
+    ends = np.flatnonzero(edges == 1)
+    return [(s, e) for s, e in zip(starts, ends) if e - s >= min_frames]
+
+
+def next_cut(audio: np.ndarray, rate: int = SAMPLE_RATE, min_seconds: float = ASR_SEGMENT_MIN,
+             max_seconds: float = ASR_SEGMENT_MAX, overlap_seconds: float = ASR_SEGMENT_OVERLAP) -> Tuple[int, int]:
+    """
+    (end, next_start) of the first segment of `audio`, which must be longer
+    than max_seconds. The cut falls in the middle of the longest silence
+    between min_seconds and max_seconds; without one, it is at max_seconds
+    and the next segment starts overlap_seconds earlier.
+    """
+    frame = rate * VAD_FRAME_MS // 1000
+    min_len, max_len = int(min_seconds * rate), int(max_seconds * rate)
+    runs = silence_runs(speech_frames(audio[:max_len], rate), max(1, int(VAD_MIN_SILENCE * rate / frame)))
+    best, best_length = None, 0
+    for run_start, run_end in runs:
+        # Clip the silence to the window; the cut goes in the middle of what is left
+        lo, hi = max(run_start * frame, min_len), min(run_end * frame, max_len)
+        if hi - lo > best_length:
+            best, best_length = (lo + hi) // 2, hi - lo
+    if best is not None:
+        return best, best
+    return max_len, max_len - int(overlap_seconds * rate)
+
+
+def plan_segments(audio: np.ndarray, rate: int = SAMPLE_RATE, min_seconds: float = ASR_SEGMENT_MIN,
+                  max_seconds: float = ASR_SEGMENT_MAX,
+                  overlap_seconds: float = ASR_SEGMENT_OVERLAP) -> List[Tuple[int, int]]:
+    """(start, end) sample ranges covering the audio, cut with next_cut()."""
+    segments, start = [], 0
+    while len(audio) - start > int(max_seconds * rate):
+        end, next_start = next_cut(audio[start:], rate, min_seconds, max_seconds, overlap_seconds)
+        segments.append((start, start + end))
+        start += next_start
+    segments.append((start, len(audio)))
+    return segments
+
+
+def _words(text: str) -> List[str]:
+    return [w.lower() for w in _WORD_RE.findall(text)]
+
+
+def drop_repeated_words(previous: str, text: str, max_words: int = 12) -> str:
+    """Strip the longest run of leading words in `text` that repeats the tail of `previous`."""
+    tail, head = _words(previous)[-max_words:], _words(text)[:max_words]
+    for k in range(min(len(tail), len(head)), 0, -1):
+        if tail[-k:] == head[:k]:
+            tokens = text.split()
+            # Word tokens and whitespace tokens line up except for punctuation-only tokens
+            dropped, kept = 0, 0
+            while kept < len(tokens) and dropped < k:
+                dropped += len(_WORD_RE.findall(tokens[kept]))
+                kept += 1
+            return " ".join(tokens[kept:])
+    return text
+
+
+def stitch(pieces: Sequence[Tuple[int, int, List[Segment]]], rate: int = SAMPLE_RATE) -> List[Segment]:
+    """
+    Merge per-segment results, given as (start_sample, end_sample, segments
+    relative to start_sample), into one ordered list in absolute seconds.
+    In an overlap, each side keeps the segments whose midpoint falls on its
+    half; words repeated across the cut are dropped.
+    """
+    merged: List[Segment] = []
+    for i, (start, end, segments) in enumerate(pieces):
+        lower = 0.0
+        if i and start < pieces[i - 1][1]:
+            lower = (start + pieces[i - 1][1]) / 2 / rate
+        upper = float("inf")
+        if i + 1 < len(pieces) and pieces[i + 1][0] < end:
+            upper = (pieces[i + 1][0] + end) / 2 / rate
+
+        overlapped = bool(lower)
+        for seg_start, seg_end, text in segments:
+            seg_start, seg_end = seg_start + start / rate, seg_end + start / rate
+            middle = (seg_start + seg_end) / 2
+            if not (lower <= middle < upper) or not text:
+                continue
+            if overlapped and merged:
+                text = drop_repeated_words(merged[-1][2], text)
+                overlapped = False
+                if not text:
+                    continue
+            merged.append((round(seg_start, 2), round(seg_end, 2), text))
+    return merged
+
+
+def segmented_enabled(pool: Optional[ASRWorkerPool]) -> bool:
+    if ASR_SEGMENTED in ("1", "true", "yes"):
+        return True
+    if ASR_SEGMENTED in ("0", "false", "no"):
+        return False
+    return pool is not None
+
+
+def transcribe_stream(blocks: Iterable[np.ndarray], pool: Optional[ASRWorkerPool] = None,
+                      on_progress: Optional[Callable[[float], None]] = None,
+                      priority: int = PRIORITY_NORMAL, backend: str = OPENAI_WHISPER,
+                      model_name: str = WHISPER_MODEL, total_seconds: Optional[float] = None) -> Dict[str, Any]:
+    """
+    Transcribe 16kHz mono float32 blocks as they arrive (e.g. from
+    audio.extract.stream_audio). Each VAD-bounded segment is sent to the
+    pool as soon as enough audio is buffered, so transcription overlaps
+    decoding; at most two segments per worker are in flight, which also
+    bounds how far decoding runs ahead.
+
+    Args:
+        blocks: Consecutive sample blocks of any size
+        pool: Worker pool (defaults to the shared one; without a pool each
+            segment runs on the in-process model as soon as it is cut)
+        on_progress: Called with the fraction (0..1) of the recording
+            transcribed; it never decreases and reaches 1.0 only at the end
+        priority: Pool priority for every segment of this recording
+        backend, model_name: In-process model when there is no pool
+        total_seconds: Length of the recording if known up front (otherwise
+            progress is measured against the audio decoded so far)
+
+    Returns:
+        {"text": str, "segments": [{"start", "end", "text"}], "pieces": int}
+    """
+    pool = pool if pool is not None else get_asr_pool()
+    max_len = int(ASR_SEGMENT_MAX * SAMPLE_RATE)
+    pieces: List[Tuple[int, int]] = []
+    done: List[float] = []
+    results: Dict[int, List[Segment]] = {}
+    in_flight: Dict[Any, int] = {}
+    total = int((total_seconds or 0) * SAMPLE_RATE)
+    decoded, reported = 0, 0.0
+    # Segment progress arrives on the pool's collector thread while this thread appends pieces
+    lock = threading.Lock()
+
+    def report(index: int, fraction: float) -> None:
+        nonlocal reported
+        with lock:
+            done[index] = fraction
+            length = max(total, decoded)
+            if not on_progress or not length:
+                return
+            transcribed = sum(f * (end - start) for f, (start, end) in zip(done, pieces))
+            # Hold back 1.0 until every segment is in; overlaps can push the sum past the length
+            value = min(transcribed / length, 0.99)
+            if value > reported:
+                reported = value
+                on_progress(value)
+
+    def collect(block: bool) -> None:
+        finished, _ = wait(list(in_flight), timeout=None if block else 0, return_when=FIRST_COMPLETED)
+        for future in finished:
+            i = in_flight.pop(future)
+            results[i] = future.result()
+            report(i, 1.0)
+
+    def run(start: int, samples: np.ndarray) -> None:
+        with lock:
+            i = len(pieces)
+            pieces.append((start, start + len(samples)))
+            done.append(0.0)
+        if pool is None:
+            with get_model_registry().use(backend, model_name) as model:
+                results[i] = transcribe_with_model(model, backend, samples, lambda f: report(i, f), timestamps=True)
+            report(i, 1.0)
+            return
+        # Keep a bounded window in flight so one long recording cannot fill the shared queue
+        while len(in_flight) >= pool.workers * 2:
+            collect(block=True)
+        job = pool.submit(samples, priority=priority, timestamps=True,
+                          on_progress=lambda f: report(i, f), timeout=None)
+        in_flight[job.future] = i
+        collect(block=False)
+
+    buffer, buffer_start = np.zeros(0, dtype=np.float32), 0
+    for block in blocks:
+        block = to_float32(block)
+        with lock:
+            decoded += len(block)
+        buffer = np.concatenate((buffer, block)) if len(buffer) else block
+        while len(buffer) > max_len:
+            end, next_start = next_cut(buffer)
+            run(buffer_start, buffer[:end])
+            buffer, buffer_start = buffer[next_start:], buffer_start + next_start
+    if len(buffer):
+        run(buffer_start, buffer)
+    while in_flight:
+        collect(block=True)
+    if on_progress:
+        on_progress(1.0)
+
+    segments = stitch([(start, end, results[i]) for i, (start, end) in enumerate(pieces)])
+    print(f"🎧 Transcribed {decoded / SAMPLE_RATE:.0f}s of audio in {len(pieces)} segments")
+    return {
+        "text": " ".join(text for _, _, text in segments).strip(),
+        "segments": [{"start": s, "end": e, "text": t} for s, e, t in segments],
+        "pieces": len(pieces),
+    }
+
+
+def transcribe_segmented(audio: AudioInput, pool: Optional[ASRWorkerPool] = None,
+                         on_progress: Optional[Callable[[float], None]] = None,
+                         priority: int = PRIORITY_NORMAL, backend: str = OPENAI_WHISPER,
+                         model_name: str = WHISPER_MODEL) -> Dict[str, Any]:
+    """
+    Transcribe a recording as parallel VAD-bounded segments.
+
+    `audio` is a file path, streamed through ffmpeg without an intermediate
+    WAV (its length comes from ffprobe, for progress), or 16kHz mono
+    samples. See transcribe_stream() for the rest.
+    """
+    if isinstance(audio, str):
+        blocks, total_seconds = stream_audio(audio, window_seconds=ASR_SEGMENT_MAX), probe_duration(audio)
+    else:
+        blocks, total_seconds = [audio], len(audio) / SAMPLE_RATE
+    return transcribe_stream(blocks, pool, on_progress, priority, backend, model_name, total_seconds)
@@ -1,23 +1,42 @@
 """
 Whisper Transcription Module
 
-Uses OpenAI Whisper for audio-to-text transcription.
+Uses OpenAI Whisper for audio-to-text transcription. The model is loaded on
+first use through the shared ASR model registry, not at import time.
 """
-import whisper
+from typing import Optional
 
-# Load model once at module load
-model = whisper.load_model("base")
+import numpy as np
 
+from .buffers import AudioInput, to_float32
+from .model_registry import OPENAI_WHISPER, WHISPER_MODEL, get_model_registry
 
-def transcribe_audio(audio_path: str) -> str:
+
+def transcribe_audio(audio: AudioInput, segmented: Optional[bool] = None) -> str:
     """
-    Transcribe audio file to text using Whisper.
-    
+    Transcribe audio to text using Whisper.
+
     Args:
-        audio_path: Path to audio file (WAV preferred)
-        
+        audio: Path to audio file (WAV preferred), or 16kHz mono samples
+            as a float32/int16 array (transcribed in memory, no temp file)
+        segmented: Split at silences and transcribe segments in parallel on
+            the ASR worker pool (None follows ASR_SEGMENTED; "auto" only
+            segments when the app has already started the pool)
+
     Returns:
         Transcribed text
     """
-    result = model.transcribe(audio_path)
+    from .segmented import segmented_enabled, transcribe_segmented
+    from .worker_pool import running_asr_pool
+
+    if segmented is None:
+        # Only look at the pool: scripts and tests must not spawn workers as a side effect
+        segmented = segmented_enabled(running_asr_pool())
+    if segmented:
+        return transcribe_segmented(audio, running_asr_pool())["text"]
+
+    if isinstance(audio, np.ndarray):
+        audio = to_float32(audio)
+    with get_model_registry().use(OPENAI_WHISPER, WHISPER_MODEL) as model:
+        result = model.transcribe(audio)
     return result["text"].strip()
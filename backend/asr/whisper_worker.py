@@ -1,20 +1,28 @@
 # faster-whisper + VAD
-from faster_whisper import WhisperModel
+from .buffers import AudioInput, to_float32
+from .model_registry import FASTER_WHISPER, FASTER_WHISPER_MODEL, get_model_registry
 
-model = WhisperModel(
-    "small",
-    device="cpu",
-    compute_type="int8"   # fastest on CPU
-)
+# Model comes from the shared registry: "small", int8 on CPU by default (fastest on CPU)
 
-def transcribe_file(path: str) -> str:
-    segments, _ = model.transcribe(
-        path,
-        vad_filter=False,      # IMPORTANT
-        vad_parameters=dict(
-            min_silence_duration_ms=500
+def _transcribe(source: AudioInput, vad_filter: bool = False) -> str:
+    with get_model_registry().use(FASTER_WHISPER, FASTER_WHISPER_MODEL) as model:
+        segments, _ = model.transcribe(
+            source,
+            vad_filter=vad_filter,      # IMPORTANT
+            vad_parameters=dict(
+                min_silence_duration_ms=500
+            )
         )
-    )
 
-    text = " ".join(seg.text.strip() for seg in segments)
+        # Segments are decoded lazily, so consume them while the model is borrowed
+        text = " ".join(seg.text.strip() for seg in segments)
     return text
+
+
+def transcribe_file(path: str) -> str:
+    return _transcribe(path)
+
+
+def transcribe_array(audio, vad_filter: bool = False) -> str:
+    """Transcribe 16kHz mono samples held in memory (no WAV round trip)."""
+    return _transcribe(to_float32(audio), vad_filter=vad_filter)
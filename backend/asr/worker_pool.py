@@ -0,0 +1,429 @@
+"""
+ASR Worker Pool
+
+Transcribes files in N worker processes, each holding its own loaded model,
+so concurrent uploads use separate cores instead of serializing on one model
+and the GIL. Jobs wait in a bounded priority queue (submit blocks, then
+fails with ASRPoolBusy, when it is full) and are handed to a process only
+once it has loaded its model and is idle, so a high-priority job never waits
+behind a backlog already sent to the workers. Each job reports progress
+(0..1) while it runs.
+
+Every worker talks to the pool over its own pair of pipes, so the pool knows
+which process holds each job and a crashed process cannot wedge a queue the
+others share: a worker that dies mid-job fails that job and is replaced, and
+if the model cannot be loaded queued jobs fail at once instead of timing out.
+"""
+import os
+import time
+import uuid
+import queue
+import itertools
+import threading
+import multiprocessing as mp
+from concurrent.futures import Future
+from multiprocessing.connection import Connection, wait
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+from .model_registry import (
+    FASTER_WHISPER, OPENAI_WHISPER, WHISPER_MODEL, ModelRegistry, backend_available, _load
+)
+
+PRIORITY_HIGH = 0
+PRIORITY_NORMAL = 5
+PRIORITY_LOW = 10
+
+ASR_QUEUED = "queued"
+ASR_RUNNING = "running"
+ASR_COMPLETED = "completed"
+ASR_FAILED = "failed"
+
+
+def _worker_count(value: str) -> int:
+    """"auto" -> one process per CPU core."""
+    if value.strip().lower() == "auto":
+        return os.cpu_count() or 1
+    return max(0, int(value))
+
+
+ASR_WORKERS = _worker_count(os.getenv("ASR_WORKERS", "2"))  # 0 transcribes inline in the caller
+ASR_POOL_BACKEND = os.getenv("ASR_POOL_BACKEND", OPENAI_WHISPER)
+ASR_POOL_MODEL = os.getenv("ASR_POOL_MODEL", WHISPER_MODEL)
+ASR_MAX_PENDING = int(os.getenv("ASR_MAX_PENDING", "32"))
+ASR_SUBMIT_TIMEOUT = float(os.getenv("ASR_SUBMIT_TIMEOUT", "10"))
+ASR_JOB_TIMEOUT = float(os.getenv("ASR_JOB_TIMEOUT", "3600"))
+
+
+class ASRPoolBusy(Exception):
+    """The pending queue stayed full for the whole submit timeout."""
+
+
+class ASRJob:
+    """Handle for a submitted transcription: status, progress and the eventual text."""
+
+    def __init__(self, source: Any, priority: int, on_progress: Optional[Callable[[float], None]] = None,
+                 timestamps: bool = False):
+        self.id = uuid.uuid4().hex
+        self.source = source
+        self.priority = priority
+        self.timestamps = timestamps
+        self.status = ASR_QUEUED
+        self.progress = 0.0
+        self.pid: Optional[int] = None
+        self.submitted_at = time.time()
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self.on_progress = on_progress
+        self.future: Future = Future()
+
+    def result(self, timeout: Optional[float] = ASR_JOB_TIMEOUT) -> Any:
+        """Transcript text (or segments); re-raises the worker's error as RuntimeError."""
+        return self.future.result(timeout=timeout)
+
+    def _report(self, progress: float) -> None:
+        self.progress = max(self.progress, min(1.0, progress))
+        if self.on_progress:
+            try:
+                self.on_progress(self.progress)
+            except Exception as e:
+                print(f"⚠️ ASR progress callback failed: {e}")
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {"id": self.id, "status": self.status, "progress": round(self.progress, 3),
+                "priority": self.priority, "pid": self.pid}
+
+
+def transcribe_with_model(model: Any, backend: str, source: Any, report: Callable[[float], None],
+                          timestamps: bool = False) -> Union[str, List[Tuple[float, float, str]]]:
+    """
+    Run one transcription on an already loaded model, reporting progress.
+
+    Returns the text, or (start, end, text) segments when `timestamps` is set.
+    """
+    if backend == FASTER_WHISPER:
+        raw, info = model.transcribe(source)
+        duration = getattr(info, "duration", 0) or 0
+        segments = []
+        for segment in raw:
+            segments.append((segment.start, segment.end, segment.text.strip()))
+            if duration:
+                report(segment.end / duration)
+    else:
+        # openai-whisper has no per-segment callback: progress jumps from 0 to 1
+        result = model.transcribe(source)
+        if not timestamps:
+            return result["text"].strip()
+        segments = [(s["start"], s["end"], s["text"].strip()) for s in result.get("segments", [])]
+    if timestamps:
+        return segments
+    return " ".join(text for _, _, text in segments).strip()
+
+
+def _worker_main(backend: str, model_name: str, loader: Callable, threads: int,
+                 tasks: Connection, events: Connection) -> None:
+    """Worker process: load the model once, then transcribe tasks until a None sentinel."""
+    # Split the cores between processes instead of every process using all of them
+    os.environ.setdefault("OMP_NUM_THREADS", str(threads))
+    pid = os.getpid()
+    try:
+        model = ModelRegistry(idle_timeout=0, loader=loader).get(backend, model_name)
+    except Exception as e:
+        events.send(("dead", pid, f"model load failed: {e}"))
+        return
+    events.send(("ready", pid, None))
+
+    while True:
+        task = tasks.recv()
+        if task is None:
+            break
+        job_id, source, timestamps = task
+        try:
+            result = transcribe_with_model(model, backend, source,
+                                           lambda progress: events.send(("progress", job_id, progress)), timestamps)
+            events.send(("done", job_id, result))
+        except Exception as e:
+            events.send(("error", job_id, str(e)))
+
+
+class ASRWorkerPool:
+    """Priority-queued transcription across worker processes."""
+
+    def __init__(self, workers: int = ASR_WORKERS, backend: str = ASR_POOL_BACKEND, model_name: str = ASR_POOL_MODEL,
+                 max_pending: int = ASR_MAX_PENDING, loader: Callable = _load):
+        """
+        Args:
+            workers: Number of processes (each loads its own model)
+            backend: Model backend ("openai-whisper" or "faster-whisper")
+            model_name: Model size/name for the backend
+            max_pending: Jobs that may wait for a free process before submit blocks
+            loader: Top-level (picklable) function building a model from its registry key
+        """
+        self.workers = max(1, workers)
+        self.backend = backend
+        self.model_name = model_name
+        self.loader = loader
+        self.completed = 0
+        self.failed = 0
+
+        self._ctx = mp.get_context("spawn")  # Safe with threads and CUDA in the parent
+        self._pending: "queue.PriorityQueue" = queue.PriorityQueue(maxsize=max_pending)
+        self._idle: "queue.Queue[int]" = queue.Queue()  # pids of loaded workers without a job
+        self._sequence = itertools.count()
+        self._jobs: Dict[str, ASRJob] = {}
+        self._processes: Dict[int, Tuple[Any, Connection, Connection]] = {}  # pid -> (process, tasks, events)
+        self._ready = 0
+        self._load_error: Optional[str] = None
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._threads: List[threading.Thread] = []
+
+    @property
+    def running(self) -> bool:
+        return any(t.is_alive() for t in self._threads)
+
+    def start(self) -> None:
+        """Spawn the worker processes (no-op if already running). Models load in the background."""
+        if self.running:
+            return
+        self._stop.clear()
+        for _ in range(self.workers):
+            self._spawn()
+        self._threads = [
+            threading.Thread(target=self._dispatch, name="asr-dispatch", daemon=True),
+            threading.Thread(target=self._collect, name="asr-collect", daemon=True),
+        ]
+        for t in self._threads:
+            t.start()
+        print(f"✅ ASR workers starting ({self.workers} processes, {self.backend}:{self.model_name})")
+
+    def _spawn(self) -> None:
+        threads = max(1, (os.cpu_count() or 1) // self.workers)
+        task_reader, tasks = self._ctx.Pipe(duplex=False)
+        events, event_writer = self._ctx.Pipe(duplex=False)
+        process = self._ctx.Process(
+            target=_worker_main,
+            args=(self.backend, self.model_name, self.loader, threads, task_reader, event_writer),
+            name="asr-worker",
+            daemon=True
+        )
+        process.start()
+        # The child has its own copies; closing ours lets a dead worker show up as EOF
+        task_reader.close()
+        event_writer.close()
+        with self._lock:
+            self._processes[process.pid] = (process, tasks, events)
+
+    def submit(self, source: Any, priority: int = PRIORITY_NORMAL,
+               on_progress: Optional[Callable[[float], None]] = None,
+               timeout: Optional[float] = ASR_SUBMIT_TIMEOUT, timestamps: bool = False) -> ASRJob:
+        """
+        Queue a file path (or 16kHz float32 samples) for transcription.
+
+        Blocks while the pending queue is full; raises ASRPoolBusy after `timeout` seconds.
+        Lower `priority` values run first; equal priorities run in submission order.
+        With `timestamps`, the job's result is a list of (start, end, text) segments.
+        """
+        self.start()
+        if self._load_error:
+            raise RuntimeError(f"ASR workers unavailable: {self._load_error}")
+        job = ASRJob(source, priority, on_progress, timestamps)
+        with self._lock:
+            self._jobs[job.id] = job
+        try:
+            self._pending.put((priority, next(self._sequence), job), timeout=timeout)
+        except queue.Full:
+            with self._lock:
+                self._jobs.pop(job.id, None)
+            raise ASRPoolBusy(f"ASR queue is full ({self._pending.maxsize} pending jobs)")
+        return job
+
+    def transcribe(self, source: str, priority: int = PRIORITY_NORMAL,
+                   on_progress: Optional[Callable[[float], None]] = None) -> str:
+        """Submit and wait for the transcript."""
+        return self.submit(source, priority, on_progress).result()
+
+    def _dispatch(self) -> None:
+        while not self._stop.is_set():
+            if self._load_error:
+                # No worker will ever report ready: fail what is queued instead of letting it time out
+                try:
+                    _, _, job = self._pending.get(timeout=0.5)
+                except queue.Empty:
+                    continue
+                self._finish(job, error=f"ASR workers unavailable: {self._load_error}")
+                continue
+            try:
+                pid = self._idle.get(timeout=0.5)
+            except queue.Empty:
+                continue
+            with self._lock:
+                worker = self._processes.get(pid)
+            if worker is None:
+                continue  # Died while idle
+            try:
+                _, _, job = self._pending.get(timeout=0.5)
+            except queue.Empty:
+                self._idle.put(pid)
+                continue
+            job.pid = pid
+            job.status = ASR_RUNNING
+            job.started_at = time.time()
+            try:
+                worker[1].send((job.id, job.source, job.timestamps))
+            except OSError:
+                pass  # Worker died; _reap_dead_workers() fails the job
+
+    def _collect(self) -> None:
+        while not self._stop.is_set():
+            with self._lock:
+                readers = [events for _, _, events in self._processes.values()]
+            if not readers:
+                self._stop.wait(0.5)
+                self._reap_dead_workers()
+                continue
+            ready = wait(readers, timeout=0.5)
+            exited = not ready
+            for events in ready:
+                try:
+                    kind, key, value = events.recv()
+                except (EOFError, OSError):
+                    exited = True
+                    continue
+                self._handle(kind, key, value)
+            if exited:
+                self._reap_dead_workers()
+
+    def _handle(self, kind: str, key: Any, value: Any) -> None:
+        if kind == "ready":
+            with self._lock:
+                self._ready += 1
+            self._idle.put(key)
+            return
+        if kind == "dead":
+            # A model that fails to load will fail again: stop respawning and fail queued jobs.
+            # Workers only get jobs once ready, so none is lost in the dead process.
+            print(f"❌ ASR worker {key} exited: {value}")
+            self._load_error = value
+            return
+
+        with self._lock:
+            job = self._jobs.get(key)
+        if job is None:
+            return
+        if kind == "progress":
+            job._report(value)
+        elif kind in ("done", "error"):
+            self._finish(job, text=value if kind == "done" else None,
+                         error=value if kind == "error" else None)
+
+    def _finish(self, job: ASRJob, text: Any = None, error: Optional[str] = None) -> None:
+        with self._lock:
+            if self._jobs.pop(job.id, None) is None:
+                return
+            if error is None:
+                self.completed += 1
+            else:
+                self.failed += 1
+            # Hand the worker back unless it died with the job
+            idle = job.pid is not None and job.pid in self._processes
+        job.finished_at = time.time()
+        if error is None:
+            job.status = ASR_COMPLETED
+            job._report(1.0)
+            job.future.set_result(text)
+        else:
+            job.status = ASR_FAILED
+            job.future.set_exception(RuntimeError(error))
+        if idle:
+            self._idle.put(job.pid)
+
+    def _reap_dead_workers(self) -> None:
+        with self._lock:
+            dead = [pid for pid, (process, _, _) in self._processes.items() if not process.is_alive()]
+            for pid in dead:
+                _, tasks, events = self._processes.pop(pid)
+                tasks.close()
+                events.close()
+            orphaned = [job for job in self._jobs.values() if job.pid in dead]
+        for job in orphaned:
+            self._finish(job, error=f"ASR worker {job.pid} died")
+        if dead and not self._stop.is_set() and not self._load_error:
+            print(f"⚠️ Replacing {len(dead)} dead ASR worker(s)")
+            for _ in dead:
+                self._spawn()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            jobs = [job.snapshot() for job in self._jobs.values()]
+            return {
+                "workers": self.workers,
+                "ready": self._ready,
+                "pending": self._pending.qsize(),
+                "running": sum(1 for job in jobs if job["status"] == ASR_RUNNING),
+                "completed": self.completed,
+                "failed": self.failed,
+                "jobs": jobs,
+            }
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Stop dispatching, let workers exit, and fail jobs that never ran."""
+        self._stop.set()
+        with self._lock:
+            processes = list(self._processes.values())
+            self._processes.clear()
+        for _, tasks, _ in processes:
+            try:
+                tasks.send(None)
+            except OSError:
+                pass
+        deadline = time.monotonic() + timeout
+        for process, _, _ in processes:
+            process.join(timeout=max(0.0, deadline - time.monotonic()))
+            if process.is_alive():
+                process.terminate()
+        for t in self._threads:
+            t.join(timeout=1.0)
+        self._threads = []
+        for _, tasks, events in processes:
+            tasks.close()
+            events.close()
+        with self._lock:
+            leftovers = list(self._jobs.values())
+        for job in leftovers:
+            self._finish(job, error="ASR pool stopped")
+
+
+_pool: Optional[ASRWorkerPool] = None
+_pool_lock = threading.Lock()
+
+
+def asr_pool_enabled() -> bool:
+    """True when file transcription should go through worker processes (ASR_WORKERS > 0)."""
+    return ASR_WORKERS > 0
+
+
+def get_asr_pool() -> Optional[ASRWorkerPool]:
+    """Process-wide ASR pool, or None when disabled or the model package is not installed."""
+    global _pool
+    if not asr_pool_enabled() or not backend_available(ASR_POOL_BACKEND):
+        return None
+    with _pool_lock:
+        if _pool is None:
+            _pool = ASRWorkerPool()
+        _pool.start()
+        return _pool
+
+
+def running_asr_pool() -> Optional[ASRWorkerPool]:
+    """The shared pool if it is already running; unlike get_asr_pool(), never creates or starts one."""
+    with _pool_lock:
+        return _pool if _pool is not None and _pool.running else None
+
+
+def stop_asr_pool(timeout: float = 5.0) -> None:
+    """Stop the worker processes (called on app shutdown)."""
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.stop(timeout)
+            _pool = None
@@ -1,38 +1,118 @@
 """
 Audio Extraction Module
 
-Extracts audio from video files using ffmpeg.
-Outputs 16kHz mono WAV for Whisper transcription.
+Decodes audio/video files with ffmpeg and streams 16kHz mono float32 windows
+straight from its stdout for transcription, without writing a WAV.
+pcm_windows() is the shared pipe reader, also used by the live capture in
+audio.ffmpeg_stream.
 """
 import subprocess
-from pathlib import Path
+from typing import BinaryIO, Iterator, Optional
 
+import numpy as np
 
-def extract_audio(input_file: str) -> str:
+SAMPLE_RATE = 16000
+
+
+class PCMRingBuffer:
+    """Fixed-capacity circular float32 sample buffer."""
+
+    def __init__(self, capacity: int):
+        self._data = np.zeros(capacity, dtype=np.float32)
+        self._start = 0
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def free(self) -> int:
+        return len(self._data) - self._size
+
+    def write_pcm(self, raw: bytes) -> None:
+        """Append s16le bytes, converting to float32 in place (no intermediate array)."""
+        pcm = np.frombuffer(raw, dtype=np.int16)
+        if len(pcm) > self.free:
+            raise ValueError(f"Ring buffer overflow ({len(pcm)} samples, {self.free} free)")
+        capacity = len(self._data)
+        end = (self._start + self._size) % capacity
+        first = min(len(pcm), capacity - end)
+        np.multiply(pcm[:first], 1 / 32768.0, out=self._data[end:end + first], casting="unsafe")
+        np.multiply(pcm[first:], 1 / 32768.0, out=self._data[:len(pcm) - first], casting="unsafe")
+        self._size += len(pcm)
+
+    def read(self, count: int) -> np.ndarray:
+        """Remove and return the oldest `count` samples as a new contiguous array."""
+        count = min(count, self._size)
+        capacity = len(self._data)
+        first = min(count, capacity - self._start)
+        out = np.empty(count, dtype=np.float32)
+        out[:first] = self._data[self._start:self._start + first]
+        out[first:] = self._data[:count - first]
+        self._start = (self._start + count) % capacity
+        self._size -= count
+        return out
+
+
+def probe_duration(input_file: str) -> Optional[float]:
+    """Duration of a media file in seconds from ffprobe, or None if it cannot be read."""
+    try:
+        out = subprocess.run(
+            ["ffprobe", "-v", "error", "-show_entries", "format=duration", "-of", "csv=p=0", str(input_file)],
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout
+        return float(out.strip()) or None
+    except (OSError, subprocess.CalledProcessError, ValueError):
+        return None
+
+
+def pcm_windows(pipe: BinaryIO, window: int, read_bytes: int) -> Iterator[np.ndarray]:
+    """
+    Read s16le bytes from `pipe` in `read_bytes` blocks into a ring buffer and
+    yield every full `window`-sample float32 window as soon as it is complete
+    (the last one may be shorter).
+    """
+    ring = PCMRingBuffer(window + read_bytes // 2)
+    while True:
+        raw = pipe.read(read_bytes)
+        if not raw:
+            break
+        ring.write_pcm(raw[:len(raw) - len(raw) % 2])
+        while len(ring) >= window:
+            yield ring.read(window)
+    if len(ring):
+        yield ring.read(len(ring))
+
+
+def stream_audio(input_file: str, window_seconds: float = 30.0, read_seconds: float = 1.0) -> Iterator[np.ndarray]:
     """
-    Extract audio from video file to 16kHz mono WAV.
-    
-    Args:
-        input_file: Path to video/audio file
-        
-    Returns:
-        Path to extracted WAV file
+    Decode any audio/video file to 16kHz mono float32 windows as ffmpeg produces them.
+
+    ffmpeg's s16le stdout is read in `read_seconds` blocks into a ring buffer
+    and every full `window_seconds` window is yielded immediately (the last
+    one may be shorter), so consumers start before decoding finishes and
+    memory stays bounded by the window size.
     """
-    input_path = Path(input_file)
-    output_path = input_path.with_suffix(".wav")
-
-    subprocess.run(
-        [
-            "ffmpeg",
-            "-y",
-            "-i", str(input_path),
-            "-ar", "16000",
-            "-ac", "1",
-            str(output_path),
-        ],
-        check=True,
-        stdout=subprocess.DEVNULL,
+    window = int(window_seconds * SAMPLE_RATE)
+    read_bytes = int(read_seconds * SAMPLE_RATE) * 2  # s16le = 2 bytes
+
+    proc = subprocess.Popen(
+        ["ffmpeg", "-nostdin", "-i", str(input_file), "-f", "s16le", "-ac", "1", "-ar", str(SAMPLE_RATE), "-"],
+        stdout=subprocess.PIPE,
         stderr=subprocess.DEVNULL,
     )
+    decoded = 0
+    try:
+        for samples in pcm_windows(proc.stdout, window, read_bytes):
+            decoded += len(samples)
+            yield samples
+    finally:
+        if proc.poll() is None:
+            proc.kill()
+        proc.stdout.close()
+        returncode = proc.wait()
 
-    return str(output_path)
+    if returncode and not decoded:
+        raise subprocess.CalledProcessError(returncode, "ffmpeg")
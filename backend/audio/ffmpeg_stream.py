@@ -1,6 +1,7 @@
 import subprocess
 import sys
-import numpy as np
+
+from .extract import pcm_windows
 
 FFMPEG_PATH = r"C:\Program Files\CapCut\Apps\3.7.0.1379\ffmpeg.exe"
 
@@ -25,10 +26,4 @@ def audio_stream(chunk_seconds=5):
         stderr=sys.stderr
     )
 
-    while True:
-        raw = proc.stdout.read(bytes_per_chunk)
-        if not raw:
-            break
-
-        audio = np.frombuffer(raw, dtype=np.int16).astype("float32") / 32768.0
-        yield audio
+    yield from pcm_windows(proc.stdout, samples_per_chunk, bytes_per_chunk)
@@ -14,8 +14,6 @@ import queue
 import time
 import sys
 import os
-import tempfile
-import wave
 
 # Add project root to path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
@@ -23,6 +21,10 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')
 from dotenv import load_dotenv
 load_dotenv()
 
+from asr.buffers import wav_bytes
+from asr.model_registry import FASTER_WHISPER, FASTER_WHISPER_MODEL, prewarm_models
+from asr.whisper_worker import transcribe_array
+
 # --- CONFIGURATION ---
 SEARCH_KEYWORD = "CABLE Output"
 CHUNK_SIZE = 1024
@@ -47,10 +49,10 @@ if USE_ASSEMBLYAI:
     aai.settings.api_key = os.getenv("ASSEMBLYAI_API_KEY")
     model = None  # Will use API
 else:
-    print("🔄 Loading local Whisper model...")
-    from faster_whisper import WhisperModel
-    model = WhisperModel("small", device="cpu", compute_type="int8")
-    
+    # Local Whisper is loaded from the shared registry in the background, not at import
+    print("🔄 Warming up local Whisper model...")
+    prewarm_models(f"{FASTER_WHISPER}:{FASTER_WHISPER_MODEL}")
+
 print("✅ Ready!")
 
 
@@ -66,73 +68,34 @@ def find_cable_device(p):
     return None
 
 
-def save_audio_to_wav(audio_np, filepath):
-    """Save numpy audio array to WAV file."""
-    with wave.open(filepath, 'wb') as wf:
-        wf.setnchannels(1)
-        wf.setsampwidth(2)  # 16-bit
-        wf.setframerate(TARGET_RATE)
-        audio_int16 = (audio_np * 32767).astype(np.int16)
-        wf.writeframes(audio_int16.tobytes())
-
-
 def transcribe_with_assemblyai(audio_np):
     """Transcribe with AssemblyAI (includes speaker diarization)."""
-    with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as f:
-        temp_path = f.name
+    config = aai.TranscriptionConfig(
+        speaker_labels=True,
+        language_code="en"
+    )
     
-    try:
-        save_audio_to_wav(audio_np, temp_path)
-        
-        config = aai.TranscriptionConfig(
-            speaker_labels=True,
-            language_code="en"
-        )
-        
-        transcriber = aai.Transcriber()
-        transcript = transcriber.transcribe(temp_path, config=config)
-        
-        if transcript.status == aai.TranscriptStatus.error:
-            return f"[Error: {transcript.error}]"
-        
-        # Format with speaker labels
-        lines = []
-        for utterance in transcript.utterances:
-            lines.append(f"Speaker {utterance.speaker}: {utterance.text}")
-        
-        return "\n".join(lines) if lines else transcript.text or ""
+    # Upload an in-memory WAV instead of writing a temp file
+    transcriber = aai.Transcriber()
+    transcript = transcriber.transcribe(wav_bytes(audio_np, TARGET_RATE), config=config)
     
-    finally:
-        try:
-            os.unlink(temp_path)
-        except:
-            pass
+    if transcript.status == aai.TranscriptStatus.error:
+        return f"[Error: {transcript.error}]"
+    
+    # Format with speaker labels
+    lines = []
+    for utterance in transcript.utterances or []:
+        lines.append(f"Speaker {utterance.speaker}: {utterance.text}")
+    
+    return "\n".join(lines) if lines else transcript.text or ""
 
 
 def transcribe_with_whisper(audio_np):
-    """Transcribe with local Whisper model."""
+    """Transcribe with local Whisper model (16kHz float32 samples, no temp file)."""
     if len(audio_np) < TARGET_RATE * MIN_AUDIO_LENGTH:
         return ""
     
-    with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as f:
-        temp_path = f.name
-    
-    try:
-        save_audio_to_wav(audio_np, temp_path)
-        
-        segments, _ = model.transcribe(
-            temp_path,
-            vad_filter=True,
-            vad_parameters=dict(min_silence_duration_ms=500)
-        )
-        
-        return " ".join(seg.text.strip() for seg in segments).strip()
-    
-    finally:
-        try:
-            os.unlink(temp_path)
-        except:
-            pass
+    return transcribe_array(audio_np, vad_filter=True).strip()
 
 
 def transcribe_audio_chunk(audio_np):
@@ -159,7 +122,8 @@ def transcription_worker():
                 break
             
             raw_data, current_rate, current_channels = item
-            audio_np = np.frombuffer(raw_data, dtype=np.float32).copy()
+            # Read-only view over the captured bytes; every step below returns a new array
+            audio_np = np.frombuffer(raw_data, dtype=np.float32)
             
             # Clean invalid values
             if not np.all(np.isfinite(audio_np)):
@@ -4,6 +4,7 @@ from backend.services.llm_service import GeminiLLMService
 from backend.services.notion_service import NotionTaskService
 from backend.services.state_service import JSONStateStorage
 from backend.services.slack_service import SlackService
+from backend.services.local_memory_service import LocalMemoryService, get_local_memory
 from backend.services.base import LLMService, TaskStorageService, StateStorageService
 
 
@@ -25,6 +26,7 @@ class ServiceContainer:
         self._task_storage: Optional[TaskStorageService] = None
         self._state_storage: Optional[StateStorageService] = None
         self._slack_service: Optional[SlackService] = None
+        self._mem0_service: Optional[LocalMemoryService] = None
     
     @property
     def llm_service(self) -> LLMService:
@@ -59,8 +61,10 @@ class ServiceContainer:
 
     @property
     def mem0_service(self):
-        """Mem0 disabled for now due to API issues."""
-        return None
+        """Local memory index (the Mem0 platform stays disabled here due to API issues)."""
+        if self._mem0_service is None:
+            self._mem0_service = get_local_memory()
+        return self._mem0_service
 
     
     @property
@@ -174,7 +174,7 @@ def make_memory_node(state_storage: StateStorageService, mem0_service = None) ->
                 
                 if memory_text:
                     mem0_service.add_memory(memory_text, user_id="team_context")
-                    print("🧠 Meeting insights added to Mem0.")
+                    print("🧠 Meeting insights queued for Mem0.")
                     
         except Exception as e:
             print(f"❌ Failed to save state: {e}")
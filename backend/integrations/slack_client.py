@@ -42,7 +42,8 @@ def post_meeting_summary(summary: Dict[str, Any], channel: str = None) -> bool:
     # Send
     print(f"🚀 Sending summary to Slack channel: {target_channel}...")
     try:
-        return container.slack_service.send_message(target_channel, blocks)
+        container.slack_service.send_message(target_channel, blocks).result(timeout=30)
+        return True
     except Exception as e:
         print(f"❌ Failed to send Slack message: {e}")
         return False
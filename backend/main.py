@@ -22,6 +22,11 @@ from backend.routes.auth import router as auth_router
 from backend.routes.settings import router as settings_router
 from backend.routes.meetings import router as meetings_router
 from backend.routes.ask import router as ask_router
+from backend.pipeline.meeting_pipeline import start_meeting_workers, stop_meeting_workers
+from backend.services.mem0_service import resume_spooled_memories
+from backend.services.memory_spool import stop_memory_writers
+from backend.asr.model_registry import prewarm_models
+from backend.asr.worker_pool import get_asr_pool, stop_asr_pool
 
 # Create app
 app = FastAPI(
@@ -37,6 +42,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor"],
 )
 
 # Routes
@@ -69,6 +75,19 @@ def startup():
     """Initialize database on startup."""
     init_db()
     print("✅ Database initialized")
+    start_meeting_workers()
+    resume_spooled_memories()
+    # Worker processes (or a background thread) load the ASR model; startup does not wait for it
+    if get_asr_pool() is None:
+        prewarm_models()
+
+
+@app.on_event("shutdown")
+def shutdown():
+    """Stop background job workers and ASR processes, and flush queued memories."""
+    stop_meeting_workers()
+    stop_memory_writers()
+    stop_asr_pool()
 
 
 @app.get("/health")
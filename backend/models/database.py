@@ -6,7 +6,7 @@ Stores users, credentials, conversations, and tasks.
 print("🔄 LOADING CLEAN TASK MODEL (assigned_to)")
 from datetime import datetime
 from typing import Optional
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Boolean
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Boolean, Index
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
 
@@ -61,10 +61,16 @@ class Conversation(Base):
     user_id = Column(Integer, ForeignKey("users.id"))
     title = Column(String(255), nullable=False)  # Required
     transcript = Column(Text, nullable=False)
+    transcript_hash = Column(String(64), nullable=True)  # sha256 of transcript, for duplicate detection
     summary = Column(Text, nullable=False)  # Required
     created_at = Column(DateTime, default=datetime.utcnow)
     
     user = relationship("User", back_populates="conversations")
+    
+    __table_args__ = (
+        Index("ix_conversations_user_transcript_hash", "user_id", "transcript_hash", unique=True),
+        Index("ix_conversations_user_created_id", "user_id", "created_at", "id"),
+    )
     tasks = relationship("Task", back_populates="conversation")
 
 
@@ -73,7 +79,7 @@ class Task(Base):
     __tablename__ = "tasks"
     
     id = Column(Integer, primary_key=True, index=True)
-    conversation_id = Column(Integer, ForeignKey("conversations.id"))
+    conversation_id = Column(Integer, ForeignKey("conversations.id"), index=True)
     title = Column(String(255), nullable=False)
     description = Column(Text, nullable=True)
     assigned_to = Column(String(255), nullable=True)  # Renamed from 'owner'
@@ -2,7 +2,7 @@
 Pydantic Schemas for API request/response validation.
 """
 from datetime import datetime
-from typing import Optional, List
+from typing import Optional, List, Dict, Literal
 from pydantic import BaseModel, EmailStr
 
 
@@ -59,6 +59,8 @@ class MeetingInput(BaseModel):
     file_path: Optional[str] = None
     title: Optional[str] = None  # Manual title for link/file inputs
     meeting_date: Optional[str] = None  # Manual date for link/file inputs
+    # How tasks + summary are generated (default: MEETING_PROCESSING_MODE env or "sequential")
+    processing_mode: Optional[Literal["sequential", "parallel", "combined"]] = None
 
 
 class TaskResponse(BaseModel):
@@ -95,3 +97,16 @@ class ConversationListItem(BaseModel):
     
     class Config:
         from_attributes = True
+
+
+class JobResponse(BaseModel):
+    job_id: str
+    status: str  # queued, running, completed, failed
+    result: Optional[ConversationResponse] = None
+    error: Optional[str] = None
+    status_code: Optional[int] = None  # HTTP-equivalent code for failed jobs
+    timings: Dict[str, float] = {}  # Seconds per pipeline stage
+    progress: Dict[str, float] = {}  # Fraction done (0..1) of long stages still running, e.g. transcribe
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
@@ -0,0 +1,478 @@
+"""
+Meeting Pipeline
+
+Transcript -> tasks + summary -> DB -> Mem0 -> Notion -> Slack.
+Runs inside a background job worker (see services/job_queue.py).
+"""
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from fastapi import HTTPException
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from backend.database import SessionLocal
+from backend.models.database import UserSettings, Conversation, Task
+from backend.models.schemas import MeetingInput
+from backend.services.job_queue import JobWorkerPool, get_job_queue
+from backend.services.service_pool import service_pool
+from backend.utils.normalization import compute_transcript_hash
+
+
+class StageTimer:
+    """Records wall-clock duration (seconds) of named pipeline stages."""
+
+    def __init__(self, timings: Optional[Dict[str, float]] = None):
+        self.timings = timings if timings is not None else {}
+
+    @contextmanager
+    def stage(self, name: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.timings[name] = round(time.perf_counter() - start, 3)
+
+
+def get_user_services(settings: UserSettings):
+    """(llm, notion, slack) for the user's credentials, reused across requests via the service pool."""
+    return service_pool.get(settings.user_id, settings).as_tuple()
+
+
+PROCESSING_MODES = ("sequential", "parallel", "combined")
+
+
+def analyze_transcript(llm, transcript: str, mode: str = "sequential", timer: Optional[StageTimer] = None):
+    """
+    Extract tasks and generate the summary.
+
+    Modes:
+        sequential: planner, then summary with the task list in its prompt
+        parallel: planner and transcript-only summary concurrently, merged afterwards
+        combined: a single structured-output call returning both
+
+    Returns:
+        (tasks, summary)
+    """
+    from backend.agents.planner_runner import GeminiPlannerAgent
+    from backend.agents.summary_agent import GeminiSummaryAgent, merge_tasks_into_summary
+
+    timer = timer or StageTimer()
+    if mode not in PROCESSING_MODES:
+        print(f"⚠️ Unknown processing mode '{mode}', using sequential")
+        mode = "sequential"
+
+    planner = GeminiPlannerAgent(llm)
+    summary_agent = GeminiSummaryAgent(llm)
+
+    def extract():
+        try:
+            return planner.extract_tasks(transcript)
+        except Exception as e:
+            print(f"⚠️ Task extraction failed (likely quota limit): {e}")
+            return []
+
+    if mode == "combined":
+        from backend.agents.analyzer_agent import GeminiMeetingAnalyzerAgent
+        with timer.stage("analysis"):
+            tasks_data, summary = GeminiMeetingAnalyzerAgent(llm).analyze_meeting(transcript)
+        _fill_task_defaults(tasks_data)
+        if not summary:
+            # Structured call came back without a usable summary - retry the summary alone
+            with timer.stage("summary"):
+                summary = summary_agent.generate_summary(transcript, tasks_data)
+        return tasks_data, summary
+
+    if mode == "parallel":
+        with timer.stage("analysis"):
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                tasks_future = executor.submit(extract)
+                summary_future = executor.submit(summary_agent.generate_summary_from_transcript, transcript)
+                tasks_data = tasks_future.result()
+                summary = summary_future.result()
+        _fill_task_defaults(tasks_data)
+        return tasks_data, merge_tasks_into_summary(summary, tasks_data)
+
+    with timer.stage("planner"):
+        tasks_data = extract()
+    _fill_task_defaults(tasks_data)
+    with timer.stage("summary"):
+        summary = summary_agent.generate_summary(transcript, tasks_data)
+    return tasks_data, summary
+
+
+def _fill_task_defaults(tasks_data):
+    for task in tasks_data:
+        if not task.get("owner"):
+            task["owner"] = "Unassigned"  # LLM uses 'owner', we'll map to 'assigned_to' when saving
+        if not task.get("deadline"):
+            task["deadline"] = "TBD"
+
+
+def ensure_not_duplicate(db: Session, user_id: int, transcript_hash: str) -> None:
+    """Raise 409 if the user already has a conversation with this transcript hash."""
+    existing = db.query(Conversation.id).filter(
+        Conversation.user_id == user_id,
+        Conversation.transcript_hash == transcript_hash
+    ).first()
+
+    if existing:
+        raise HTTPException(
+            status_code=409,
+            detail=f"This meeting transcript already exists (ID: {existing.id}). Duplicate not added."
+        )
+
+
+def process_meeting_pipeline(
+    meeting: MeetingInput,
+    user_id: int,
+    settings: UserSettings,
+    db: Session,
+    timer: Optional[StageTimer] = None,
+    services: Optional[Tuple[Any, Any, Any]] = None,
+    mem0_service=None,
+    on_progress: Optional[Callable[[str, float], None]] = None
+) -> Dict[str, Any]:
+    """
+    Process a meeting transcript end to end.
+
+    Raises HTTPException for user-facing failures (bad input, duplicates, LLM output).
+
+    `services` (llm, notion, slack) and `mem0_service` override the services
+    built from the user's settings (used by benchmarks/ with fakes).
+    `on_progress(stage, fraction)` is called as long stages (transcription) advance.
+
+    Returns:
+        Dict matching ConversationResponse
+    """
+    timer = timer or StageTimer()
+    transcript = meeting.transcript
+
+    # Check for file inputs
+    if not transcript:
+        from backend.utils.content import get_content_from_url, get_content_from_file
+
+        report = (lambda fraction: on_progress("transcribe", fraction)) if on_progress else None
+        with timer.stage("transcribe"):
+            if meeting.file_url:
+                transcript = get_content_from_url(meeting.file_url, report)
+            elif meeting.file_path:
+                transcript = get_content_from_file(meeting.file_path, report)
+
+    if not transcript:
+        raise HTTPException(status_code=400, detail="Transcript, file URL, or file path is required")
+
+    # Check for duplicate transcript (same user, same content) before spending any LLM tokens
+    transcript_hash = compute_transcript_hash(transcript)
+    ensure_not_duplicate(db, user_id, transcript_hash)
+
+    # Get services with user's credentials
+    bundle = None
+    if services is None:
+        bundle = service_pool.get(user_id, settings)
+        services = bundle.as_tuple()
+    llm, notion, slack = services
+
+    # Extract tasks and generate summary
+    mode = meeting.processing_mode or os.getenv("MEETING_PROCESSING_MODE", "sequential")
+    tasks_data, summary = analyze_transcript(llm, transcript, mode, timer)
+
+    # Validate summary generation - MUST have valid output
+    if not summary or not isinstance(summary, dict):
+        raise HTTPException(
+            status_code=422,
+            detail="Summary generation failed. Meeting was NOT saved to database. Please try again."
+        )
+
+    summary_text = summary.get("overview", "")
+    # Use manual title if provided, otherwise fall back to LLM-generated
+    title = meeting.title or summary.get("title", "") or (summary_text[:100] if summary_text else "")
+
+    # Require title and summary
+    if not title or not summary_text:
+        raise HTTPException(
+            status_code=422,
+            detail="Could not generate title or summary. Meeting was NOT saved. Please provide a clearer transcript or enter a title manually."
+        )
+
+    # Save conversation to DB (now with validated data)
+    meeting_date = meeting.meeting_date  # Define for later use in Mem0
+
+    # Use manual date if provided, otherwise use current time
+    if meeting_date:
+        try:
+            created_at = datetime.fromisoformat(meeting_date.replace('Z', '+00:00'))
+        except:
+            created_at = datetime.utcnow()
+    else:
+        created_at = datetime.utcnow()
+
+    # Save tasks to DB
+    from backend.utils.normalization import normalize_task_data
+
+    with timer.stage("database"):
+        conversation = Conversation(
+            user_id=user_id,
+            title=title[:100],
+            transcript=transcript,
+            transcript_hash=transcript_hash,
+            summary=summary_text,
+            created_at=created_at
+        )
+        db.add(conversation)
+        try:
+            db.commit()
+        except IntegrityError:
+            # Same transcript was saved by a concurrent job while this one was running
+            db.rollback()
+            ensure_not_duplicate(db, user_id, transcript_hash)
+            raise
+        db.refresh(conversation)
+
+        try:
+            db_tasks = []
+            for task_data in tasks_data:
+                # Normalize and sanitize task data
+                clean_task = normalize_task_data(task_data)
+
+                # Skip if title is empty even after normalization
+                if not clean_task["title"]:
+                    continue
+
+                task = Task(
+                    conversation_id=conversation.id,
+                    title=clean_task["title"],
+                    description=clean_task["description"],
+                    assigned_to=clean_task["assigned_to"],
+                    deadline=clean_task["deadline"],
+                    status=clean_task["status"]
+                )
+                db.add(task)
+                db_tasks.append(task)
+
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            print(f"❌ Database Error (Task Creation): {e}")
+            # Return partial success or full error? Let's return error to be safe
+            raise HTTPException(status_code=500, detail=f"Database Error: {str(e)}")
+
+    # Store meeting in Mem0 for semantic search/Q&A
+    with timer.stage("mem0"):
+        try:
+            mem0 = mem0_service
+            if mem0 is None and bundle is not None:
+                mem0 = bundle.mem0
+            elif mem0 is None:
+                from backend.services.mem0_service import create_memory_service
+                mem0 = create_memory_service(api_key=os.getenv("MEM0_API_KEY"))
+            if mem0.client:
+                # Create structured memory content
+                task_list = "\n".join([f"- {t.title} (Assigned: {t.assigned_to}, Due: {t.deadline})" for t in db_tasks])
+                key_points_text = "\n".join([f"- {kp}" for kp in summary.get("key_points", [])]) if isinstance(summary, dict) else ""
+                decisions_text = "\n".join([f"- {d}" for d in summary.get("decisions", [])]) if isinstance(summary, dict) else ""
+
+                memory_content = f"""Meeting: {title}
+Date: {conversation.created_at.strftime('%Y-%m-%d')}
+Summary: {summary_text}
+
+Key Points:
+{key_points_text}
+
+Decisions Made:
+{decisions_text}
+
+Action Items:
+{task_list}
+
+Full Transcript:
+{transcript[:3000]}"""  # Limit transcript length for Mem0
+
+                # Add to Mem0 (Long-term memory)
+                user_mem_id = f"user_{user_id}"
+
+                # Use Human-Readable Session ID (Title + Date)
+                clean_title = title.strip().lower().replace(" ", "_").replace(":", "").replace("/", "-")
+                clean_date = (meeting_date or "").strip().replace("/", "-")
+                # If date is invalid or empty, use created_at
+                if not clean_date:
+                    clean_date = created_at.strftime("%Y-%m-%d")
+
+                session_mem_id = f"{clean_title}_{clean_date}"
+
+                mem0.add_memory(
+                    text=memory_content,
+                    user_id=user_mem_id,
+                    session_id=session_mem_id,
+                    metadata={
+                        "conversation_id": conversation.id,
+                        "title": title,
+                        "meeting_date": created_at.strftime("%Y-%m-%d")  # Store as simple date string for filtering
+                    }
+                )
+                print(f"🧠 Meeting queued for Mem0 for user {user_id}")
+        except Exception as e:
+            print(f"⚠️ Mem0 storage failed: {e}")
+
+    # Create tasks in Notion if configured
+    if notion:
+        with timer.stage("notion"):
+            try:
+                # First create meeting row
+                meeting_page_id = notion.create_meeting_row(conversation.id, transcript)
+                if meeting_page_id:
+                    # Add summary as child page
+                    notion.create_meeting_summary(summary, meeting_page_id)
+
+                # Map tasks to Notion format (resolves assignee)
+                notion_tasks = [
+                    notion.map_agent_task_to_notion({
+                        "title": task.title,
+                        "description": task.description,
+                        "owner": task.assigned_to,  # Use assigned_to for Notion
+                        "deadline": task.deadline,
+                        "status": "Not started",
+                        "task_type": "Action Item"
+                    })
+                    for task in db_tasks
+                ]
+
+                # Create in Tasks setup (concurrent, rate limited)
+                results = notion.create_tasks(notion_tasks, meeting_page_id)
+                failed = [r["title"] for r in results if r["error"]]
+                if failed:
+                    print(f"⚠️ {len(failed)}/{len(results)} Notion tasks failed: {failed}")
+
+            except Exception as e:
+                print(f"Notion error: {e}")
+
+    # Send Slack notification if configured
+    if slack and settings.slack_channel_id:
+        with timer.stage("slack"):
+            try:
+                # Build Block Kit message
+                blocks = [
+                    {
+                        "type": "header",
+                        "text": {
+                            "type": "plain_text",
+                            "text": "📝 New Meeting Processed",
+                            "emoji": True
+                        }
+                    },
+                    {
+                        "type": "section",
+                        "text": {
+                            "type": "mrkdwn",
+                            "text": f"*{summary_text[:200]}...*" if len(summary_text) > 200 else f"*{summary_text}*"
+                        }
+                    },
+                    {"type": "divider"},
+                    {
+                        "type": "section",
+                        "text": {
+                            "type": "mrkdwn",
+                            "text": f"*📋 Extracted Tasks ({len(db_tasks)})*"
+                        }
+                    }
+                ]
+
+                # Add tasks (max 10 to avoid limit)
+                for i, task in enumerate(db_tasks[:10]):
+                    icon = "🟢" if task.status == "pending" else "⚪"
+                    deadline = f" (Due: {task.deadline})" if task.deadline and task.deadline != "TBD" else ""
+                    # Better assignee formatting if we had Slack IDs, for now just name
+                    assignee_display = f"👤 {task.assigned_to}"
+
+                    blocks.append({
+                        "type": "section",
+                        "text": {
+                            "type": "mrkdwn",
+                            "text": f"{icon} *{task.title}*\n{assignee_display}{deadline}"
+                        }
+                    })
+
+                if len(db_tasks) > 10:
+                    blocks.append({
+                        "type": "context",
+                        "elements": [{"type": "mrkdwn", "text": f"...and {len(db_tasks) - 10} more tasks"}]
+                    })
+
+                slack.send_message(settings.slack_channel_id, blocks=blocks, text="New Meeting Processed")
+            except Exception as e:
+                print(f"Slack error: {e}")
+
+    # Build response with summary fields
+    return {
+        "id": conversation.id,
+        "title": conversation.title,
+        "transcript": conversation.transcript,
+        "summary": summary_text,
+        "key_points": summary.get("key_points", []) if isinstance(summary, dict) else [],
+        "decisions": summary.get("decisions", []) if isinstance(summary, dict) else [],
+        "created_at": conversation.created_at,
+        "tasks": [
+            {
+                "id": t.id,
+                "title": t.title,
+                "description": t.description,
+                "assigned_to": t.assigned_to,
+                "deadline": t.deadline,
+                "status": t.status
+            } for t in db_tasks
+        ]
+    }
+
+
+def run_meeting_job(job: Dict[str, Any], timings: Dict[str, float]) -> Dict[str, Any]:
+    """Job handler: runs the pipeline with a dedicated DB session."""
+    db = SessionLocal()
+    try:
+        settings = db.query(UserSettings).filter(UserSettings.user_id == job["user_id"]).first()
+        if not settings:
+            raise HTTPException(status_code=400, detail="Please configure your settings first")
+
+        meeting = MeetingInput(**job["payload"])
+        progress: Dict[str, float] = {}
+
+        def on_progress(stage: str, fraction: float) -> None:
+            progress[stage] = round(fraction, 3)
+            get_job_queue().update_job(job["id"], {"progress": dict(progress)})
+
+        result = process_meeting_pipeline(meeting, job["user_id"], settings, db, StageTimer(timings),
+                                          on_progress=on_progress)
+        # Job records may be stored as JSON (Redis), so serialize datetimes now
+        return jsonable_encoder(result)
+    finally:
+        db.close()
+
+
+_worker_pool: Optional[JobWorkerPool] = None
+_worker_pool_lock = threading.Lock()
+
+
+def start_meeting_workers() -> JobWorkerPool:
+    """Start (once) the in-process worker pool for meeting jobs."""
+    global _worker_pool
+    with _worker_pool_lock:
+        if _worker_pool is None:
+            _worker_pool = JobWorkerPool(
+                get_job_queue(),
+                run_meeting_job,
+                workers=int(os.getenv("MEETING_JOB_WORKERS", "2"))
+            )
+        _worker_pool.start()
+        return _worker_pool
+
+
+def stop_meeting_workers() -> None:
+    """Stop the worker pool (used on application shutdown)."""
+    with _worker_pool_lock:
+        if _worker_pool is not None:
+            _worker_pool.stop()
@@ -8,7 +8,6 @@ import sys
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-from audio.extract import extract_audio
 from asr.whisper_transcriber import transcribe_audio
 from utils.download import download_file
 
@@ -16,7 +15,8 @@ from utils.download import download_file
 def get_transcript(
     text: str = None,
     file_path: str = None,
-    url: str = None
+    url: str = None,
+    segmented: bool = None
 ) -> str:
     """
     Convert any input to transcript text.
@@ -25,6 +25,8 @@ def get_transcript(
         text: Raw transcript text (pass-through)
         file_path: Path to audio/video file
         url: URL to download recording from
+        segmented: Transcribe silence-bounded segments in parallel on the
+            ASR worker pool (None follows ASR_SEGMENTED)
         
     Returns:
         Transcript text
@@ -38,14 +40,9 @@ def get_transcript(
         downloaded = download_file(url, "inputs/downloads/recording.mp4")
         file_path = downloaded
 
-    # Option 3: File → extract audio → transcribe
+    # Option 3: File → transcribe
     if file_path:
-        # Extract audio if not already WAV
-        if not file_path.lower().endswith(".wav"):
-            audio_path = extract_audio(file_path)
-        else:
-            audio_path = file_path
-        
-        return transcribe_audio(audio_path)
+        # Audio is decoded through an ffmpeg pipe (streamed in segmented mode); no WAV is written
+        return transcribe_audio(file_path, segmented=segmented)
 
     raise ValueError("No valid input provided. Provide text, file_path, or url.")
@@ -1,19 +1,22 @@
 """
-Ask Routes - Q&A over past meetings using Mem0 semantic search
+Ask Routes - Q&A over past meetings using semantic memory search (Mem0 or local index)
 """
 import os
+import json
 from typing import Optional
 from pydantic import BaseModel
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
-from backend.database import get_db
+from backend.database import run_db
 from backend.models.database import User, UserSettings
 from backend.auth import get_current_user
-from backend.services.mem0_service import Mem0Service
-from backend.services.llm_service import GeminiLLMService
+from backend.services.service_pool import service_pool
 
 from backend.agents.meeting_query_agent import MeetingQueryAgent
+from backend.agents.intent_router import intent_router
 
 router = APIRouter(prefix="/api/ask", tags=["ask"])
 
@@ -29,28 +32,23 @@ class AskResponse(BaseModel):
     sources: list[str]  # Meeting titles used as context
 
 
-@router.post("", response_model=AskResponse)
-def ask_question(
-    request: AskRequest,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
-):
-    """Ask a question about past meetings using Mem0 semantic search."""
-    
-    # Get user settings for Gemini key
-    settings = db.query(UserSettings).filter(UserSettings.user_id == current_user.id).first()
+def _get_user_settings(db: Session, user_id: int):
+    return db.query(UserSettings).filter(UserSettings.user_id == user_id).first()
+
+
+def _build_agent(request: AskRequest, current_user: User, settings: Optional[UserSettings]):
+    """Resolve the user's services and filters. Returns (agent, memory user id, filters)."""
+    # Gemini key from the user's settings (loaded with run_db), else the server default
     gemini_key = settings.gemini_api_key if settings else None
     gemini_key = gemini_key or os.getenv("GEMINI_API_KEY")
     
     if not gemini_key:
         raise HTTPException(status_code=400, detail="Please configure your Gemini API key in settings")
     
-    # Initialize services
-    mem0 = Mem0Service(api_key=os.getenv("MEM0_API_KEY"))
-    llm = GeminiLLMService(
-        api_key=gemini_key, 
-        model_name=os.getenv("GEMINI_MODEL", "gemini-1.5-flash")
-    )
+    # Reuse the user's pooled services (warm HTTP clients and caches)
+    services = service_pool.get(current_user.id, settings)
+    mem0 = services.mem0
+    llm = services.llm
     
     if not mem0.client:
         raise HTTPException(status_code=500, detail="Memory service unavailable")
@@ -62,11 +60,24 @@ def ask_question(
         filters = {"metadata": {"conversation_id": request.meeting_id}}
     elif request.date:
         filters = {"metadata": {"meeting_date": request.date}}
+    
+    return MeetingQueryAgent(llm_service=llm, mem0_service=mem0), user_mem_id, filters
+
+
+@router.post("", response_model=AskResponse)
+async def ask_question(
+    request: AskRequest,
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Ask a question about past meetings using semantic memory search.
+    The LLM calls are awaited on the event loop (no thread held per request).
+    """
+    settings = await run_db(_get_user_settings, current_user.id)
+    agent, user_mem_id, filters = await run_in_threadpool(_build_agent, request, current_user, settings)
         
     try:
-        # Initialize and run agent
-        agent = MeetingQueryAgent(llm_service=llm, mem0_service=mem0)
-        answer, sources = agent.run(
+        answer, sources = await agent.arun(
             query=request.question,
             user_id=user_mem_id,
             filters=filters
@@ -83,20 +94,70 @@ def ask_question(
         raise HTTPException(status_code=500, detail=f"Agent failed to process request: {e}")
 
 
-@router.get("/memories")
-def get_memory_count(
+def _sse(event: str, data: dict) -> str:
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+@router.post("/stream")
+async def ask_question_stream(
+    request: AskRequest,
     current_user: User = Depends(get_current_user)
 ):
-    """Get count of stored memories for debugging."""
-    mem0 = Mem0Service(api_key=os.getenv("MEM0_API_KEY"))
+    """
+    Same as POST /api/ask, streamed as Server-Sent Events:
+    `sources` ({"sources": [...]}) first, then `token` ({"text": ...}) chunks,
+    then `done` (or `error` with {"detail": ...}).
+    """
+    settings = await run_db(_get_user_settings, current_user.id)
+    agent, user_mem_id, filters = await run_in_threadpool(_build_agent, request, current_user, settings)
+
+    # A sync generator: Starlette iterates it on the threadpool
+    def events():
+        try:
+            for kind, value in agent.run_stream(query=request.question, user_id=user_mem_id, filters=filters):
+                if kind == "sources":
+                    yield _sse("sources", {"sources": value[:5]})
+                else:
+                    yield _sse("token", {"text": value})
+            yield _sse("done", {})
+        except Exception as e:
+            print(f"❌ Agent stream error: {e}")
+            yield _sse("error", {"detail": f"Agent failed to process request: {e}"})
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
+def _count_memories(user_id: int, settings: Optional[UserSettings]) -> dict:
+    mem0 = service_pool.get(user_id, settings).mem0
     
     if not mem0.client:
-        return {"count": 0, "status": "Mem0 not configured"}
+        return {"count": 0, "status": "Memory service not configured"}
     
-    user_mem_id = f"user_{current_user.id}"
+    user_mem_id = f"user_{user_id}"
     memories = mem0.get_all_memories(user_id=user_mem_id)
     
     return {
         "count": len(memories),
         "status": "ok"
     }
+
+
+@router.get("/memories")
+async def get_memory_count(
+    current_user: User = Depends(get_current_user)
+):
+    """Get count of stored memories for debugging."""
+    settings = await run_db(_get_user_settings, current_user.id)
+    return await run_in_threadpool(_count_memories, current_user.id, settings)
+
+
+@router.get("/stats")
+def get_router_stats(
+    current_user: User = Depends(get_current_user)
+):
+    """How often questions were routed by rules, the local classifier or the LLM."""
+    return intent_router.stats()
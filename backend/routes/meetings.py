@@ -3,404 +3,197 @@ Meetings Routes - Process meetings and get history
 """
 import sys
 import os
-from typing import List
-from fastapi import APIRouter, Depends, HTTPException
+from datetime import datetime
+from typing import List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import and_, func, or_
 from sqlalchemy.orm import Session
 
 # Add project root to path for existing services
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
-from backend.database import get_db
+from backend.database import run_db
 from backend.models.database import User, UserSettings, Conversation, Task
-from backend.models.schemas import MeetingInput, ConversationResponse, ConversationListItem, TaskResponse
+from backend.models.schemas import MeetingInput, ConversationResponse, ConversationListItem, TaskResponse, JobResponse
 from backend.auth import get_current_user
+from backend.pipeline.meeting_pipeline import start_meeting_workers, ensure_not_duplicate
+from backend.utils.normalization import compute_transcript_hash
+from backend.services.job_queue import get_job_queue
 
 router = APIRouter(prefix="/api/meetings", tags=["meetings"])
 
 
-def get_user_services(settings: UserSettings):
-    """Create service instances with user's credentials."""
-    from backend.services.llm_service import GeminiLLMService
-    from backend.services.notion_service import NotionTaskService
-    from backend.services.slack_service import SlackService
-    
-    # Build config from user settings
-    llm = GeminiLLMService(
-        api_key=settings.gemini_api_key or os.getenv("GEMINI_API_KEY"),
-        model_name=os.getenv("GEMINI_MODEL", "gemini-1.5-flash")
-    )
-    
-    notion = None
-    notion_token = settings.notion_token or os.getenv("NOTION_TOKEN")
-    if notion_token:
-        notion = NotionTaskService(
-            auth_token=notion_token,
-            database_id=settings.notion_database_id or os.getenv("NOTION_DATABASE_ID") or "",
-            meeting_database_id=settings.notion_meeting_db_id or os.getenv("NOTION_DATABASE_MEETING_ID") or "",
-            task_database_id=settings.notion_task_db_id or os.getenv("NOTION_DATABASE_TASK_ID") or ""
-        )
-        print("✅ Notion service initialized")
-    else:
-        print("⚠️ Notion not configured (no token in settings/env)")
-    
-    slack = None
-    slack_token = settings.slack_bot_token or os.getenv("SLACK_BOT_TOKEN")
-    if slack_token:
-        slack = SlackService(slack_token)
-        channel = settings.slack_channel_id or os.getenv("SLACK_CHANNEL_ID") or os.getenv("SLACK_TEST_USER_ID")
-        print(f"✅ Slack service initialized (target: {channel})")
-    else:
-        print("⚠️ Slack not configured (no bot token in settings/env)")
+def _check_can_process(db: Session, user_id: int, transcript: Optional[str]) -> None:
+    settings = db.query(UserSettings.id).filter(UserSettings.user_id == user_id).first()
+    if not settings:
+        raise HTTPException(status_code=400, detail="Please configure your settings first")
     
-    return llm, notion, slack
+    # Reject pasted duplicates immediately; file/URL inputs are checked once transcribed
+    if transcript:
+        ensure_not_duplicate(db, user_id, compute_transcript_hash(transcript))
 
 
-@router.post("/process", response_model=ConversationResponse)
-def process_meeting(
+@router.post("/process", response_model=JobResponse, status_code=202)
+async def process_meeting(
     meeting: MeetingInput,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: User = Depends(get_current_user)
 ):
-    """Process a meeting transcript and extract tasks."""
-    # Get user settings
-    settings = db.query(UserSettings).filter(UserSettings.user_id == current_user.id).first()
-    if not settings:
-        raise HTTPException(status_code=400, detail="Please configure your settings first")
-    
-    transcript = meeting.transcript
-    
-    # Check for file inputs
-    if not transcript:
-        from backend.utils.content import get_content_from_url, get_content_from_file
-        
-        if meeting.file_url:
-            transcript = get_content_from_url(meeting.file_url)
-        elif meeting.file_path:
-            transcript = get_content_from_file(meeting.file_path)
-            
-    if not transcript:
+    """Queue a meeting transcript for processing. Poll /jobs/{job_id} for the result."""
+    if not (meeting.transcript or meeting.file_url or meeting.file_path):
         raise HTTPException(status_code=400, detail="Transcript, file URL, or file path is required")
     
-    # Get services with user's credentials
-    llm, notion, slack = get_user_services(settings)
-    
-    # Extract tasks using planner
-    try:
-        from backend.agents.planner_runner import GeminiPlannerAgent
-        planner = GeminiPlannerAgent(llm)
-        tasks_data = planner.extract_tasks(transcript)
-    except Exception as e:
-        print(f"⚠️ Task extraction failed (likely quota limit): {e}")
-        tasks_data = []
-    
-    # Fill in missing fields
-    for task in tasks_data:
-        if not task.get("owner"):
-            task["owner"] = "Unassigned"  # LLM uses 'owner', we'll map to 'assigned_to' when saving
-        if not task.get("deadline"):
-            task["deadline"] = "TBD"
-    
-    # Generate summary
-    from backend.agents.summary_agent import GeminiSummaryAgent
-    summary_agent = GeminiSummaryAgent(llm)
-    summary = summary_agent.generate_summary(transcript, tasks_data)
-    
-    # Validate summary generation - MUST have valid output
-    if not summary or not isinstance(summary, dict):
-        raise HTTPException(
-            status_code=422, 
-            detail="Summary generation failed. Meeting was NOT saved to database. Please try again."
-        )
-    
-    summary_text = summary.get("overview", "")
-    # Use manual title if provided, otherwise fall back to LLM-generated
-    title = meeting.title or summary.get("title", "") or (summary_text[:100] if summary_text else "")
-    
-    # Require title and summary
-    if not title or not summary_text:
-        raise HTTPException(
-            status_code=422,
-            detail="Could not generate title or summary. Meeting was NOT saved. Please provide a clearer transcript or enter a title manually."
-        )
-    
-    # Check for duplicate transcript (same user, same content)
-    import hashlib
-    transcript_hash = hashlib.md5(transcript.encode()).hexdigest()
-    existing = db.query(Conversation).filter(
-        Conversation.user_id == current_user.id,
-        Conversation.transcript == transcript
-    ).first()
-    
-    if existing:
-        raise HTTPException(
-            status_code=409,
-            detail=f"This meeting transcript already exists (ID: {existing.id}). Duplicate not added."
-        )
-    
-    import hashlib
-    # Save conversation to DB (now with validated data)
-    from datetime import datetime
-    
-    meeting_date = meeting.meeting_date  # Define for later use in Mem0
+    await run_db(_check_can_process, current_user.id, meeting.transcript)
     
-    # Use manual date if provided, otherwise use current time
-    if meeting_date:
-        try:
-            created_at = datetime.fromisoformat(meeting_date.replace('Z', '+00:00'))
-        except:
-            created_at = datetime.utcnow()
-    else:
-        created_at = datetime.utcnow()
-        
-    conversation = Conversation(
-        user_id=current_user.id,
-        title=title[:100],
-        transcript=transcript,
-        summary=summary_text,
-        created_at=created_at
-    )
-    db.add(conversation)
-    db.commit()
-    db.refresh(conversation)
-    
-    # Save tasks to DB
-    from backend.utils.normalization import normalize_task_data
-    
-    try:
-        db_tasks = []
-        for task_data in tasks_data:
-            # Normalize and sanitize task data
-            clean_task = normalize_task_data(task_data)
-            
-            # Skip if title is empty even after normalization
-            if not clean_task["title"]:
-                continue
-                
-            task = Task(
-                conversation_id=conversation.id,
-                title=clean_task["title"],
-                description=clean_task["description"],
-                assigned_to=clean_task["assigned_to"],
-                deadline=clean_task["deadline"],
-                status=clean_task["status"]
-            )
-            db.add(task)
-            db_tasks.append(task)
-        
-        db.commit()
-    except Exception as e:
-        db.rollback()
-        print(f"❌ Database Error (Task Creation): {e}")
-        # Return partial success or full error? Let's return error to be safe
-        raise HTTPException(status_code=500, detail=f"Database Error: {str(e)}")
-    
-    # Store meeting in Mem0 for semantic search/Q&A
-    try:
-        from backend.services.mem0_service import Mem0Service
-        mem0 = Mem0Service(api_key=os.getenv("MEM0_API_KEY"))
-        if mem0.client:
-            # Create structured memory content
-            task_list = "\n".join([f"- {t.title} (Assigned: {t.assigned_to}, Due: {t.deadline})" for t in db_tasks])
-            key_points_text = "\n".join([f"- {kp}" for kp in summary.get("key_points", [])]) if isinstance(summary, dict) else ""
-            decisions_text = "\n".join([f"- {d}" for d in summary.get("decisions", [])]) if isinstance(summary, dict) else ""
-            
-            memory_content = f"""Meeting: {title}
-Date: {conversation.created_at.strftime('%Y-%m-%d')}
-Summary: {summary_text}
+    return await run_in_threadpool(_enqueue_meeting, meeting, current_user.id)
 
-Key Points:
-{key_points_text}
 
-Decisions Made:
-{decisions_text}
+def _enqueue_meeting(meeting: MeetingInput, user_id: int) -> JobResponse:
+    start_meeting_workers()
+    job_queue = get_job_queue()
+    job_id = job_queue.enqueue(meeting.model_dump(), user_id=user_id)
+    return _job_response(job_queue.get_job(job_id))
 
-Action Items:
-{task_list}
 
-Full Transcript:
-{transcript[:3000]}"""  # Limit transcript length for Mem0
-            
-            # Add to Mem0 (Long-term memory)
-            user_mem_id = f"user_{current_user.id}"
-            
-            # Use Human-Readable Session ID (Title + Date)
-            clean_title = title.strip().lower().replace(" ", "_").replace(":", "").replace("/", "-")
-            clean_date = (meeting_date or "").strip().replace("/", "-")
-            # If date is invalid or empty, use created_at
-            if not clean_date:
-                clean_date = created_at.strftime("%Y-%m-%d")
+@router.get("/jobs/{job_id}", response_model=JobResponse)
+def get_job(
+    job_id: str,
+    current_user: User = Depends(get_current_user)
+):
+    """Get status, per-stage timings and (when completed) the result of a processing job."""
+    job = get_job_queue().get_job(job_id)
+    if not job or job.get("user_id") != current_user.id:
+        raise HTTPException(status_code=404, detail="Job not found")
+    
+    return _job_response(job)
+
+
+def _job_response(job: dict) -> JobResponse:
+    return JobResponse(
+        job_id=job["id"],
+        status=job["status"],
+        result=job.get("result"),
+        error=job.get("error"),
+        status_code=job.get("status_code"),
+        timings=job.get("timings") or {},
+        progress=job.get("progress") or {},
+        created_at=job["created_at"],
+        started_at=job.get("started_at"),
+        finished_at=job.get("finished_at")
+    )
+
 
-            session_mem_id = f"{clean_title}_{clean_date}"
-            
-            mem0.add_memory(
-                text=memory_content,
-                user_id=user_mem_id,
-                session_id=session_mem_id,
-                metadata={
-                    "conversation_id": conversation.id,
-                    "title": title,
-                    "meeting_date": created_at.strftime("%Y-%m-%d")  # Store as simple date string for filtering
-                }
-            )
-            print(f"🧠 Meeting stored in Mem0 for user {current_user.id}")
-    except Exception as e:
-        print(f"⚠️ Mem0 storage failed: {e}")
+def _fetch_conversation_page(db: Session, user_id: int, limit: int, cursor: Optional[str]):
+    # Page over conversations first (index on user_id, created_at, id), then count tasks for that page only
+    page = db.query(
+        Conversation.id, Conversation.title, Conversation.created_at
+    ).filter(Conversation.user_id == user_id)
     
-    # Create tasks in Notion if configured
-    if notion:
-        try:
-            # First create meeting row
-            meeting_page_id = notion.create_meeting_row(conversation.id, transcript)
-            if meeting_page_id:
-                # Add summary as child page
-                notion.create_meeting_summary(summary, meeting_page_id)
-            
-            # Create tasks
-            for task in db_tasks:
-                # Map task to Notion format (resolves assignee)
-                notion_task = notion.map_agent_task_to_notion({
-                    "title": task.title,
-                    "description": task.description,
-                    "owner": task.assigned_to,  # Use assigned_to for Notion
-                    "deadline": task.deadline,
-                    "status": "Not started",
-                    "task_type": "Action Item"
-                })
-                
-                # Create in Tasks setup
-                notion.create_task(notion_task, meeting_page_id)
-                
-        except Exception as e:
-            print(f"Notion error: {e}")
+    if cursor:
+        cursor_created_at, cursor_id = _decode_cursor(cursor)
+        page = page.filter(or_(
+            Conversation.created_at < cursor_created_at,
+            and_(Conversation.created_at == cursor_created_at, Conversation.id < cursor_id)
+        ))
     
-    # Send Slack notification if configured
-    if slack and settings.slack_channel_id:
-        try:
-            # Build Block Kit message
-            blocks = [
-                {
-                    "type": "header",
-                    "text": {
-                        "type": "plain_text",
-                        "text": "📝 New Meeting Processed",
-                        "emoji": True
-                    }
-                },
-                {
-                    "type": "section",
-                    "text": {
-                        "type": "mrkdwn",
-                        "text": f"*{summary_text[:200]}...*" if len(summary_text) > 200 else f"*{summary_text}*"
-                    }
-                },
-                {"type": "divider"},
-                {
-                    "type": "section",
-                    "text": {
-                        "type": "mrkdwn",
-                        "text": f"*📋 Extracted Tasks ({len(db_tasks)})*"
-                    }
-                }
-            ]
-            
-            # Add tasks (max 10 to avoid limit)
-            for i, task in enumerate(db_tasks[:10]):
-                icon = "🟢" if task.status == "pending" else "⚪"
-                deadline = f" (Due: {task.deadline})" if task.deadline and task.deadline != "TBD" else ""
-                assignee = f" invalid-user" if task.assigned_to == "Unassigned" else f" <@{task.assigned_to}>" # basic fallback
-                # Better assignee formatting if we had Slack IDs, for now just name
-                assignee_display = f"👤 {task.assigned_to}"
-                
-                blocks.append({
-                    "type": "section",
-                    "text": {
-                        "type": "mrkdwn",
-                        "text": f"{icon} *{task.title}*\n{assignee_display}{deadline}"
-                    }
-                })
-                
-            if len(db_tasks) > 10:
-                blocks.append({
-                    "type": "context",
-                    "elements": [{"type": "mrkdwn", "text": f"...and {len(db_tasks) - 10} more tasks"}]
-                })
-                
-            slack.send_message(settings.slack_channel_id, blocks=blocks, text="New Meeting Processed")
-        except Exception as e:
-            print(f"Slack error: {e}")
+    page = page.order_by(
+        Conversation.created_at.desc(), Conversation.id.desc()
+    ).limit(limit + 1).subquery()
     
-    # Build response with summary fields
-    return {
-        "id": conversation.id,
-        "title": conversation.title,
-        "transcript": conversation.transcript,
-        "summary": summary_text,
-        "key_points": summary.get("key_points", []) if isinstance(summary, dict) else [],
-        "decisions": summary.get("decisions", []) if isinstance(summary, dict) else [],
-        "created_at": conversation.created_at,
-        "tasks": [
-            {
-                "id": t.id,
-                "title": t.title,
-                "description": t.description,
-                "assigned_to": t.assigned_to,
-                "deadline": t.deadline,
-                "status": t.status
-            } for t in db_tasks
-        ]
-    }
+    return db.query(
+        page.c.id, page.c.title, page.c.created_at, func.count(Task.id)
+    ).outerjoin(
+        Task, Task.conversation_id == page.c.id
+    ).group_by(
+        page.c.id, page.c.title, page.c.created_at
+    ).order_by(
+        page.c.created_at.desc(), page.c.id.desc()
+    ).all()
 
 
 @router.get("/conversations", response_model=List[ConversationListItem])
-def list_conversations(
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+async def list_conversations(
+    response: Response,
+    limit: int = Query(50, ge=1, le=200),
+    cursor: Optional[str] = None,
+    current_user: User = Depends(get_current_user)
 ):
-    """List all conversations for current user."""
-    conversations = db.query(Conversation).filter(
-        Conversation.user_id == current_user.id
-    ).order_by(Conversation.created_at.desc()).all()
+    """
+    List conversations for current user, newest first.
+    
+    Keyset-paginated: when more rows exist, the X-Next-Cursor response header
+    holds the cursor to pass back for the next page.
+    """
+    rows = await run_db(_fetch_conversation_page, current_user.id, limit, cursor)
+    
+    if len(rows) > limit:
+        rows = rows[:limit]
+        response.headers["X-Next-Cursor"] = _encode_cursor(rows[-1].created_at, rows[-1].id)
     
     return [
         ConversationListItem(
-            id=c.id,
-            title=c.title,
-            created_at=c.created_at,
-            task_count=len(c.tasks)
+            id=conversation_id,
+            title=title,
+            created_at=created_at,
+            task_count=task_count
         )
-        for c in conversations
+        for conversation_id, title, created_at, task_count in rows
     ]
 
 
+def _encode_cursor(created_at: datetime, conversation_id: int) -> str:
+    return f"{created_at.isoformat()}_{conversation_id}"
+
+
+def _decode_cursor(cursor: str):
+    try:
+        created_at, conversation_id = cursor.rsplit("_", 1)
+        return datetime.fromisoformat(created_at), int(conversation_id)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def _get_conversation(db: Session, user_id: int, conversation_id: int) -> Optional[ConversationResponse]:
+    conversation = db.query(Conversation).filter(
+        Conversation.id == conversation_id,
+        Conversation.user_id == user_id
+    ).first()
+    
+    if not conversation:
+        return None
+    
+    return ConversationResponse(
+        id=conversation.id,
+        title=conversation.title,
+        transcript=conversation.transcript,
+        summary=conversation.summary,
+        created_at=conversation.created_at,
+        tasks=[TaskResponse.model_validate(t) for t in conversation.tasks]
+    )
+
+
 @router.get("/conversations/{conversation_id}", response_model=ConversationResponse)
-def get_conversation(
+async def get_conversation(
     conversation_id: int,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: User = Depends(get_current_user)
 ):
     """Get a specific conversation with tasks."""
-    conversation = db.query(Conversation).filter(
-        Conversation.id == conversation_id,
-        Conversation.user_id == current_user.id
-    ).first()
+    conversation = await run_db(_get_conversation, current_user.id, conversation_id)
     
     if not conversation:
         raise HTTPException(status_code=404, detail="Conversation not found")
     
-@router.delete("/conversations/{conversation_id}")
-def delete_conversation(
-    conversation_id: int,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
-):
-    """Delete a conversation and its tasks."""
+    return conversation
+
+
+def _delete_conversation(db: Session, user_id: int, conversation_id: int) -> bool:
     conversation = db.query(Conversation).filter(
         Conversation.id == conversation_id,
-        Conversation.user_id == current_user.id
+        Conversation.user_id == user_id
     ).first()
     
     if not conversation:
-        raise HTTPException(status_code=404, detail="Conversation not found")
+        return False
         
     # Delete associated tasks
     db.query(Task).filter(Task.conversation_id == conversation_id).delete()
@@ -408,5 +201,16 @@ def delete_conversation(
     # Delete conversation
     db.delete(conversation)
     db.commit()
+    return True
+
+
+@router.delete("/conversations/{conversation_id}")
+async def delete_conversation(
+    conversation_id: int,
+    current_user: User = Depends(get_current_user)
+):
+    """Delete a conversation and its tasks."""
+    if not await run_db(_delete_conversation, current_user.id, conversation_id):
+        raise HTTPException(status_code=404, detail="Conversation not found")
     
     return {"message": "Conversation deleted successfully"}
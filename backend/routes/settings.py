@@ -3,21 +3,23 @@ Settings Routes - User API credentials management
 """
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
-from backend.database import get_db
+from backend.database import run_db
 from backend.models.database import User, UserSettings
 from backend.models.schemas import SettingsUpdate, SettingsResponse
 from backend.auth import get_current_user
+from backend.services.service_pool import service_pool
 
 router = APIRouter(prefix="/api/settings", tags=["settings"])
 
 
+def _get_user_settings(db: Session, user_id: int):
+    return db.query(UserSettings).filter(UserSettings.user_id == user_id).first()
+
+
 @router.get("/", response_model=SettingsResponse)
-def get_settings(
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
-):
+async def get_settings(current_user: User = Depends(get_current_user)):
     """Get current user's settings status."""
-    settings = db.query(UserSettings).filter(UserSettings.user_id == current_user.id).first()
+    settings = await run_db(_get_user_settings, current_user.id)
     
     if not settings:
         return SettingsResponse(
@@ -33,39 +35,39 @@ def get_settings(
     )
 
 
-@router.put("/")
-def update_settings(
-    settings_data: SettingsUpdate,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
-):
-    """Update user's API credentials."""
-    settings = db.query(UserSettings).filter(UserSettings.user_id == current_user.id).first()
+def _update_settings(db: Session, user_id: int, update_data: dict) -> None:
+    settings = _get_user_settings(db, user_id)
     
     if not settings:
-        settings = UserSettings(user_id=current_user.id)
+        settings = UserSettings(user_id=user_id)
         db.add(settings)
     
-    # Update only provided fields
-    update_data = settings_data.model_dump(exclude_unset=True)
     for field, value in update_data.items():
         # Ignore None, empty strings, and masked values (***)
         if value is not None and value != "" and not str(value).startswith("***"):
             setattr(settings, field, value)
     
     db.commit()
-    db.refresh(settings)
+
+
+@router.put("/")
+async def update_settings(
+    settings_data: SettingsUpdate,
+    current_user: User = Depends(get_current_user)
+):
+    """Update user's API credentials."""
+    # Update only provided fields
+    await run_db(_update_settings, current_user.id, settings_data.model_dump(exclude_unset=True))
+    # Pooled services were built from the old credentials
+    service_pool.invalidate(current_user.id)
     
     return {"message": "Settings updated successfully"}
 
 
 @router.get("/full")
-def get_full_settings(
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
-):
+async def get_full_settings(current_user: User = Depends(get_current_user)):
     """Get full settings (masked)."""
-    settings = db.query(UserSettings).filter(UserSettings.user_id == current_user.id).first()
+    settings = await run_db(_get_user_settings, current_user.id)
     
     if not settings:
         return {}
@@ -0,0 +1,75 @@
+"""
+Benchmark the planner/summary processing modes with a simulated LLM.
+
+Compares wall-clock time of sequential, parallel and combined modes of
+analyze_transcript without calling Gemini.
+
+Usage:
+    python backend/scripts/benchmark_processing_modes.py --latency 0.8 --runs 5
+"""
+import os
+import sys
+import time
+import argparse
+import statistics
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from backend.services.base import LLMService
+from backend.pipeline.meeting_pipeline import analyze_transcript, PROCESSING_MODES, StageTimer
+
+
+class SimulatedLLMService(LLMService):
+    """Sleeps for a fixed latency per call and returns canned JSON."""
+
+    def __init__(self, latency: float):
+        self.latency = latency
+
+    def generate(self, prompt, system_prompt=None):
+        time.sleep(self.latency)
+        return "ok"
+
+    def generate_json(self, prompt, system_prompt=None):
+        time.sleep(self.latency)
+        tasks = [{"title": "Fix login bug", "owner": "Paarth", "deadline": "Friday"}]
+        summary = {
+            "title": "Sprint Sync",
+            "overview": "Team reviewed the sprint.",
+            "key_points": ["Login bug is blocking release"],
+            "decisions": [],
+            "action_items": ["Fix login bug"],
+            "next_steps": "Ship on Friday"
+        }
+        if system_prompt and '"summary"' in system_prompt:
+            return {"tasks": tasks, "summary": summary}
+        if system_prompt:
+            return tasks
+        return summary
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--latency", type=float, default=0.5, help="Seconds per simulated LLM call")
+    parser.add_argument("--runs", type=int, default=3)
+    args = parser.parse_args()
+
+    llm = SimulatedLLMService(args.latency)
+    transcript = "Paarth will fix the login bug by Friday."
+
+    print(f"⏱️  Simulated LLM latency: {args.latency}s, {args.runs} runs per mode\n")
+    baseline = None
+    for mode in PROCESSING_MODES:
+        durations = []
+        for _ in range(args.runs):
+            start = time.perf_counter()
+            analyze_transcript(llm, transcript, mode, StageTimer())
+            durations.append(time.perf_counter() - start)
+
+        mean = statistics.mean(durations)
+        baseline = baseline or mean
+        print(f"   {mode:<11} mean {mean:.3f}s  ({baseline / mean:.2f}x vs sequential)")
+
+
+if __name__ == "__main__":
+    main()
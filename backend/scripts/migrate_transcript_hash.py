@@ -0,0 +1,19 @@
+import sys
+import os
+
+# Add parent directory to path to import backend modules
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from backend.database import engine, Base, migrate_transcript_hash
+
+def migrate():
+    print("🔧 Migrating conversations.transcript_hash...")
+    try:
+        Base.metadata.create_all(bind=engine)
+        count = migrate_transcript_hash()
+        print(f"✅ Done. {count} conversations backfilled.")
+    except Exception as e:
+        print(f"❌ Migration failed: {e}")
+
+if __name__ == "__main__":
+    migrate()
@@ -1,5 +1,6 @@
+import asyncio
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
 
 
 class LLMService(ABC):
@@ -14,6 +15,18 @@ class LLMService(ABC):
     def generate_json(self, prompt: str, system_prompt: Optional[str] = None) -> Any:
         """Generate JSON response based on prompt."""
         pass
+    
+    def stream(self, prompt: str, system_prompt: Optional[str] = None) -> Iterator[str]:
+        """Stream text chunks. Default yields the full response as one chunk."""
+        yield self.generate(prompt, system_prompt)
+    
+    async def agenerate(self, prompt: str, system_prompt: Optional[str] = None) -> str:
+        """Async generate. Default runs the sync call in a worker thread."""
+        return await asyncio.to_thread(self.generate, prompt, system_prompt)
+    
+    async def agenerate_json(self, prompt: str, system_prompt: Optional[str] = None) -> Any:
+        """Async generate_json. Default runs the sync call in a worker thread."""
+        return await asyncio.to_thread(self.generate_json, prompt, system_prompt)
 
 
 class TaskStorageService(ABC):
@@ -61,3 +74,27 @@ class NotificationService(ABC):
     def send_notification(self, message: str, channel: str = None) -> bool:
         """Send a notification message."""
         pass
+
+
+class JobQueueService(ABC):
+    """Abstract base class for background job queues (e.g., in-process, Redis)."""
+    
+    @abstractmethod
+    def enqueue(self, payload: Dict[str, Any], user_id: Optional[int] = None) -> str:
+        """Create a queued job record and return its ID."""
+        pass
+    
+    @abstractmethod
+    def dequeue(self, timeout: float = 1.0) -> Optional[str]:
+        """Pop the next queued job ID, or None if nothing arrived within timeout."""
+        pass
+    
+    @abstractmethod
+    def get_job(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Retrieve a job record by ID."""
+        pass
+    
+    @abstractmethod
+    def update_job(self, job_id: str, updates: Dict[str, Any]) -> None:
+        """Merge updates into an existing job record."""
+        pass
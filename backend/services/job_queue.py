@@ -0,0 +1,230 @@
+"""
+Background Job Queue
+
+Runs long meeting pipelines outside the request thread. Jobs are stored in a
+pluggable backend (in-process by default, Redis when JOB_QUEUE_BACKEND=redis)
+and executed by a pool of in-process worker threads.
+"""
+import os
+import json
+import queue
+import threading
+import uuid
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Callable, Dict, Optional
+
+from backend.services.base import JobQueueService
+
+try:
+    import redis
+except ImportError:
+    redis = None
+
+
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_COMPLETED = "completed"
+JOB_FAILED = "failed"
+
+
+def _new_job(payload: Dict[str, Any], user_id: Optional[int]) -> Dict[str, Any]:
+    return {
+        "id": uuid.uuid4().hex,
+        "user_id": user_id,
+        "status": JOB_QUEUED,
+        "payload": payload,
+        "result": None,
+        "error": None,
+        "status_code": None,
+        "timings": {},
+        "progress": {},
+        "created_at": datetime.utcnow().isoformat(),
+        "started_at": None,
+        "finished_at": None,
+    }
+
+
+class InMemoryJobQueue(JobQueueService):
+    """Thread-safe, in-process job queue. Keeps the most recent `max_jobs` records."""
+
+    def __init__(self, max_jobs: int = 1000):
+        """
+        Initialize in-memory queue.
+
+        Args:
+            max_jobs: Number of job records retained before the oldest are evicted
+        """
+        self.max_jobs = max_jobs
+        self._jobs: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._queue: "queue.Queue[str]" = queue.Queue()
+        self._lock = threading.Lock()
+
+    def enqueue(self, payload: Dict[str, Any], user_id: Optional[int] = None) -> str:
+        job = _new_job(payload, user_id)
+        with self._lock:
+            self._jobs[job["id"]] = job
+            while len(self._jobs) > self.max_jobs:
+                self._jobs.popitem(last=False)
+        self._queue.put(job["id"])
+        return job["id"]
+
+    def dequeue(self, timeout: float = 1.0) -> Optional[str]:
+        try:
+            return self._queue.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+    def get_job(self, job_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            job = self._jobs.get(job_id)
+            return dict(job) if job else None
+
+    def update_job(self, job_id: str, updates: Dict[str, Any]) -> None:
+        with self._lock:
+            if job_id in self._jobs:
+                self._jobs[job_id].update(updates)
+
+
+class RedisJobQueue(JobQueueService):
+    """Redis-backed job queue. Works with any Redis-compatible server."""
+
+    def __init__(self, url: str, prefix: str = "meeting_jobs", ttl_seconds: int = 24 * 3600):
+        """
+        Initialize Redis queue.
+
+        Args:
+            url: Redis connection URL (e.g. redis://localhost:6379/0)
+            prefix: Key prefix for job records and the pending list
+            ttl_seconds: Expiry for job records
+        """
+        if redis is None:
+            raise ImportError("redis package is required for JOB_QUEUE_BACKEND=redis")
+        self.client = redis.Redis.from_url(url, decode_responses=True)
+        self.prefix = prefix
+        self.ttl_seconds = ttl_seconds
+        self.queue_key = f"{prefix}:queue"
+
+    def _job_key(self, job_id: str) -> str:
+        return f"{self.prefix}:{job_id}"
+
+    def enqueue(self, payload: Dict[str, Any], user_id: Optional[int] = None) -> str:
+        job = _new_job(payload, user_id)
+        self.client.set(self._job_key(job["id"]), json.dumps(job), ex=self.ttl_seconds)
+        self.client.lpush(self.queue_key, job["id"])
+        return job["id"]
+
+    def dequeue(self, timeout: float = 1.0) -> Optional[str]:
+        item = self.client.brpop(self.queue_key, timeout=max(1, int(timeout)))
+        return item[1] if item else None
+
+    def get_job(self, job_id: str) -> Optional[Dict[str, Any]]:
+        raw = self.client.get(self._job_key(job_id))
+        return json.loads(raw) if raw else None
+
+    def update_job(self, job_id: str, updates: Dict[str, Any]) -> None:
+        job = self.get_job(job_id)
+        if job is None:
+            return
+        job.update(updates)
+        self.client.set(self._job_key(job_id), json.dumps(job), ex=self.ttl_seconds)
+
+
+JobHandler = Callable[[Dict[str, Any], Dict[str, float]], Any]
+
+
+class JobWorkerPool:
+    """
+    Pool of daemon threads that pull jobs from a JobQueueService and run a handler.
+
+    The handler receives the job record and a timings dict it can fill with
+    per-stage durations; timings are persisted whether the job succeeds or fails.
+    Exceptions exposing `status_code`/`detail` (e.g. HTTPException) are stored as-is.
+    """
+
+    def __init__(self, job_queue: JobQueueService, handler: JobHandler, workers: int = 2):
+        self.job_queue = job_queue
+        self.handler = handler
+        self.workers = workers
+        self._threads = []
+        self._stop_event = threading.Event()
+
+    @property
+    def running(self) -> bool:
+        return any(t.is_alive() for t in self._threads)
+
+    def start(self) -> None:
+        """Start worker threads (no-op if already running)."""
+        if self.running:
+            return
+        self._stop_event.clear()
+        self._threads = [
+            threading.Thread(target=self._run, name=f"job-worker-{i}", daemon=True)
+            for i in range(self.workers)
+        ]
+        for t in self._threads:
+            t.start()
+        print(f"✅ Job workers started ({self.workers} threads)")
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Signal workers to exit after their current job."""
+        self._stop_event.set()
+        for t in self._threads:
+            t.join(timeout=timeout)
+        self._threads = []
+
+    def _run(self) -> None:
+        while not self._stop_event.is_set():
+            try:
+                job_id = self.job_queue.dequeue(timeout=1.0)
+            except Exception as e:
+                print(f"⚠️ Job queue unavailable: {e}")
+                self._stop_event.wait(1.0)
+                continue
+            if job_id:
+                self._execute(job_id)
+
+    def _execute(self, job_id: str) -> None:
+        job = self.job_queue.get_job(job_id)
+        if job is None:
+            return
+
+        self.job_queue.update_job(job_id, {
+            "status": JOB_RUNNING,
+            "started_at": datetime.utcnow().isoformat()
+        })
+        timings: Dict[str, float] = {}
+        try:
+            result = self.handler(job, timings)
+            self.job_queue.update_job(job_id, {
+                "status": JOB_COMPLETED,
+                "result": result,
+                "timings": timings,
+                "finished_at": datetime.utcnow().isoformat()
+            })
+        except Exception as e:
+            print(f"❌ Job {job_id} failed: {e}")
+            self.job_queue.update_job(job_id, {
+                "status": JOB_FAILED,
+                "error": str(getattr(e, "detail", e)),
+                "status_code": getattr(e, "status_code", 500),
+                "timings": timings,
+                "finished_at": datetime.utcnow().isoformat()
+            })
+
+
+_job_queue: Optional[JobQueueService] = None
+_job_queue_lock = threading.Lock()
+
+
+def get_job_queue() -> JobQueueService:
+    """Process-wide job queue, selected by JOB_QUEUE_BACKEND (memory|redis)."""
+    global _job_queue
+    with _job_queue_lock:
+        if _job_queue is None:
+            backend = os.getenv("JOB_QUEUE_BACKEND", "memory").lower()
+            if backend == "redis":
+                _job_queue = RedisJobQueue(os.getenv("REDIS_URL", "redis://localhost:6379/0"))
+            else:
+                _job_queue = InMemoryJobQueue()
+        return _job_queue
@@ -0,0 +1,181 @@
+"""
+Keyword Index
+
+Per-user inverted index over memory text with BM25 ranking. Terms are word
+tokens plus capitalized multi-word entities ("Amr Khan" -> "amr khan"), so
+names and phrases are looked up through a posting list instead of scanning
+every memory. Indexes are updated incrementally as memories are added.
+"""
+import os
+import re
+import json
+import math
+import hashlib
+import threading
+from collections import Counter, defaultdict
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+KEYWORD_INDEX_DIR = os.getenv("KEYWORD_INDEX_DIR", "data/keyword_index")
+BM25_K1 = 1.5
+BM25_B = 0.75
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+_ENTITY_RE = re.compile(r"\b[A-Z][\w'-]+(?:\s+[A-Z][\w'-]+)+")
+STOPWORDS = frozenset(
+    "a an and are as at be by did do does for from had has have he her his i in is it its "
+    "me my of on or our she that the their them they this to was we were what when where "
+    "which who why will with you your".split()
+)
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase word tokens without stopwords or single characters."""
+    return [t for t in _TOKEN_RE.findall((text or "").lower()) if len(t) > 1 and t not in STOPWORDS]
+
+
+def index_terms(text: str) -> List[str]:
+    """Tokens plus lowercased capitalized entity phrases."""
+    entities = [" ".join(tokenize(match)) for match in _ENTITY_RE.findall(text or "")]
+    return tokenize(text) + [e for e in entities if " " in e]
+
+
+def metadata_filters(filters: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """Accept Mem0-style {"metadata": {...}} or flat filters; user_id is implied by the index."""
+    if not filters:
+        return {}
+    flat = dict(filters.get("metadata") or {})
+    flat.update({k: v for k, v in filters.items() if k not in ("metadata", "user_id")})
+    return flat
+
+
+def matches_filters(metadata: Dict[str, Any], filters: Dict[str, Any]) -> bool:
+    # Compare as strings: conversation_id may round-trip through JSON as int or str
+    return all(str(metadata.get(key)) == str(value) for key, value in filters.items())
+
+
+class InvertedIndex:
+    """term -> {doc: term frequency} with document lengths for BM25."""
+
+    def __init__(self):
+        self.postings: Dict[str, Dict[int, int]] = defaultdict(dict)
+        self.doc_lengths: List[int] = []
+        self.docs: List[Tuple[str, Dict[str, Any]]] = []
+        self.total_length = 0
+        self._seen: set = set()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.docs)
+
+    def add(self, text: str, metadata: Optional[Dict[str, Any]] = None) -> bool:
+        """Index a document. Returns False if the same text is already indexed."""
+        digest = hashlib.sha1((text or "").encode("utf-8")).digest()
+        counts = Counter(index_terms(text))
+        with self._lock:
+            if digest in self._seen:
+                return False
+            self._seen.add(digest)
+            doc = len(self.docs)
+            self.docs.append((text, metadata or {}))
+            length = sum(counts.values())
+            self.doc_lengths.append(length)
+            self.total_length += length
+            for term, tf in counts.items():
+                self.postings[term][doc] = tf
+        return True
+
+    def search(self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None) -> List[Tuple[float, str]]:
+        """Top-`limit` (BM25 score, text) for the query terms."""
+        terms = set(index_terms(query))
+        filters = metadata_filters(filters)
+        with self._lock:
+            count = len(self.docs)
+            if not count or not terms:
+                return []
+            average_length = self.total_length / count
+            scores: Dict[int, float] = defaultdict(float)
+            for term in terms:
+                posting = self.postings.get(term)
+                if not posting:
+                    continue
+                idf = math.log(1 + (count - len(posting) + 0.5) / (len(posting) + 0.5))
+                for doc, tf in posting.items():
+                    norm = BM25_K1 * (1 - BM25_B + BM25_B * self.doc_lengths[doc] / average_length)
+                    scores[doc] += idf * tf * (BM25_K1 + 1) / (tf + norm)
+            docs = self.docs
+
+        ranked = sorted(scores.items(), key=lambda item: (-item[1], item[0]))
+        results = []
+        for doc, score in ranked:
+            text, metadata = docs[doc]
+            if filters and not matches_filters(metadata, filters):
+                continue
+            results.append((score, text))
+            if len(results) >= limit:
+                break
+        return results
+
+
+class KeywordIndexStore:
+    """Per-user InvertedIndexes persisted as append-only JSONL files."""
+
+    def __init__(self, root: str = KEYWORD_INDEX_DIR):
+        self.root = root
+        self._indexes: Dict[str, InvertedIndex] = {}
+        self._lock = threading.Lock()
+
+    def _path(self, user_id: str) -> str:
+        return os.path.join(self.root, hashlib.sha256(user_id.encode("utf-8")).hexdigest()[:16] + ".jsonl")
+
+    def is_seeded(self, user_id: str) -> bool:
+        return os.path.exists(self._path(user_id) + ".seeded")
+
+    def index_for(self, user_id: str) -> InvertedIndex:
+        with self._lock:
+            index = self._indexes.get(user_id)
+            if index is None:
+                index = InvertedIndex()
+                path = self._path(user_id)
+                if os.path.exists(path):
+                    with open(path, "r", encoding="utf-8") as f:
+                        for line in f:
+                            if line.strip():
+                                record = json.loads(line)
+                                index.add(record["text"], record.get("metadata"))
+                self._indexes[user_id] = index
+            return index
+
+    def add(self, user_id: str, text: str, metadata: Optional[Dict[str, Any]] = None) -> None:
+        index = self.index_for(user_id)
+        if index.add(text, metadata):
+            os.makedirs(self.root, exist_ok=True)
+            with self._lock, open(self._path(user_id), "a", encoding="utf-8") as f:
+                f.write(json.dumps({"text": text, "metadata": metadata or {}}) + "\n")
+
+    def seed(self, user_id: str, load: Callable[[], List[Any]]) -> None:
+        """
+        Backfill a user's index once from memories stored before it existed
+        (texts or {"text", "metadata"}). Already indexed texts are skipped.
+        """
+        if self.is_seeded(user_id):
+            return
+        for item in load():
+            if isinstance(item, dict):
+                self.add(user_id, item.get("text", ""), item.get("metadata"))
+            else:
+                self.add(user_id, item)
+        os.makedirs(self.root, exist_ok=True)
+        open(self._path(user_id) + ".seeded", "a").close()
+
+
+_keyword_store: Optional[KeywordIndexStore] = None
+_keyword_store_lock = threading.Lock()
+
+
+def get_keyword_store() -> KeywordIndexStore:
+    """Process-wide keyword index store."""
+    global _keyword_store
+    with _keyword_store_lock:
+        if _keyword_store is None:
+            _keyword_store = KeywordIndexStore()
+        return _keyword_store
@@ -0,0 +1,136 @@
+"""
+LLM Response Cache
+
+Content-addressed cache for LLM responses, stored in SQLite. Entries are keyed
+by a SHA-256 of (model, system_prompt, prompt, generation_config), expire after
+a TTL, and the least recently used entries are evicted beyond `max_entries`.
+"""
+import os
+import json
+import time
+import sqlite3
+import hashlib
+import threading
+from typing import Any, Dict, Optional
+
+
+class LLMResponseCache:
+    """SQLite-backed response cache with TTL, LRU size bound and hit/miss counters."""
+
+    def __init__(self, path: str = "data/llm_cache.sqlite3", ttl_seconds: int = 7 * 24 * 3600,
+                 max_entries: int = 5000):
+        """
+        Initialize cache.
+
+        Args:
+            path: SQLite file path (":memory:" for a process-local cache)
+            ttl_seconds: Entry lifetime
+            max_entries: Maximum number of stored responses
+        """
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+        if path != ":memory:" and os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            """CREATE TABLE IF NOT EXISTS llm_responses (
+                key TEXT PRIMARY KEY,
+                model TEXT,
+                response TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            )"""
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS ix_llm_responses_accessed ON llm_responses (accessed_at)")
+        self._conn.commit()
+
+    @staticmethod
+    def make_key(model: str, system_prompt: Optional[str], prompt: str,
+                 generation_config: Optional[Dict[str, Any]] = None) -> str:
+        """Hash the full request so identical calls share an entry."""
+        payload = json.dumps([model, system_prompt, prompt, generation_config], sort_keys=True)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached response, or None on miss/expiry."""
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT response, created_at FROM llm_responses WHERE key = ?", (key,)
+            ).fetchone()
+
+            if row is None or now - row[1] > self.ttl_seconds:
+                if row is not None:
+                    self._conn.execute("DELETE FROM llm_responses WHERE key = ?", (key,))
+                    self._conn.commit()
+                self.misses += 1
+                return None
+
+            self._conn.execute("UPDATE llm_responses SET accessed_at = ? WHERE key = ?", (now, key))
+            self._conn.commit()
+            self.hits += 1
+            return row[0]
+
+    def set(self, key: str, response: str, model: Optional[str] = None) -> None:
+        """Store a response and evict expired / least recently used entries."""
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO llm_responses (key, model, response, created_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (key, model, response, now, now)
+            )
+            self._conn.execute("DELETE FROM llm_responses WHERE created_at < ?", (now - self.ttl_seconds,))
+            self._conn.execute(
+                "DELETE FROM llm_responses WHERE key IN ("
+                "SELECT key FROM llm_responses ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,)
+            )
+            self._conn.commit()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM llm_responses")
+            self._conn.commit()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters and current size."""
+        with self._lock:
+            entries = self._conn.execute("SELECT COUNT(*) FROM llm_responses").fetchone()[0]
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total, 3) if total else 0.0,
+            "entries": entries
+        }
+
+
+_response_cache: Optional[LLMResponseCache] = None
+_response_cache_lock = threading.Lock()
+
+
+def get_response_cache() -> Optional[LLMResponseCache]:
+    """Process-wide response cache, or None when LLM_CACHE_ENABLED is false."""
+    global _response_cache
+    if os.getenv("LLM_CACHE_ENABLED", "true").lower() in ("0", "false", "no"):
+        return None
+    with _response_cache_lock:
+        if _response_cache is None:
+            try:
+                _response_cache = LLMResponseCache(
+                    path=os.getenv("LLM_CACHE_PATH", "data/llm_cache.sqlite3"),
+                    ttl_seconds=int(os.getenv("LLM_CACHE_TTL_SECONDS", str(7 * 24 * 3600))),
+                    max_entries=int(os.getenv("LLM_CACHE_MAX_ENTRIES", "5000"))
+                )
+            except Exception as e:
+                print(f"⚠️ LLM response cache disabled: {e}")
+                return None
+        return _response_cache
@@ -1,54 +1,243 @@
 import os
 import json
+import threading
 import warnings
+from collections import OrderedDict
 
 # Suppress Gemini deprecation warning BEFORE import
 warnings.filterwarnings("ignore", category=DeprecationWarning)
 warnings.filterwarnings("ignore", category=FutureWarning)
 warnings.filterwarnings("ignore", message=".*google.generativeai.*")
 
-from typing import Any, Optional
+from typing import Any, Dict, Iterator, Optional, Tuple
 import google.generativeai as genai
 from backend.services.base import LLMService
+from backend.services.llm_cache import LLMResponseCache, get_response_cache
+
+
+JSON_GENERATION_CONFIG = {"response_mime_type": "application/json"}
+
+
+class GenerativeModelCache:
+    """
+    Process-wide LRU cache of genai.GenerativeModel handles.
+
+    Keyed by (api_key, model_name, system_prompt, generation_config). The API key
+    is part of the key because genai clients bind to the key configured when
+    they are first used.
+
+    Each model is bound to sync and async GenerativeService clients for its own
+    key through GenerativeModel._client / _async_client. These are private
+    attributes of google-generativeai (checked against 0.8.x); if they go away
+    the model falls back to the global genai.configure() key.
+    """
+
+    def __init__(self, max_size: int = 32):
+        self.max_size = max_size
+        self._models: "OrderedDict[tuple, genai.GenerativeModel]" = OrderedDict()
+        self._clients: Dict[str, Optional[Tuple[Any, Any]]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, api_key: str, model_name: str, system_prompt: Optional[str] = None,
+            generation_config: Optional[Dict[str, Any]] = None) -> "genai.GenerativeModel":
+        """Return a cached model handle, constructing it on first use."""
+        config_key = json.dumps(generation_config, sort_keys=True) if generation_config else None
+        key = (api_key, model_name, system_prompt, config_key)
+
+        with self._lock:
+            model = self._models.get(key)
+            if model is not None:
+                self._models.move_to_end(key)
+                self.hits += 1
+                return model
+            self.misses += 1
+
+        model = genai.GenerativeModel(
+            model_name=model_name,
+            system_instruction=system_prompt,
+            generation_config=generation_config
+        )
+        # genai binds a model to whatever key was configured globally when it is
+        # first used; with long-lived per-user services that may be another
+        # user's key, so bind both the sync (generate_content) and async
+        # (generate_content_async) clients for its own key up front.
+        clients = self._get_clients(api_key)
+        if clients is not None:
+            model._client, model._async_client = clients
+
+        with self._lock:
+            self._models[key] = model
+            self._models.move_to_end(key)
+            while len(self._models) > self.max_size:
+                self._models.popitem(last=False)
+        return model
+
+    def _get_clients(self, api_key: str):
+        """One (sync, async) GenerativeService client pair per API key (shared connections)."""
+        with self._lock:
+            if api_key in self._clients:
+                return self._clients[api_key]
+        try:
+            from google.ai import generativelanguage as glm
+            options = {"api_key": api_key}
+            clients = (glm.GenerativeServiceClient(client_options=options),
+                       glm.GenerativeServiceAsyncClient(client_options=options))
+        except Exception as e:
+            print(f"⚠️ Could not create per-key Gemini clients, using global config: {e}")
+            clients = None
+        with self._lock:
+            return self._clients.setdefault(api_key, clients)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._models.clear()
+            self._clients.clear()
+
+
+model_cache = GenerativeModelCache(max_size=int(os.getenv("GEMINI_MODEL_CACHE_SIZE", "32")))
 
 
 class GeminiLLMService(LLMService):
     """Gemini-based LLM service implementation."""
     
-    def __init__(self, api_key: str, model_name: str = "gemini-2.5-flash-lite"):
+    def __init__(self, api_key: str, model_name: str = "gemini-2.5-flash-lite",
+                 response_cache: Optional[LLMResponseCache] = None):
         """
         Initialize Gemini service.
         
         Args:
             api_key: Gemini API key
             model_name: Model to use (default: gemini-2.5-flash-lite)
+            response_cache: Response cache (default: process-wide cache from env)
         """
         self.api_key = api_key
         self.model_name = model_name
+        self.response_cache = response_cache if response_cache is not None else get_response_cache()
         genai.configure(api_key=api_key)
     
-    def generate(self, prompt: str, system_prompt: Optional[str] = None) -> str:
-        """Generate text response from Gemini."""
-        model = genai.GenerativeModel(
-            model_name=self.model_name,
-            system_instruction=system_prompt
-        )
-        
-        response = model.generate_content(prompt)
-        return response.text
-    
-    def generate_json(self, prompt: str, system_prompt: Optional[str] = None) -> Any:
-        """Generate JSON response from Gemini."""
-        model = genai.GenerativeModel(
-            model_name=self.model_name,
-            system_instruction=system_prompt,
-            # Force JSON mode if supported by model version
-            generation_config={"response_mime_type": "application/json"}
-        )
-        
-        response = model.generate_content(prompt)
+    def _get_model(self, system_prompt: Optional[str] = None,
+                   generation_config: Optional[Dict[str, Any]] = None) -> "genai.GenerativeModel":
+        return model_cache.get(self.api_key, self.model_name, system_prompt, generation_config)
+
+    def _cache_key(self, prompt: str, system_prompt: Optional[str],
+                   generation_config: Optional[Dict[str, Any]], use_cache: bool) -> Optional[str]:
+        if not use_cache or self.response_cache is None:
+            return None
+        return LLMResponseCache.make_key(self.model_name, system_prompt, prompt, generation_config)
+
+    def _lookup(self, key: Optional[str]) -> Optional[str]:
+        return self.response_cache.get(key) if key else None
+
+    def _store(self, key: Optional[str], text: str) -> None:
+        if key and text:
+            self.response_cache.set(key, text, model=self.model_name)
+
+    def _complete(self, prompt: str, system_prompt: Optional[str] = None,
+                  generation_config: Optional[Dict[str, Any]] = None, use_cache: bool = True) -> str:
+        key = self._cache_key(prompt, system_prompt, generation_config, use_cache)
+        cached = self._lookup(key)
+        if cached is not None:
+            return cached
+
+        response = self._get_model(system_prompt, generation_config).generate_content(prompt)
         text = response.text
-        
+
+        # JSON output is cached by generate_json() only once it parses
+        if generation_config != JSON_GENERATION_CONFIG:
+            self._store(key, text)
+        return text
+
+    async def _acomplete(self, prompt: str, system_prompt: Optional[str] = None,
+                         generation_config: Optional[Dict[str, Any]] = None, use_cache: bool = True) -> str:
+        key = self._cache_key(prompt, system_prompt, generation_config, use_cache)
+        cached = self._lookup(key)
+        if cached is not None:
+            return cached
+
+        response = await self._get_model(system_prompt, generation_config).generate_content_async(prompt)
+        text = response.text
+
+        if generation_config != JSON_GENERATION_CONFIG:
+            self._store(key, text)
+        return text
+
+    def generate(self, prompt: str, system_prompt: Optional[str] = None, use_cache: bool = True) -> str:
+        """Generate text response from Gemini. Pass use_cache=False to bypass the response cache."""
+        return self._complete(prompt, system_prompt, use_cache=use_cache)
+
+    def stream(self, prompt: str, system_prompt: Optional[str] = None, use_cache: bool = True) -> Iterator[str]:
+        """
+        Stream a text response from Gemini chunk by chunk.
+
+        A cached response is yielded as a single chunk. Only a stream that
+        finished normally is written to the cache: one cut short by a safety
+        block, or abandoned by the caller (client disconnect closes the
+        generator at a yield), is not.
+        """
+        key = self._cache_key(prompt, system_prompt, None, use_cache)
+        cached = self._lookup(key)
+        if cached is not None:
+            yield cached
+            return
+
+        parts, chunk = [], None
+        for chunk in self._get_model(system_prompt).generate_content(prompt, stream=True):
+            try:
+                text = chunk.text
+            except ValueError:
+                # Chunks without text parts (e.g. safety/finish metadata)
+                continue
+            if text:
+                parts.append(text)
+                yield text
+
+        if chunk is not None and self._finished(chunk):
+            self._store(key, "".join(parts))
+
+    @staticmethod
+    def _finished(chunk: Any) -> bool:
+        """True if the last streamed chunk ended with FinishReason.STOP."""
+        try:
+            return chunk.candidates[0].finish_reason == genai.protos.Candidate.FinishReason.STOP
+        except (AttributeError, IndexError):
+            return False
+
+    def generate_json(self, prompt: str, system_prompt: Optional[str] = None, use_cache: bool = True) -> Any:
+        """Generate JSON response from Gemini. Pass use_cache=False to bypass the response cache."""
+        key = self._cache_key(prompt, system_prompt, JSON_GENERATION_CONFIG, use_cache)
+        cached = self._lookup(key)
+        if cached is not None:
+            return self._parse_json(cached)
+
+        # Force JSON mode if supported by model version
+        text = self._complete(prompt, system_prompt, JSON_GENERATION_CONFIG, use_cache=False)
+        result = self._parse_json(text)
+        # Unparseable output is not cached, so the next call retries the model
+        if result:
+            self._store(key, text)
+        return result
+
+    async def agenerate(self, prompt: str, system_prompt: Optional[str] = None, use_cache: bool = True) -> str:
+        """Generate text response from Gemini without blocking the event loop."""
+        return await self._acomplete(prompt, system_prompt, use_cache=use_cache)
+
+    async def agenerate_json(self, prompt: str, system_prompt: Optional[str] = None, use_cache: bool = True) -> Any:
+        """Generate JSON response from Gemini without blocking the event loop."""
+        key = self._cache_key(prompt, system_prompt, JSON_GENERATION_CONFIG, use_cache)
+        cached = self._lookup(key)
+        if cached is not None:
+            return self._parse_json(cached)
+
+        text = await self._acomplete(prompt, system_prompt, JSON_GENERATION_CONFIG, use_cache=False)
+        result = self._parse_json(text)
+        if result:
+            self._store(key, text)
+        return result
+
+    def _parse_json(self, text: str) -> Any:
+        """Parse model output into JSON, tolerating code fences and single quotes."""
         # 1. Remove Markdown code blocks
         if "```" in text:
             import re
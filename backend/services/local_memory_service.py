@@ -0,0 +1,263 @@
+"""
+Local Memory Service
+
+Offline semantic memory with the same interface as Mem0Service
+(add_memory / search_memory / get_all_memories). Each memory is embedded as a
+hashed TF-IDF vector (unigrams + bigrams hashed into a fixed number of
+buckets); vectors live in a per-user memory-mapped float32 matrix and are
+ranked with one vectorized cosine pass plus a partial sort for top-k.
+
+On disk, per user:
+    <root>/<user hash>/vectors.f32     raw row-major matrix (capacity x dim)
+    <root>/<user hash>/records.jsonl   one {"text", "metadata", ...} per row
+"""
+import os
+import json
+import time
+import zlib
+import hashlib
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from backend.services.keyword_index import InvertedIndex, metadata_filters, tokenize
+
+LOCAL_MEMORY_DIR = os.getenv("LOCAL_MEMORY_DIR", "data/local_memory")
+LOCAL_MEMORY_DIM = int(os.getenv("LOCAL_MEMORY_DIM", "4096"))
+INITIAL_CAPACITY = 64
+
+
+def hash_features(text: str, dim: int = LOCAL_MEMORY_DIM) -> np.ndarray:
+    """Sublinear term-frequency vector of hashed unigrams and bigrams."""
+    tokens = tokenize(text)
+    features = tokens + [f"{a} {b}" for a, b in zip(tokens, tokens[1:])]
+    vector = np.zeros(dim, dtype=np.float32)
+    if not features:
+        return vector
+    buckets = np.fromiter((zlib.crc32(f.encode("utf-8")) % dim for f in features), dtype=np.int64,
+                          count=len(features))
+    counts = np.bincount(buckets, minlength=dim).astype(np.float32)
+    nonzero = counts > 0
+    vector[nonzero] = 1.0 + np.log(counts[nonzero])
+    return vector
+
+
+class UserMemoryStore:
+    """One user's memories: memory-mapped vectors, records, document frequencies and a keyword index."""
+
+    def __init__(self, directory: str, dim: int = LOCAL_MEMORY_DIM):
+        self.directory = directory
+        self.dim = dim
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+        self._vectors_path = os.path.join(directory, "vectors.f32")
+        self._records_path = os.path.join(directory, "records.jsonl")
+
+        self.records: List[Dict[str, Any]] = []
+        if os.path.exists(self._records_path):
+            with open(self._records_path, "r", encoding="utf-8") as f:
+                self.records = [json.loads(line) for line in f if line.strip()]
+
+        capacity = max(INITIAL_CAPACITY, len(self.records))
+        if os.path.exists(self._vectors_path):
+            capacity = max(capacity, os.path.getsize(self._vectors_path) // (4 * dim))
+        self._open(capacity)
+
+        # Rows in use; the per-row metadata columns share the matrix's capacity and grow with it
+        self.count = len(self.records)
+        self.doc_freq = np.count_nonzero(self._matrix[:self.count], axis=0).astype(np.float32)
+        self.conversation_ids = np.full(self._matrix.shape[0], -1, dtype=np.int64)
+        self.conversation_ids[:self.count] = [self._conversation_id(r) for r in self.records]
+        self.meeting_dates = np.full(self._matrix.shape[0], "", dtype=object)
+        self.meeting_dates[:self.count] = [str(r["metadata"].get("meeting_date", "")) for r in self.records]
+        self.keywords = InvertedIndex()
+        for record in self.records:
+            self.keywords.add(record["text"], record["metadata"])
+
+    @staticmethod
+    def _conversation_id(record: Dict[str, Any]) -> int:
+        try:
+            return int(record["metadata"].get("conversation_id"))
+        except (TypeError, ValueError):
+            return -1
+
+    def _open(self, capacity: int) -> None:
+        """(Re)map the vector file with room for `capacity` rows, growing it if needed."""
+        size = capacity * self.dim * 4
+        with open(self._vectors_path, "ab") as f:
+            if f.tell() < size:
+                f.truncate(size)
+        self._matrix = np.memmap(self._vectors_path, dtype=np.float32, mode="r+", shape=(capacity, self.dim))
+
+    def _grow(self) -> None:
+        """Double the capacity of the vector file and the metadata columns (amortized O(1) adds)."""
+        capacity = self._matrix.shape[0] * 2
+        self._matrix.flush()
+        self._open(capacity)
+        # Fresh arrays: snapshots taken before the resize keep their old, still valid views
+        conversation_ids = np.full(capacity, -1, dtype=np.int64)
+        conversation_ids[:self.count] = self.conversation_ids[:self.count]
+        meeting_dates = np.full(capacity, "", dtype=object)
+        meeting_dates[:self.count] = self.meeting_dates[:self.count]
+        self.conversation_ids, self.meeting_dates = conversation_ids, meeting_dates
+
+    def add(self, text: str, metadata: Dict[str, Any]) -> int:
+        vector = hash_features(text, self.dim)
+        record = {"text": text, "metadata": metadata, "created_at": time.time()}
+        with self._lock:
+            row = self.count
+            if row >= self._matrix.shape[0]:
+                self._grow()
+            # Vector first: a crash before the record line leaves an unused row, never a dangling record
+            self._matrix[row] = vector
+            self._matrix.flush()
+            with open(self._records_path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(record) + "\n")
+
+            self.records.append(record)
+            self.doc_freq += vector > 0
+            self.conversation_ids[row] = self._conversation_id(record)
+            self.meeting_dates[row] = str(metadata.get("meeting_date", ""))
+            self.count = row + 1
+        self.keywords.add(text, metadata)
+        return row
+
+    def _snapshot(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, List[Dict[str, Any]]]:
+        """Consistent views for lock-free scoring (rows are append-only)."""
+        with self._lock:
+            count = self.count
+            return (self._matrix[:count], self.doc_freq.copy(), self.conversation_ids[:count],
+                    self.meeting_dates[:count], self.records[:count])
+
+    def _mask(self, filters: Dict[str, Any], conversation_ids: np.ndarray,
+              meeting_dates: np.ndarray, records: List[Dict[str, Any]]) -> np.ndarray:
+        mask = np.ones(len(records), dtype=bool)
+        for key, value in filters.items():
+            if key == "conversation_id":
+                try:
+                    mask &= conversation_ids == int(value)
+                except (TypeError, ValueError):
+                    mask[:] = False
+            elif key == "meeting_date":
+                mask &= meeting_dates == str(value)
+            else:
+                mask &= np.fromiter((r["metadata"].get(key) == value for r in records), dtype=bool,
+                                    count=len(records))
+        return mask
+
+    def search(self, query: str, filters: Dict[str, Any], limit: int) -> List[Tuple[float, Dict[str, Any]]]:
+        """Top-`limit` (score, record) pairs by TF-IDF cosine similarity."""
+        matrix, doc_freq, conversation_ids, meeting_dates, records = self._snapshot()
+        if not records:
+            return []
+
+        query_vector = hash_features(query, self.dim)
+        if not query_vector.any():
+            return []
+
+        idf = np.log((1.0 + len(records)) / (1.0 + doc_freq)) + 1.0
+        weights = idf * idf
+        weighted_query = query_vector * weights
+        # cos(d, q) over idf-weighted vectors: (d . q*idf^2) / (|d*idf| |q*idf|)
+        dots = matrix @ weighted_query
+        row_norms = np.sqrt(np.einsum("ij,ij,j->i", matrix, matrix, weights))
+        query_norm = float(np.sqrt(query_vector @ weighted_query))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            scores = np.where(row_norms > 0, dots / (row_norms * query_norm), 0.0)
+
+        scores[~self._mask(filters, conversation_ids, meeting_dates, records)] = -1.0
+        candidates = np.flatnonzero(scores > 0)
+        if candidates.size > limit:
+            candidates = candidates[np.argpartition(-scores[candidates], limit - 1)[:limit]]
+        ranked = candidates[np.argsort(-scores[candidates], kind="stable")]
+        return [(float(scores[i]), records[i]) for i in ranked]
+
+    def all(self, filters: Dict[str, Any], limit: Optional[int]) -> List[Dict[str, Any]]:
+        """Matching records, newest first."""
+        _, _, conversation_ids, meeting_dates, records = self._snapshot()
+        mask = self._mask(filters, conversation_ids, meeting_dates, records)
+        matched = [records[i] for i in np.flatnonzero(mask)[::-1]]
+        return matched[:limit] if limit else matched
+
+
+class LocalMemoryService:
+    """Drop-in, offline replacement for Mem0Service backed by per-user vector stores."""
+
+    def __init__(self, root: str = LOCAL_MEMORY_DIR, dim: int = LOCAL_MEMORY_DIM):
+        """
+        Args:
+            root: Directory holding one sub-directory per user
+            dim: Number of hash buckets per vector
+        """
+        self.root = root
+        self.dim = dim
+        self.client = self  # Callers check `mem0.client` before using the service
+        self._stores: Dict[str, UserMemoryStore] = {}
+        self._stores_lock = threading.Lock()
+
+    def _store(self, user_id: str) -> UserMemoryStore:
+        with self._stores_lock:
+            store = self._stores.get(user_id)
+            if store is None:
+                folder = hashlib.sha256(user_id.encode("utf-8")).hexdigest()[:16]
+                store = UserMemoryStore(os.path.join(self.root, folder), self.dim)
+                self._stores[user_id] = store
+            return store
+
+    def add_memory(self, text: str, user_id: str = "default_user", session_id: str = None,
+                   metadata: Dict[str, Any] = None):
+        """Add a memory item."""
+        try:
+            metadata = dict(metadata or {})
+            metadata["user_id"] = user_id
+            if session_id:
+                metadata["session_id"] = session_id
+            self._store(user_id).add(text, metadata)
+            print(f"🧠 Added to local memory for {user_id}")
+        except Exception as e:
+            print(f"❌ Failed to add local memory: {e}")
+
+    def search_memory(self, query: str, user_id: str = "default_user", filters: Dict[str, Any] = None,
+                      limit: int = 5) -> List[str]:
+        """Semantic search over the user's memories."""
+        try:
+            results = self._store(user_id).search(query, metadata_filters(filters), limit)
+            return [record["text"] for _, record in results]
+        except Exception as e:
+            print(f"⚠️ Local memory search failed: {e}")
+            return []
+
+    def keyword_search(self, query: str, user_id: str = "default_user", filters: Dict[str, Any] = None,
+                       limit: int = 5) -> List[str]:
+        """BM25 search over the user's keyword index."""
+        try:
+            return [text for _, text in self._store(user_id).keywords.search(query, limit, filters)]
+        except Exception as e:
+            print(f"⚠️ Local keyword search failed: {e}")
+            return []
+
+    def get_all_memories(self, user_id: str = "default_user", filters: dict = None, limit: int = 100) -> List[str]:
+        """Retrieve history (newest first)."""
+        try:
+            return [record["text"] for record in self._store(user_id).all(metadata_filters(filters), limit)]
+        except Exception as e:
+            print(f"Failed to get local history: {e}")
+            return []
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Writes are synchronous; present for parity with Mem0Service."""
+        return True
+
+
+_local_memory: Optional[LocalMemoryService] = None
+_local_memory_lock = threading.Lock()
+
+
+def get_local_memory() -> LocalMemoryService:
+    """Process-wide local memory service (one store per user, shared by all callers)."""
+    global _local_memory
+    with _local_memory_lock:
+        if _local_memory is None:
+            _local_memory = LocalMemoryService()
+        return _local_memory
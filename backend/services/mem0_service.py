@@ -1,5 +1,8 @@
 import os
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
+
+from backend.services.keyword_index import get_keyword_store
+from backend.services.memory_spool import account_key, get_memory_writer, get_spool
 
 try:
     from mem0 import MemoryClient
@@ -11,6 +14,9 @@ class Mem0Service:
 
     def __init__(self, api_key: str = None):
         """Initialize Mem0 client."""
+        # Writes are spooled and flushed in the background (None = synchronous)
+        self.writer = None
+
         if not api_key:
             print("⚠️ MEM0_API_KEY not provided. Memory features disabled.")
             self.client = None
@@ -28,9 +34,12 @@ class Mem0Service:
         except Exception as e:
             print(f"❌ Failed to initialize Mem0 client: {e}")
             self.client = None
+            return
+
+        self.writer = get_memory_writer(api_key, self._send)
 
     def add_memory(self, text: str, user_id: str = "default_user", session_id: str = None, metadata: Dict[str, Any] = None):
-        """Add a memory item."""
+        """Add a memory item (queued; returns before Mem0 is called)."""
         if not self.client:
             return
             
@@ -53,12 +62,31 @@ class Mem0Service:
                 # But recent Mem0 supports session_id
                 add_kwargs["metadata"]["session_id"] = session_id
 
-            print(f"🔍 DEBUG: Adding to Mem0: UserID='{user_id}', SessionID='{session_id}', Metadata={metadata}")
-            self.client.add(text, **add_kwargs)
+            # Keep the local keyword index current without waiting for Mem0
+            get_keyword_store().add(user_id, text, metadata)
+
+            payload = {"text": text, **add_kwargs}
+            if self.writer is not None:
+                self.writer.enqueue(payload)
+                print(f"🧠 Queued Mem0 write for {user_id} (session '{session_id}')")
+                return
+
+            self._send(payload)
             print(f"🧠 Added to Mem0 for {user_id}")
         except Exception as e:
             print(f"❌ Failed to add memory: {e}")
 
+    def _send(self, payload: Dict[str, Any]):
+        """Write one spooled payload to Mem0 (raises so the writer can retry)."""
+        print(f"🔍 DEBUG: Adding to Mem0: UserID='{payload['user_id']}', Metadata={payload['metadata']}")
+        return self.client.add(payload["text"], user_id=payload["user_id"], metadata=payload["metadata"])
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Block until queued writes reach Mem0. Returns False on timeout."""
+        if self.writer is None:
+            return True
+        return self.writer.flush(timeout)
+
     def search_memory(self, query: str, user_id: str = "default_user", filters: Dict[str, Any] = None, limit: int = 5):
         """Search memories."""
         if not self.client:
@@ -128,6 +156,20 @@ class Mem0Service:
             print(f"⚠️ Memory search failed: {e}")
             return []
 
+    def keyword_search(self, query: str, user_id: str = "default_user", filters: Dict[str, Any] = None,
+                       limit: int = 5) -> List[str]:
+        """BM25 search over the local keyword index of this user's memories."""
+        if not self.client:
+            return []
+        try:
+            store = get_keyword_store()
+            # Memories added before the index existed are pulled from Mem0 once
+            store.seed(user_id, lambda: self.get_all_memories(user_id=user_id, limit=1000))
+            return [text for _, text in store.index_for(user_id).search(query, limit, filters)]
+        except Exception as e:
+            print(f"⚠️ Keyword search failed: {e}")
+            return []
+
     def get_all_memories(self, user_id: str = "default_user", filters: dict = None, limit: int = 100) -> List[str]:
         """Retrieve history."""
         if not self.client:
@@ -183,3 +225,33 @@ class Mem0Service:
         except Exception as e:
             print(f"Failed to get history: {e}")
             return []
+
+
+def resume_spooled_memories() -> None:
+    """Start the writer for MEM0_API_KEY if the spool still holds writes from a previous run."""
+    api_key = os.getenv("MEM0_API_KEY")
+    if not api_key or MemoryClient is None:
+        return
+    try:
+        if get_spool().pending(account_key(api_key)):
+            Mem0Service(api_key=api_key)
+    except Exception as e:
+        print(f"⚠️ Could not resume spooled Mem0 writes: {e}")
+
+
+def create_memory_service(api_key: str = None):
+    """
+    Memory backend selected by MEMORY_BACKEND:
+      - "mem0": Mem0 managed platform only
+      - "local": offline vector index (LocalMemoryService)
+      - "auto" (default): Mem0 when it is configured and reachable, local otherwise
+    """
+    backend = os.getenv("MEMORY_BACKEND", "auto").lower()
+    if backend != "local":
+        mem0 = Mem0Service(api_key=api_key)
+        if mem0.client or backend == "mem0":
+            return mem0
+        print("🧠 Falling back to local memory index")
+
+    from backend.services.local_memory_service import get_local_memory
+    return get_local_memory()
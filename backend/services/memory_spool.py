@@ -0,0 +1,269 @@
+"""
+Mem0 Write-Behind Queue
+
+Memories are appended to a durable SQLite spool and acknowledged to the
+caller immediately; a background writer per Mem0 account drains the spool in
+batches, retrying failures with exponential backoff. Anything still spooled
+at shutdown is sent when the next writer for that account starts.
+"""
+import os
+import json
+import time
+import sqlite3
+import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+MEM0_SPOOL_PATH = os.getenv("MEM0_SPOOL_PATH", "data/mem0_spool.sqlite3")
+MEM0_BATCH_SIZE = int(os.getenv("MEM0_BATCH_SIZE", "20"))
+MEM0_FLUSH_INTERVAL = float(os.getenv("MEM0_FLUSH_INTERVAL", "0.5"))
+MEM0_WRITE_CONCURRENCY = int(os.getenv("MEM0_WRITE_CONCURRENCY", "4"))
+MEM0_MAX_ATTEMPTS = int(os.getenv("MEM0_MAX_ATTEMPTS", "8"))
+MEM0_MAX_BACKOFF = float(os.getenv("MEM0_MAX_BACKOFF", "300"))
+
+
+def account_key(api_key: str) -> str:
+    """Spool rows are tagged by a hash of the API key, never the key itself."""
+    return hashlib.sha256((api_key or "").encode("utf-8")).hexdigest()[:16]
+
+
+class MemorySpool:
+    """SQLite-backed FIFO of pending Mem0 writes."""
+
+    def __init__(self, path: str = MEM0_SPOOL_PATH):
+        """
+        Args:
+            path: SQLite file path (":memory:" for a non-durable spool)
+        """
+        self.path = path
+        self._lock = threading.Lock()
+
+        if path != ":memory:" and os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            """CREATE TABLE IF NOT EXISTS mem0_spool (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                account TEXT NOT NULL,
+                payload TEXT NOT NULL,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                next_attempt_at REAL NOT NULL,
+                dead INTEGER NOT NULL DEFAULT 0,
+                last_error TEXT,
+                created_at REAL NOT NULL
+            )"""
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS ix_mem0_spool_ready ON mem0_spool (account, dead, next_attempt_at)"
+        )
+        self._conn.commit()
+
+    def put(self, account: str, payload: Dict[str, Any]) -> int:
+        now = time.time()
+        with self._lock:
+            cursor = self._conn.execute(
+                "INSERT INTO mem0_spool (account, payload, next_attempt_at, created_at) VALUES (?, ?, ?, ?)",
+                (account, json.dumps(payload), now, now)
+            )
+            self._conn.commit()
+            return cursor.lastrowid
+
+    def take(self, account: str, limit: int) -> List[Tuple[int, Dict[str, Any], int]]:
+        """Oldest entries that are due, as (id, payload, attempts)."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT id, payload, attempts FROM mem0_spool "
+                "WHERE account = ? AND dead = 0 AND next_attempt_at <= ? ORDER BY id LIMIT ?",
+                (account, time.time(), limit)
+            ).fetchall()
+        return [(row_id, json.loads(payload), attempts) for row_id, payload, attempts in rows]
+
+    def ack(self, ids: List[int]) -> None:
+        if not ids:
+            return
+        with self._lock:
+            self._conn.executemany("DELETE FROM mem0_spool WHERE id = ?", [(i,) for i in ids])
+            self._conn.commit()
+
+    def retry(self, failures: List[Tuple[int, int, float, str, bool]]) -> None:
+        """Record failures as (id, attempts, next_attempt_at, error, dead)."""
+        if not failures:
+            return
+        with self._lock:
+            self._conn.executemany(
+                "UPDATE mem0_spool SET attempts = ?, next_attempt_at = ?, last_error = ?, dead = ? WHERE id = ?",
+                [(attempts, due, error, int(dead), row_id) for row_id, attempts, due, error, dead in failures]
+            )
+            self._conn.commit()
+
+    def pending(self, account: Optional[str] = None) -> int:
+        """Entries still to be sent (including ones waiting for a retry)."""
+        query = "SELECT COUNT(*) FROM mem0_spool WHERE dead = 0"
+        params: tuple = ()
+        if account is not None:
+            query += " AND account = ?"
+            params = (account,)
+        with self._lock:
+            return self._conn.execute(query, params).fetchone()[0]
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            pending, dead = self._conn.execute(
+                "SELECT COALESCE(SUM(dead = 0), 0), COALESCE(SUM(dead = 1), 0) FROM mem0_spool"
+            ).fetchone()
+        return {"pending": pending, "dead": dead}
+
+
+class MemoryWriter:
+    """Background worker draining one account's spool entries through `send`."""
+
+    def __init__(self, account: str, send: Callable[[Dict[str, Any]], Any], spool: MemorySpool,
+                 batch_size: int = MEM0_BATCH_SIZE, flush_interval: float = MEM0_FLUSH_INTERVAL,
+                 max_workers: int = MEM0_WRITE_CONCURRENCY, max_attempts: int = MEM0_MAX_ATTEMPTS,
+                 max_backoff: float = MEM0_MAX_BACKOFF):
+        """
+        Args:
+            account: account_key() of the Mem0 API key
+            send: Writes one payload to Mem0; raises on failure
+            spool: Durable queue shared by all writers
+            batch_size: Entries sent per drain cycle
+            flush_interval: Seconds to coalesce new entries before a cycle
+            max_workers: Concurrent Mem0 calls within a batch
+            max_attempts: Attempts before an entry is parked as dead
+            max_backoff: Upper bound for the exponential retry delay
+        """
+        self.account = account
+        self.send = send
+        self.spool = spool
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_attempts = max_attempts
+        self.max_backoff = max_backoff
+        self.sent = 0
+        self.failed = 0
+
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="mem0-write")
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name=f"mem0-writer-{account[:6]}", daemon=True)
+        self._thread.start()
+
+    def enqueue(self, payload: Dict[str, Any]) -> int:
+        """Persist a write and return immediately."""
+        row_id = self.spool.put(self.account, payload)
+        self._wake.set()
+        return row_id
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until this account's spool is empty. Returns False on timeout."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while self.spool.pending(self.account):
+            if deadline is not None and time.monotonic() >= deadline:
+                return False
+            self._wake.set()
+            time.sleep(0.02)
+        return True
+
+    def stop(self, timeout: float = 5.0) -> bool:
+        """Flush for up to `timeout` seconds, then stop; leftovers stay spooled."""
+        flushed = self.flush(timeout)
+        self._stop.set()
+        self._wake.set()
+        self._thread.join(timeout=1.0)
+        self._executor.shutdown(wait=False)
+        return flushed
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            self._wake.wait(timeout=self.flush_interval)
+            self._wake.clear()
+            if self._stop.is_set():
+                break
+            # Give concurrent writers a moment to land in the same batch
+            time.sleep(min(self.flush_interval, 0.05))
+            while not self._stop.is_set() and self._drain_batch():
+                pass
+
+    def _drain_batch(self) -> bool:
+        """Send one batch. Returns True if the batch was full (more may be due)."""
+        try:
+            batch = self.spool.take(self.account, self.batch_size)
+        except Exception as e:
+            print(f"❌ Mem0 spool read failed: {e}")
+            return False
+        if not batch:
+            return False
+
+        futures = [(row_id, attempts, self._executor.submit(self.send, payload))
+                   for row_id, payload, attempts in batch]
+        done, failures = [], []
+        for row_id, attempts, future in futures:
+            try:
+                future.result()
+                done.append(row_id)
+            except Exception as e:
+                attempts += 1
+                dead = attempts >= self.max_attempts
+                backoff = min(self.max_backoff, 2 ** attempts)
+                failures.append((row_id, attempts, time.time() + backoff, str(e)[:500], dead))
+                if dead:
+                    print(f"❌ Mem0 write {row_id} failed {attempts} times, parked in spool: {e}")
+                else:
+                    print(f"⏳ Mem0 write {row_id} failed (attempt {attempts}), retrying in {backoff:.1f}s: {e}")
+
+        self.spool.ack(done)
+        self.spool.retry(failures)
+        self.sent += len(done)
+        self.failed += len(failures)
+        if done:
+            print(f"🧠 Flushed {len(done)} memories to Mem0")
+        return len(batch) == self.batch_size
+
+
+_spool: Optional[MemorySpool] = None
+_writers: Dict[str, MemoryWriter] = {}
+_writers_lock = threading.Lock()
+
+
+def get_spool() -> MemorySpool:
+    global _spool
+    with _writers_lock:
+        if _spool is None:
+            _spool = MemorySpool(MEM0_SPOOL_PATH)
+        return _spool
+
+
+def get_memory_writer(api_key: str, send: Callable[[Dict[str, Any]], Any]) -> Optional[MemoryWriter]:
+    """
+    Process-wide writer for a Mem0 account, or None when write-behind is
+    disabled (MEM0_WRITE_BEHIND=false) or the spool cannot be opened.
+    """
+    if os.getenv("MEM0_WRITE_BEHIND", "true").lower() in ("0", "false", "no"):
+        return None
+    try:
+        spool = get_spool()
+    except Exception as e:
+        print(f"⚠️ Mem0 spool unavailable, writing synchronously: {e}")
+        return None
+
+    account = account_key(api_key)
+    with _writers_lock:
+        writer = _writers.get(account)
+        if writer is None:
+            writer = MemoryWriter(account, send, spool)
+            _writers[account] = writer
+            backlog = spool.pending(account)
+            if backlog:
+                print(f"🧠 Resuming {backlog} spooled Mem0 writes")
+        return writer
+
+
+def stop_memory_writers(timeout: float = 5.0) -> None:
+    """Give every writer a last chance to flush (called on app shutdown)."""
+    with _writers_lock:
+        writers = list(_writers.values())
+        _writers.clear()
+    for writer in writers:
+        if not writer.stop(timeout):
+            print(f"⚠️ {writer.spool.pending(writer.account)} Mem0 writes left in spool for next start")
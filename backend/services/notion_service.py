@@ -1,8 +1,31 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Any, Dict
+from typing import Any, Dict, List
 from notion_client import Client
 from dateutil import parser as date_parser
 from backend.services.base import TaskStorageService
+from backend.services.notion_users import NotionUserCache, NotionUserDirectory, user_cache
+from backend.utils.rate_limit import get_token_bucket
+
+# Notion allows ~3 requests/second per integration
+NOTION_RATE_LIMIT = float(os.getenv("NOTION_RATE_LIMIT", "3"))
+NOTION_RATE_BURST = float(os.getenv("NOTION_RATE_BURST", "3"))
+NOTION_MAX_RETRIES = int(os.getenv("NOTION_MAX_RETRIES", "5"))
+NOTION_MAX_CONCURRENCY = int(os.getenv("NOTION_MAX_CONCURRENCY", "3"))
+
+
+def _is_rate_limited(error: Exception) -> bool:
+    return getattr(error, "status", None) == 429 or str(getattr(error, "code", "")).endswith("rate_limited")
+
+
+def _retry_after(error: Exception, attempt: int) -> float:
+    """Seconds to wait before retrying: Retry-After header if present, else exponential backoff."""
+    headers = getattr(error, "headers", None) or {}
+    try:
+        return float(headers.get("retry-after") or headers.get("Retry-After"))
+    except (TypeError, ValueError):
+        return min(30.0, 0.5 * (2 ** attempt))
 
 
 class NotionTaskService(TaskStorageService):
@@ -22,6 +45,22 @@ class NotionTaskService(TaskStorageService):
         self.database_id = database_id  # Legacy
         self.meeting_database_id = meeting_database_id or database_id
         self.task_database_id = task_database_id or database_id
+        # Shared by every service instance using this token
+        self.rate_limiter = get_token_bucket("notion", auth_token, NOTION_RATE_LIMIT, NOTION_RATE_BURST)
+        self.workspace_key = NotionUserCache.workspace_key(auth_token)
+    
+    def _call(self, fn, **kwargs) -> Any:
+        """Call a Notion API method under the rate limiter, retrying 429s with backoff."""
+        for attempt in range(NOTION_MAX_RETRIES + 1):
+            self.rate_limiter.acquire()
+            try:
+                return fn(**kwargs)
+            except Exception as e:
+                if not _is_rate_limited(e) or attempt == NOTION_MAX_RETRIES:
+                    raise
+                wait = _retry_after(e, attempt)
+                print(f"⏳ Notion rate limited, retrying in {wait:.1f}s ({attempt + 1}/{NOTION_MAX_RETRIES})")
+                self.rate_limiter.penalize(wait)
     
     def create_task(self, task: Dict[str, Any]) -> str:
         """
@@ -65,7 +104,7 @@ class NotionTaskService(TaskStorageService):
                 "people": [{"id": task["assignee_id"]}]
             }
         
-        page = self.client.pages.create(
+        page = self._call(self.client.pages.create,
             parent={"database_id": self.database_id},
             properties=properties
         )
@@ -88,11 +127,11 @@ class NotionTaskService(TaskStorageService):
             }
         
         if properties:
-            self.client.pages.update(page_id=task_id, properties=properties)
+            self._call(self.client.pages.update, page_id=task_id, properties=properties)
     
     def get_task(self, task_id: str) -> Dict[str, Any]:
         """Retrieve a task from Notion."""
-        page = self.client.pages.retrieve(page_id=task_id)
+        page = self._call(self.client.pages.retrieve, page_id=task_id)
         
         # Extract relevant properties
         props = page.get("properties", {})
@@ -102,41 +141,39 @@ class NotionTaskService(TaskStorageService):
             "status": props.get("Status", {}).get("status", {}).get("name", ""),
         }
     
+    def _fetch_users(self) -> List[Dict[str, str]]:
+        """Fetch every person in the workspace, following pagination."""
+        users = []
+        cursor = None
+        while True:
+            kwargs = {"page_size": 100}
+            if cursor:
+                kwargs["start_cursor"] = cursor
+            response = self._call(self.client.users.list, **kwargs)
+            for user in response.get("results", []):
+                if user.get("type") == "person":
+                    users.append({"id": user["id"], "name": user.get("name") or ""})
+            if not response.get("has_more") or not response.get("next_cursor"):
+                return users
+            cursor = response["next_cursor"]
+
+    def get_user_directory(self) -> NotionUserDirectory:
+        """Process-wide, TTL-refreshed user directory for this workspace."""
+        return user_cache.get(self.workspace_key, self._fetch_users)
+
     def get_users(self) -> Dict[str, str]:
         """
         Fetch all users from Notion and return a Name -> ID mapping.
-        Cached for performance.
+        Cached per workspace for the whole process.
         """
-        if not hasattr(self, "_user_cache"):
-            self._user_cache = {}
-            try:
-                users = self.client.users.list()
-                for user in users.get("results", []):
-                    if user["type"] == "person":
-                        name = user.get("name", "").lower()
-                        self._user_cache[name] = user["id"]
-            except Exception as e:
-                print(f"⚠️ Failed to fetch Notion users: {e}")
-        return self._user_cache
+        return self.get_user_directory().name_map()
 
     def resolve_user_id(self, name: str) -> str:
-        """Resolve a name to a Notion User ID (simple fuzzy match)."""
+        """Resolve a name to a Notion User ID (exact, then token/prefix match)."""
         if not name or name == "Unassigned":
             return None
-            
-        users = self.get_users()
-        name_lower = name.lower()
         
-        # Exact match
-        if name_lower in users:
-            return users[name_lower]
-        
-        # Partial match (e.g. "Paarth" matches "Paarth Sharma")
-        for u_name, u_id in users.items():
-            if name_lower in u_name or u_name in name_lower:
-                return u_id
-                
-        return None
+        return self.get_user_directory().resolve(name)
 
     def map_agent_task_to_notion(self, agent_task: Dict[str, Any], meeting_id: str = None) -> Dict[str, Any]:
         """
@@ -178,7 +215,7 @@ class NotionTaskService(TaskStorageService):
         # Note: ID generation now handled by caller (Agent) using get_next_daily_id
             
         try:
-            response = self.client.pages.create(
+            response = self._call(self.client.pages.create,
                 parent={"database_id": self.meeting_database_id},
                 properties={
                     "Summary": {"title": [{"text": {"content": f"Meeting {meeting_id}"}}]},
@@ -195,6 +232,14 @@ class NotionTaskService(TaskStorageService):
         """
         Create a task in the Tasks database.
         """
+        try:
+            return self._create_task_page(task)
+        except Exception as e:
+            print(f"❌ Failed to create task row: {e}")
+            return ""
+
+    def _create_task_page(self, task: Dict[str, Any]) -> str:
+        """Create the task page and return its id; raises on API errors (after rate-limit retries)."""
         properties = {
             # "Task ID": {"rich_text": ...}, # Omitted: User property is likely Auto-Number
             "Title": {"title": [{"text": {"content": task.get("title", "Untitled")}}]},
@@ -221,15 +266,47 @@ class NotionTaskService(TaskStorageService):
         if task.get("transcript_snippet"):
              properties["Transcript Snippet"] = {"rich_text": [{"text": {"content": task["transcript_snippet"]}}]}
 
-        try:
-            page = self.client.pages.create(
-                parent={"database_id": self.task_database_id},
-                properties=properties
-            )
-            return page["id"]
-        except Exception as e:
-            print(f"❌ Failed to create task row: {e}")
-            return ""
+        page = self._call(self.client.pages.create,
+            parent={"database_id": self.task_database_id},
+            properties=properties
+        )
+        return page["id"]
+
+    def create_tasks(self, tasks: List[Dict[str, Any]], meeting_page_id: str = None,
+                     meeting_sequence_id: int = None, max_workers: int = None) -> List[Dict[str, Any]]:
+        """
+        Create many tasks concurrently.
+        
+        Requests fan out over a bounded thread pool; the shared token bucket
+        keeps the integration under Notion's rate limit and 429s are retried.
+        
+        Args:
+            tasks: Tasks in Notion format (see map_agent_task_to_notion)
+            meeting_page_id: Meeting page the tasks belong to
+            meeting_sequence_id: Numeric meeting ID
+            max_workers: Concurrent requests (default: NOTION_MAX_CONCURRENCY)
+        
+        Returns:
+            One result per task, in input order: {"title", "id", "error"}
+            (id is "" and error is set when creation failed)
+        """
+        if not tasks:
+            return []
+        
+        def create(task: Dict[str, Any]) -> Dict[str, Any]:
+            result = {"title": task.get("title", "Untitled"), "id": "", "error": None}
+            try:
+                result["id"] = self._create_task_page(task)
+            except Exception as e:
+                print(f"❌ Failed to create task row: {e}")
+                result["error"] = str(e)
+            return result
+        
+        workers = min(max_workers or NOTION_MAX_CONCURRENCY, len(tasks))
+        if workers <= 1:
+            return [create(task) for task in tasks]
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(create, tasks))
 
     def create_meeting_summary(self, summary: Dict[str, Any], page_id: str) -> str:
         """Update the Meeting Row with summary details."""
@@ -246,7 +323,7 @@ class NotionTaskService(TaskStorageService):
                  summary_content = summary
             
             # Create a separate child page for the summary
-            response = self.client.pages.create(
+            response = self._call(self.client.pages.create,
                 parent={"page_id": page_id},
                 properties={
                     "title": {"title": [{"text": {"content": "Meeting Summary"}}]}
@@ -0,0 +1,164 @@
+"""
+Notion User Directory
+
+Process-wide, per-workspace cache of Notion people with a prebuilt lookup
+index, so resolving an assignee name never hits the network on the hot path.
+Stale directories keep serving while a background thread refreshes them.
+"""
+import hashlib
+import os
+import re
+import threading
+import time
+import unicodedata
+from collections import defaultdict
+from typing import Callable, Dict, List, Optional
+
+NOTION_USER_CACHE_TTL = int(os.getenv("NOTION_USER_CACHE_TTL", "600"))
+# After a failed first fetch, retry sooner than the normal TTL
+NOTION_USER_RETRY_SECONDS = int(os.getenv("NOTION_USER_RETRY_SECONDS", "60"))
+MIN_PREFIX_LEN = 2
+
+
+def normalize_name(name: str) -> str:
+    """Lowercase, strip accents and punctuation, collapse whitespace."""
+    name = unicodedata.normalize("NFKD", name or "")
+    name = "".join(c for c in name if not unicodedata.combining(c))
+    return " ".join(re.sub(r"[^\w]+", " ", name.lower()).split())
+
+
+class NotionUserDirectory:
+    """Immutable snapshot of a workspace's people with name/token/prefix indexes."""
+
+    def __init__(self, users: List[Dict[str, str]], loaded_at: Optional[float] = None):
+        """
+        Args:
+            users: [{"id": ..., "name": ...}] for person users
+            loaded_at: monotonic timestamp of the fetch
+        """
+        self.loaded_at = loaded_at if loaded_at is not None else time.monotonic()
+        self.users = users
+        self.by_name: Dict[str, str] = {}
+        self.by_token: Dict[str, List[str]] = defaultdict(list)
+        self.by_prefix: Dict[str, List[str]] = defaultdict(list)
+        self._order: Dict[str, int] = {}
+
+        for position, user in enumerate(users):
+            user_id = user["id"]
+            normalized = normalize_name(user.get("name", ""))
+            if not normalized:
+                continue
+            self._order.setdefault(user_id, position)
+            self.by_name.setdefault(normalized, user_id)
+            for token in set(normalized.split()):
+                self.by_token[token].append(user_id)
+                for end in range(MIN_PREFIX_LEN, len(token)):
+                    self.by_prefix[token[:end]].append(user_id)
+
+    def name_map(self) -> Dict[str, str]:
+        """Lowercased name -> ID (the legacy get_users() shape)."""
+        return {user.get("name", "").lower(): user["id"] for user in self.users if user.get("name")}
+
+    def resolve(self, name: str) -> Optional[str]:
+        """
+        Resolve a spoken/typed name to a user ID.
+
+        Exact normalized-name match first; otherwise each query token votes
+        for users having that token (or a token starting with it), and the
+        user with the most votes wins (ties go to the first listed user).
+        """
+        normalized = normalize_name(name)
+        if not normalized:
+            return None
+
+        exact = self.by_name.get(normalized)
+        if exact:
+            return exact
+
+        votes: Dict[str, int] = defaultdict(int)
+        for token in set(normalized.split()):
+            matched = set(self.by_token.get(token, ())) | set(self.by_prefix.get(token, ()))
+            for user_id in matched:
+                votes[user_id] += 1
+
+        if not votes:
+            return None
+        return min(votes, key=lambda user_id: (-votes[user_id], self._order[user_id]))
+
+
+class NotionUserCache:
+    """Per-workspace directories, fetched once and refreshed in the background after TTL."""
+
+    def __init__(self, ttl_seconds: int = NOTION_USER_CACHE_TTL):
+        self.ttl_seconds = ttl_seconds
+        self._directories: Dict[str, NotionUserDirectory] = {}
+        self._refreshing: set = set()
+        self._lock = threading.Lock()
+        self._fetch_locks: Dict[str, threading.Lock] = defaultdict(threading.Lock)
+
+    @staticmethod
+    def workspace_key(auth_token: str) -> str:
+        # Integration tokens are per workspace; never keep the raw secret as a key
+        return hashlib.sha256((auth_token or "").encode("utf-8")).hexdigest()[:16]
+
+    def get(self, key: str, fetch: Callable[[], List[Dict[str, str]]]) -> NotionUserDirectory:
+        """
+        Return the directory for `key`.
+
+        The first call per workspace fetches synchronously (concurrent callers
+        wait for the same fetch). Later calls return immediately; a stale
+        directory triggers one background refresh.
+        """
+        directory = self._directories.get(key)
+        if directory is None:
+            with self._fetch_locks[key]:
+                directory = self._directories.get(key)
+                if directory is None:
+                    directory = self._load(key, fetch)
+            return directory
+
+        if time.monotonic() - directory.loaded_at > self.ttl_seconds:
+            self._refresh_in_background(key, fetch)
+        return directory
+
+    def invalidate(self, key: Optional[str] = None) -> None:
+        with self._lock:
+            if key is None:
+                self._directories.clear()
+            else:
+                self._directories.pop(key, None)
+
+    def _load(self, key: str, fetch: Callable[[], List[Dict[str, str]]]) -> NotionUserDirectory:
+        try:
+            directory = NotionUserDirectory(fetch())
+            print(f"👥 Cached {len(directory.users)} Notion users")
+        except Exception as e:
+            print(f"⚠️ Failed to fetch Notion users: {e}")
+            previous = self._directories.get(key)
+            if previous is not None:
+                # Keep serving the old snapshot; try again after the retry interval
+                previous.loaded_at = time.monotonic() - self.ttl_seconds + NOTION_USER_RETRY_SECONDS
+                return previous
+            directory = NotionUserDirectory([], time.monotonic() - self.ttl_seconds + NOTION_USER_RETRY_SECONDS)
+
+        with self._lock:
+            self._directories[key] = directory
+        return directory
+
+    def _refresh_in_background(self, key: str, fetch: Callable[[], List[Dict[str, str]]]) -> None:
+        with self._lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+
+        def refresh():
+            try:
+                self._load(key, fetch)
+            finally:
+                with self._lock:
+                    self._refreshing.discard(key)
+
+        threading.Thread(target=refresh, name="notion-user-refresh", daemon=True).start()
+
+
+user_cache = NotionUserCache()
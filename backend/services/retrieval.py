@@ -0,0 +1,117 @@
+"""
+Hybrid Retrieval
+
+Runs vector search, keyword (BM25) search and a metadata lookup for the
+selected meeting/date concurrently, fuses the ranked lists with reciprocal
+rank fusion and trims the result to a token budget for the answer prompt.
+Works with any memory backend exposing the Mem0Service interface;
+keyword_search is used when the backend has it.
+"""
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+RRF_K = 60
+RETRIEVAL_TOKEN_BUDGET = int(os.getenv("RETRIEVAL_TOKEN_BUDGET", "6000"))
+RETRIEVAL_WORKERS = int(os.getenv("RETRIEVAL_WORKERS", "8"))
+CHARS_PER_TOKEN = 4
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=RETRIEVAL_WORKERS, thread_name_prefix="retrieval")
+        return _executor
+
+
+def estimate_tokens(text: str) -> int:
+    return (len(text) + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN
+
+
+def reciprocal_rank_fusion(ranked_lists: Sequence[Sequence[str]], k: int = RRF_K,
+                           weights: Optional[Sequence[float]] = None) -> List[str]:
+    """
+    Fuse ranked lists: score(d) = sum(weight / (k + rank)).
+
+    Ties keep first-seen order, so results are deterministic.
+    """
+    weights = weights or [1.0] * len(ranked_lists)
+    scores: Dict[str, float] = {}
+    for results, weight in zip(ranked_lists, weights):
+        for rank, item in enumerate(results, start=1):
+            scores[item] = scores.get(item, 0.0) + weight / (k + rank)
+    order = {item: position for position, item in enumerate(scores)}
+    return sorted(scores, key=lambda item: (-scores[item], order[item]))
+
+
+def trim_to_budget(memories: List[str], token_budget: int = RETRIEVAL_TOKEN_BUDGET) -> List[str]:
+    """Keep memories in rank order until the budget is spent; the first one is cut to fit."""
+    kept, used = [], 0
+    for memory in memories:
+        tokens = estimate_tokens(memory)
+        if used + tokens > token_budget:
+            if not kept:
+                kept.append(memory[:token_budget * CHARS_PER_TOKEN])
+            break
+        kept.append(memory)
+        used += tokens
+    return kept
+
+
+class HybridRetriever:
+    """Concurrent vector + keyword + metadata retrieval fused with RRF."""
+
+    def __init__(self, memory, token_budget: int = RETRIEVAL_TOKEN_BUDGET, rrf_k: int = RRF_K):
+        """
+        Args:
+            memory: Mem0Service-compatible backend
+            token_budget: Approximate tokens of context to return
+            rrf_k: RRF damping constant
+        """
+        self.memory = memory
+        self.token_budget = token_budget
+        self.rrf_k = rrf_k
+
+    def _safe(self, name: str, fn: Callable[..., List[str]], **kwargs) -> List[str]:
+        try:
+            return list(fn(**kwargs) or [])
+        except Exception as e:
+            print(f"⚠️ {name} retrieval failed: {e}")
+            return []
+
+    def retrieve(self, query: str, user_id: str, filters: Optional[Dict[str, Any]] = None,
+                 limit: int = 8) -> List[str]:
+        """Fused, de-duplicated memories in rank order, trimmed to the token budget."""
+        executor = _get_executor()
+        lookups = {
+            "vector": executor.submit(self._safe, "Vector", self.memory.search_memory,
+                                      query=query, user_id=user_id, filters=filters, limit=limit)
+        }
+        keyword_search = getattr(self.memory, "keyword_search", None)
+        if keyword_search:
+            lookups["keyword"] = executor.submit(self._safe, "Keyword", keyword_search,
+                                                 query=query, user_id=user_id, filters=filters, limit=limit)
+        if filters:
+            # A specific meeting/date was selected: its memories are relevant regardless of wording
+            lookups["metadata"] = executor.submit(self._safe, "Metadata", self.memory.get_all_memories,
+                                                  user_id=user_id, filters=filters, limit=limit)
+
+        ranked = {name: future.result() for name, future in lookups.items()}
+        print("🔎 Retrieval: " + ", ".join(f"{name}={len(hits)}" for name, hits in ranked.items()))
+        fused = reciprocal_rank_fusion(list(ranked.values()), k=self.rrf_k)
+        return trim_to_budget(fused[:limit], self.token_budget)
+
+    def merge(self, ranked_lists: List[List[str]], limit: int = 8) -> List[str]:
+        """Fuse already retrieved lists (e.g. for a rewritten and the original query) with RRF."""
+        fused = reciprocal_rank_fusion(ranked_lists, k=self.rrf_k)
+        return trim_to_budget(fused[:limit], self.token_budget)
+
+    def recent(self, user_id: str, filters: Optional[Dict[str, Any]] = None, limit: int = 20) -> List[str]:
+        """Recent memories (for summaries), de-duplicated in order and trimmed to the budget."""
+        memories = self._safe("Recent", self.memory.get_all_memories, user_id=user_id, filters=filters, limit=limit)
+        return trim_to_budget(list(dict.fromkeys(memories)), self.token_budget)
@@ -0,0 +1,132 @@
+"""
+Per-User Service Pool
+
+Keeps a bounded LRU of service bundles (LLM, Notion, Slack, Mem0) keyed by
+user id and a fingerprint of the credentials they were built from, so HTTP
+clients, TLS sessions and per-service caches survive across requests.
+"""
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+
+def _credentials(settings) -> Dict[str, Optional[str]]:
+    """Effective credentials for a user (settings first, env fallback; settings may be None)."""
+    def setting(name):
+        return getattr(settings, name, None)
+
+    return {
+        "gemini_api_key": setting("gemini_api_key") or os.getenv("GEMINI_API_KEY"),
+        "gemini_model": os.getenv("GEMINI_MODEL", "gemini-1.5-flash"),
+        "notion_token": setting("notion_token") or os.getenv("NOTION_TOKEN"),
+        "notion_database_id": setting("notion_database_id") or os.getenv("NOTION_DATABASE_ID") or "",
+        "notion_meeting_db_id": setting("notion_meeting_db_id") or os.getenv("NOTION_DATABASE_MEETING_ID") or "",
+        "notion_task_db_id": setting("notion_task_db_id") or os.getenv("NOTION_DATABASE_TASK_ID") or "",
+        "slack_bot_token": setting("slack_bot_token") or os.getenv("SLACK_BOT_TOKEN"),
+        "mem0_api_key": os.getenv("MEM0_API_KEY"),
+    }
+
+
+def credentials_fingerprint(credentials: Dict[str, Optional[str]]) -> str:
+    return hashlib.sha256(json.dumps(credentials, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+class ServiceBundle:
+    """Services built from one user's credentials. The memory backend is created on first use."""
+
+    def __init__(self, credentials: Dict[str, Optional[str]]):
+        from backend.services.llm_service import GeminiLLMService
+        from backend.services.notion_service import NotionTaskService
+        from backend.services.slack_service import SlackService
+
+        self.llm = GeminiLLMService(
+            api_key=credentials["gemini_api_key"],
+            model_name=credentials["gemini_model"]
+        )
+
+        self.notion = None
+        if credentials["notion_token"]:
+            self.notion = NotionTaskService(
+                auth_token=credentials["notion_token"],
+                database_id=credentials["notion_database_id"],
+                meeting_database_id=credentials["notion_meeting_db_id"],
+                task_database_id=credentials["notion_task_db_id"]
+            )
+            print("✅ Notion service initialized")
+        else:
+            print("⚠️ Notion not configured (no token in settings/env)")
+
+        self.slack = None
+        if credentials["slack_bot_token"]:
+            self.slack = SlackService(credentials["slack_bot_token"])
+            print("✅ Slack service initialized")
+        else:
+            print("⚠️ Slack not configured (no bot token in settings/env)")
+
+        self._mem0_api_key = credentials["mem0_api_key"]
+        self._mem0 = None
+        self._mem0_lock = threading.Lock()
+
+    @property
+    def mem0(self):
+        with self._mem0_lock:
+            if self._mem0 is None:
+                from backend.services.mem0_service import create_memory_service
+                self._mem0 = create_memory_service(api_key=self._mem0_api_key)
+            return self._mem0
+
+    def as_tuple(self) -> Tuple[Any, Any, Any]:
+        return self.llm, self.notion, self.slack
+
+
+class ServicePool:
+    """Bounded LRU of ServiceBundles keyed by (user_id, credentials fingerprint)."""
+
+    def __init__(self, max_size: int = 128):
+        self.max_size = max_size
+        self._bundles: "OrderedDict[Tuple[int, str], ServiceBundle]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, user_id: int, settings) -> ServiceBundle:
+        """Return the user's pooled bundle, building it if their credentials changed."""
+        credentials = _credentials(settings)
+        key = (user_id, credentials_fingerprint(credentials))
+
+        with self._lock:
+            bundle = self._bundles.get(key)
+            if bundle is not None:
+                self._bundles.move_to_end(key)
+                self.hits += 1
+                return bundle
+            self.misses += 1
+
+        bundle = ServiceBundle(credentials)
+
+        with self._lock:
+            # Another request may have built it meanwhile; keep the first one
+            bundle = self._bundles.setdefault(key, bundle)
+            self._bundles.move_to_end(key)
+            # Drop bundles built from this user's older credentials
+            for stale in [k for k in self._bundles if k[0] == key[0] and k != key]:
+                del self._bundles[stale]
+            while len(self._bundles) > self.max_size:
+                self._bundles.popitem(last=False)
+        return bundle
+
+    def invalidate(self, user_id: Optional[int] = None) -> None:
+        """Forget a user's bundles (or all bundles)."""
+        with self._lock:
+            for key in [k for k in self._bundles if user_id is None or k[0] == user_id]:
+                del self._bundles[key]
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"size": len(self._bundles), "hits": self.hits, "misses": self.misses}
+
+
+service_pool = ServicePool(max_size=int(os.getenv("SERVICE_POOL_SIZE", "128")))
@@ -1,56 +1,184 @@
+"""
+Slack Service
+
+Sends go through an outbound queue per channel, drained on a shared
+background event loop with AsyncWebClient, so callers never block on Slack.
+Each channel is paced to Slack's ~1 message/second limit, 429s are retried
+after Retry-After, and user -> DM channel IDs are cached.
+
+send_message / send_dm / send_channel_message return a
+concurrent.futures.Future resolving to the Slack API response; call
+.result() only when the caller really needs to wait.
+"""
+import asyncio
+import os
+import threading
+import time
+from concurrent.futures import Future, wait
+from typing import Any, Dict, Optional
+
 from slack_sdk import WebClient
 
+# AsyncWebClient needs aiohttp - fall back to the sync client on a worker thread
+try:
+    from slack_sdk.web.async_client import AsyncWebClient
+except ImportError:
+    AsyncWebClient = None
+
+SLACK_CHANNEL_INTERVAL = float(os.getenv("SLACK_CHANNEL_INTERVAL", "1.0"))
+SLACK_MAX_CONCURRENCY = int(os.getenv("SLACK_MAX_CONCURRENCY", "4"))
+SLACK_MAX_RETRIES = int(os.getenv("SLACK_MAX_RETRIES", "3"))
+
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_loop_lock = threading.Lock()
+
+
+def _get_loop() -> asyncio.AbstractEventLoop:
+    """Process-wide event loop thread shared by all SlackService instances."""
+    global _loop
+    with _loop_lock:
+        if _loop is None:
+            _loop = asyncio.new_event_loop()
+            threading.Thread(target=_loop.run_forever, name="slack-outbound", daemon=True).start()
+        return _loop
+
+
+def _retry_after(error: Exception) -> Optional[float]:
+    """Seconds to wait if `error` is a Slack 429, else None."""
+    response = getattr(error, "response", None)
+    if response is None or getattr(response, "status_code", None) != 429:
+        return None
+    try:
+        return float(response.headers.get("Retry-After", 1))
+    except (TypeError, ValueError):
+        return 1.0
+
+
 class SlackService:
-    def __init__(self, token: str):
+    def __init__(self, token: str, channel_interval: float = None, max_concurrency: int = None,
+                 max_retries: int = None):
+        """
+        Initialize Slack service.
+
+        Args:
+            token: Bot token
+            channel_interval: Minimum seconds between posts to the same channel
+            max_concurrency: Maximum in-flight Slack API calls
+            max_retries: Retries per message after 429 responses
+        """
+        self.token = token
         self.client = WebClient(token=token)
+        self.channel_interval = SLACK_CHANNEL_INTERVAL if channel_interval is None else channel_interval
+        self.max_concurrency = max_concurrency or SLACK_MAX_CONCURRENCY
+        self.max_retries = SLACK_MAX_RETRIES if max_retries is None else max_retries
 
-    def send_dm(self, user_id: str, text: str):
-        """Send a Direct Message to a user."""
-        try:
-            # maintain backward compatibility for "blocks" arg? 
-            # The user code replaced send_dm signature to (user_id, text).
-            # I should inspect if any other code calls send_dm with blocks.
-            # Only `executor_agent`? No, executor uses `notification_service` (slack_client wrapper).
-            # `slack_client.py` calls `send_message` (which I renamed/removed?).
-            # Wait, `integrations/slack_client.py` calls `container.slack_service.send_message(target_channel, blocks)`.
-            # So I MUST keep `send_message` accepting blocks!
-            
-            pass 
-        except:
-            pass
-
-    # REVISING CONTENT TO SUPPORT BOTH USER TEST AND APP CODE
-    
-    def send_dm(self, user_id: str, text: str = None, blocks: list = None):
-        if blocks and not text:
-            text = "New DM from Meeting Agent"
+        # Only touched from the event loop thread
+        self._async_client = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._queues: Dict[str, asyncio.Queue] = {}
+        self._next_allowed: Dict[str, float] = {}
+        self._dm_channels: Dict[str, str] = {}
+        self._dm_locks: Dict[str, asyncio.Lock] = {}
+
+        self._pending: set = set()
+        self._pending_lock = threading.Lock()
 
-        channel = self.client.conversations_open(
-            users=user_id
-        )["channel"]["id"]
+    # --- Public API (non-blocking) ---
 
-        self.client.chat_postMessage(
-            channel=channel,
-            text=text,
-            blocks=blocks
-        )
+    def send_dm(self, user_id: str, text: str = None, blocks: list = None) -> Future:
+        """Queue a Direct Message to a user."""
+        if blocks and not text:
+            text = "New DM from Meeting Agent"
+        return self._submit(self._send_dm(user_id, text=text, blocks=blocks))
 
-    def send_channel_message(self, channel_id: str, text: str = None, blocks: list = None):
-        self.client.chat_postMessage(
-            channel=channel_id,
-            text=text,
-            blocks=blocks
-        )
+    def send_channel_message(self, channel_id: str, text: str = None, blocks: list = None) -> Future:
+        return self._submit(self._post(channel_id, text=text, blocks=blocks))
 
-    def send_message(self, channel: str, blocks: list = None, text: str = None):
+    def send_message(self, channel: str, blocks: list = None, text: str = None) -> Future:
         """Legacy/Generic method for app integration."""
         if blocks and not text:
             text = "New message from Meeting Agent"
-            
-        self.client.chat_postMessage(
-            channel=channel,
-            blocks=blocks,
-            text=text
-        )
+        return self._submit(self._post(channel, text=text, blocks=blocks))
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait for every queued message. Returns False on timeout."""
+        with self._pending_lock:
+            pending = list(self._pending)
+        _, not_done = wait(pending, timeout=timeout)
+        return not not_done
+
+    # --- Internals (run on the event loop) ---
+
+    def _submit(self, coro) -> Future:
+        future = asyncio.run_coroutine_threadsafe(coro, _get_loop())
+        with self._pending_lock:
+            self._pending.add(future)
+        future.add_done_callback(self._discard_pending)
+        return future
+
+    def _discard_pending(self, future: Future) -> None:
+        with self._pending_lock:
+            self._pending.discard(future)
+
+    async def _call(self, method: str, **kwargs) -> Any:
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        async with self._semaphore:
+            if self._async_client is None:
+                if AsyncWebClient is None:
+                    return await asyncio.to_thread(getattr(self.client, method), **kwargs)
+                self._async_client = AsyncWebClient(token=self.token)
+            return await getattr(self._async_client, method)(**kwargs)
+
+    async def _dm_channel(self, user_id: str) -> str:
+        """Open (once) and cache the DM channel for a user."""
+        channel = self._dm_channels.get(user_id)
+        if channel:
+            return channel
+        lock = self._dm_locks.setdefault(user_id, asyncio.Lock())
+        async with lock:
+            if user_id not in self._dm_channels:
+                response = await self._call("conversations_open", users=user_id)
+                self._dm_channels[user_id] = response["channel"]["id"]
+            return self._dm_channels[user_id]
+
+    async def _send_dm(self, user_id: str, **message) -> Any:
+        channel = await self._dm_channel(user_id)
+        return await self._post(channel, **message)
+
+    async def _post(self, channel: str, **message) -> Any:
+        """Add a message to the channel's queue and wait for it to be sent."""
+        result = asyncio.get_running_loop().create_future()
+        queue = self._queues.get(channel)
+        if queue is None:
+            queue = self._queues[channel] = asyncio.Queue()
+            asyncio.create_task(self._drain(channel, queue))
+        queue.put_nowait((message, result))
+        return await result
 
+    async def _drain(self, channel: str, queue: asyncio.Queue) -> None:
+        """Send a channel's queued messages in order, paced and retried."""
+        while not queue.empty():
+            message, result = queue.get_nowait()
+            try:
+                result.set_result(await self._post_with_retry(channel, message))
+            except Exception as e:
+                print(f"❌ Slack message to {channel} failed: {e}")
+                result.set_exception(e)
+        del self._queues[channel]
 
+    async def _post_with_retry(self, channel: str, message: Dict[str, Any]) -> Any:
+        for attempt in range(self.max_retries + 1):
+            delay = self._next_allowed.get(channel, 0) - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            try:
+                response = await self._call("chat_postMessage", channel=channel, **message)
+                self._next_allowed[channel] = time.monotonic() + self.channel_interval
+                return response
+            except Exception as e:
+                wait_seconds = _retry_after(e)
+                if wait_seconds is None or attempt == self.max_retries:
+                    raise
+                print(f"⏳ Slack rate limited on {channel}, retrying in {wait_seconds:.1f}s")
+                self._next_allowed[channel] = time.monotonic() + wait_seconds
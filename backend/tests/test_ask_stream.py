@@ -0,0 +1,47 @@
+import sys
+import os
+import tempfile
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from backend.services.local_memory_service import LocalMemoryService
+from backend.agents.meeting_query_agent import MeetingQueryAgent
+from benchmarks.fakes import FakeLLMService
+
+
+class StreamingLLM:
+    def generate(self, prompt, system_prompt=None):
+        return "SEARCH: design"
+
+    def stream(self, prompt, system_prompt=None):
+        yield from ["Amr ", "advised ", "system design."]
+
+
+def test_ask_stream():
+    print("🧪 Testing streamed answers...\n")
+    with tempfile.TemporaryDirectory() as tmp:
+        memory = LocalMemoryService(root=tmp, dim=1024)
+        memory.add_memory("Meeting: Career Guidance\nAmr advised practicing system design.", user_id="u")
+
+        cwd = os.getcwd()
+        os.chdir(tmp)  # The agent appends to backend/agent.log relative to cwd
+        try:
+            events = list(MeetingQueryAgent(StreamingLLM(), memory).run_stream(
+                "What did Amr say about system design?", user_id="u"))
+            greeting = list(MeetingQueryAgent(StreamingLLM(), memory).run_stream("hello", user_id="u"))
+        finally:
+            os.chdir(cwd)
+
+        assert events[0] == ("sources", ["Career Guidance"])
+        assert [value for kind, value in events[1:] if kind == "token"] == ["Amr ", "advised ", "system design."]
+        print(f"✅ Sources first, then {len(events) - 1} token chunks")
+
+        assert greeting[0] == ("sources", []) and greeting[1][0] == "token" and len(greeting) == 2
+        print("✅ Direct answers stream as a single chunk")
+
+    # LLMService.stream falls back to one chunk for services without native streaming
+    assert list(FakeLLMService().stream("anything")) == ["SEARCH"]
+    print("✅ Default LLMService.stream yields the full response")
+
+
+if __name__ == "__main__":
+    test_ask_stream()
@@ -0,0 +1,36 @@
+import sys
+import os
+import wave
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+import numpy as np
+
+from backend.asr.buffers import to_float32, wav_bytes
+
+
+def test_to_float32_is_zero_copy():
+    print("🧪 Testing in-memory ASR buffers...\n")
+    audio = np.linspace(-0.5, 0.5, 16000, dtype=np.float32)
+    assert to_float32(audio) is audio
+    print("✅ float32 input passed through without a copy")
+
+    pcm = np.array([0, 16384, -32768], dtype=np.int16)
+    assert np.allclose(to_float32(pcm), [0.0, 0.5, -1.0])
+    print("✅ int16 PCM scaled to [-1, 1)")
+
+
+def test_wav_bytes_round_trip():
+    audio = np.sin(np.linspace(0, 2 * np.pi * 440, 16000)).astype(np.float32) * 0.5
+    buffer = wav_bytes(audio)
+    with wave.open(buffer, "rb") as wf:
+        assert wf.getnchannels() == 1
+        assert wf.getframerate() == 16000
+        frames = np.frombuffer(wf.readframes(wf.getnframes()), dtype=np.int16)
+    assert len(frames) == len(audio)
+    assert np.allclose(frames / 32767, audio, atol=1e-4)
+    print(f"✅ In-memory WAV round trip ({buffer.getbuffer().nbytes} bytes)")
+
+
+if __name__ == "__main__":
+    test_to_float32_is_zero_copy()
+    test_wav_bytes_round_trip()
@@ -0,0 +1,69 @@
+import sys
+import os
+import time
+import threading
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from backend.asr.model_registry import FASTER_WHISPER, OPENAI_WHISPER, ModelRegistry, parse_prewarm
+
+
+def test_lazy_shared_models():
+    print("🧪 Testing ASR model registry...\n")
+    loaded = []
+
+    def loader(key):
+        time.sleep(0.05)
+        loaded.append(key)
+        return object()
+
+    registry = ModelRegistry(idle_timeout=0, loader=loader)
+    assert loaded == []
+    print("✅ Nothing loaded until first use")
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(registry.get(FASTER_WHISPER, "small")))
+               for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert len(loaded) == 1
+    assert all(model is results[0] for model in results)
+    print("✅ Concurrent first users shared one load")
+
+    registry.get(FASTER_WHISPER, "small", compute_type="float16")
+    registry.get(OPENAI_WHISPER, "base", compute_type="int8")
+    registry.get(OPENAI_WHISPER, "base", compute_type="float16")
+    assert len(loaded) == 3
+    print(f"✅ One instance per (model, device, compute_type): {registry.stats()}")
+
+
+def test_idle_unload_skips_borrowed_models():
+    registry = ModelRegistry(idle_timeout=10, loader=lambda key: object())
+    registry.close()  # Drive unloading by hand instead of the reaper thread
+
+    with registry.use(OPENAI_WHISPER, "base"):
+        assert registry.unload_idle(now=time.monotonic() + 60) == []
+    print("✅ Borrowed model is never unloaded")
+
+    assert registry.unload_idle(now=time.monotonic() + 1) == []
+    assert len(registry.unload_idle(now=time.monotonic() + 60)) == 1
+    assert registry.stats()["loaded"] == []
+
+    registry.get(OPENAI_WHISPER, "base")
+    assert registry.stats()["loads"] == 2
+    print("✅ Idle model unloaded and reloaded on next use")
+
+
+def test_parse_prewarm():
+    assert parse_prewarm("openai-whisper:base, faster-whisper:small,bogus:x,") == [
+        (OPENAI_WHISPER, "base"), (FASTER_WHISPER, "small")
+    ]
+    assert parse_prewarm("") == []
+    print("✅ ASR_PREWARM parsed")
+
+
+if __name__ == "__main__":
+    test_lazy_shared_models()
+    test_idle_unload_skips_borrowed_models()
+    test_parse_prewarm()
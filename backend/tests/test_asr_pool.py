@@ -0,0 +1,156 @@
+import sys
+import os
+import time
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from backend.asr.model_registry import FASTER_WHISPER
+from backend.asr import worker_pool
+from backend.asr.worker_pool import ASRPoolBusy, ASRWorkerPool, ASR_RUNNING, PRIORITY_HIGH, PRIORITY_LOW
+
+
+class FakeSegment:
+    def __init__(self, text, start, end):
+        self.text = text
+        self.start = start
+        self.end = end
+
+
+class FakeInfo:
+    duration = 3.0
+
+
+class FakeModel:
+    """faster-whisper lookalike: "<seconds>:<text>" sleeps, then yields three segments."""
+
+    def transcribe(self, source):
+        seconds, _, text = source.partition(":")
+        if text == "fail":
+            raise ValueError("corrupt audio")
+        if text == "crash":
+            os._exit(1)
+
+        def segments():
+            for i in range(3):
+                time.sleep(float(seconds) / 3)
+                yield FakeSegment(f"{text}-{i}-{os.getpid()}", float(i), i + 1.0)
+        return segments(), FakeInfo()
+
+
+def fake_loader(key):
+    return FakeModel()
+
+
+def broken_loader(key):
+    raise OSError("model file missing")
+
+
+def make_pool(workers, max_pending=8, loader=fake_loader):
+    pool = ASRWorkerPool(workers=workers, backend=FASTER_WHISPER, model_name="fake",
+                         max_pending=max_pending, loader=loader)
+    pool.start()
+    return pool
+
+
+def wait_running(job, timeout=10.0):
+    deadline = time.time() + timeout
+    while job.status != ASR_RUNNING:
+        assert time.time() < deadline, "job never started"
+        time.sleep(0.01)
+
+
+def test_parallel_jobs_and_progress():
+    print("🧪 Testing ASR worker pool...\n")
+    pool = make_pool(workers=2)
+    try:
+        progress = []
+        jobs = [pool.submit(f"0.3:file{i}", on_progress=progress.append) for i in range(2)]
+        texts = [job.result(timeout=30) for job in jobs]
+        assert texts[0].startswith("file0-0-") and texts[1].startswith("file1-0-")
+        pids = {text.rsplit("-", 1)[1] for text in texts}
+        assert len(pids) == 2, pids
+        print(f"✅ Two jobs ran in separate processes: {sorted(pids)}")
+
+        assert progress and max(progress) == 1.0
+        assert any(0 < p < 1 for p in progress)
+        print(f"✅ Progress reported: {sorted(set(progress))}")
+
+        failing = pool.submit("0:fail")
+        try:
+            failing.result(timeout=30)
+            assert False, "expected failure"
+        except RuntimeError as e:
+            assert "corrupt audio" in str(e)
+        assert pool.stats()["failed"] == 1
+        print("✅ Worker errors surface on the job")
+    finally:
+        pool.stop()
+
+
+def test_priority_and_backpressure():
+    pool = make_pool(workers=1, max_pending=2)
+    try:
+        blocker = pool.submit("0.6:blocker")
+        wait_running(blocker)
+
+        finished = []
+        low = pool.submit("0:low", priority=PRIORITY_LOW)
+        high = pool.submit("0:high", priority=PRIORITY_HIGH)
+        for job in (low, high):
+            job.future.add_done_callback(lambda f: finished.append(f.result().split("-")[0]))
+
+        try:
+            pool.submit("0:overflow", timeout=0.1)
+            assert False, "expected backpressure"
+        except ASRPoolBusy:
+            print("✅ Full queue rejected the submit")
+
+        low.result(timeout=30)
+        high.result(timeout=30)
+        assert finished == ["high", "low"], finished
+        print("✅ High priority job overtook the queued low priority job")
+    finally:
+        pool.stop()
+
+
+
+def test_dead_workers_fail_their_jobs():
+    pool = make_pool(workers=1)
+    try:
+        crashed = pool.submit("0:crash")
+        try:
+            crashed.result(timeout=30)
+            assert False, "expected failure"
+        except RuntimeError as e:
+            assert "died" in str(e)
+        assert pool.submit("0:after").result(timeout=30).startswith("after-0-")
+        print("✅ A worker crash fails its job and the replacement takes the next one")
+    finally:
+        pool.stop()
+
+    # Jobs submitted before any worker is ready must not wait for ASR_JOB_TIMEOUT
+    pool = make_pool(workers=2, loader=broken_loader)
+    try:
+        jobs = [pool.submit(f"0:file{i}") for i in range(3)]
+        for job in jobs:
+            try:
+                job.result(timeout=30)
+                assert False, "expected failure"
+            except RuntimeError as e:
+                assert "model file missing" in str(e)
+        print("✅ A model that cannot load fails queued jobs at once")
+    finally:
+        pool.stop()
+
+
+
+def test_running_pool_lookup_does_not_start_workers():
+    assert worker_pool.running_asr_pool() is None
+    assert worker_pool._pool is None
+    print("✅ Checking for a running pool creates no workers")
+
+
+if __name__ == "__main__":
+    test_parallel_jobs_and_progress()
+    test_priority_and_backpressure()
+    test_dead_workers_fail_their_jobs()
+    test_running_pool_lookup_does_not_start_workers()
@@ -0,0 +1,136 @@
+import io
+import sys
+import os
+import time
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+import numpy as np
+
+from backend.asr.model_registry import FASTER_WHISPER
+from backend.asr.segmented import drop_repeated_words, plan_segments, stitch, transcribe_segmented, transcribe_stream
+from backend.audio.extract import PCMRingBuffer, pcm_windows
+from backend.asr.worker_pool import ASRWorkerPool
+
+RATE = 16000
+
+
+def speech(seconds, seed=0):
+    return (np.random.default_rng(seed).standard_normal(int(seconds * RATE)) * 0.1).astype(np.float32)
+
+
+def silence(seconds):
+    return np.zeros(int(seconds * RATE), dtype=np.float32)
+
+
+class FakeSegment:
+    def __init__(self, start, end, text):
+        self.start, self.end, self.text = start, end, text
+
+
+class FakeInfo:
+    def __init__(self, duration):
+        self.duration = duration
+
+
+class LengthModel:
+    """Reports one segment per clip, named after its length, after a short 'decode'."""
+
+    def transcribe(self, audio):
+        seconds = len(audio) / RATE
+        time.sleep(0.3)
+        return iter([FakeSegment(0.0, seconds, f"clip{round(seconds)}")]), FakeInfo(seconds)
+
+
+def length_loader(key):
+    return LengthModel()
+
+
+def test_plan_cuts_at_silences():
+    print("🧪 Testing segmented transcription...\n")
+    # 40s speech | 1s silence | 40s speech | 1s silence | 20s speech
+    audio = np.concatenate([speech(40, 1), silence(1), speech(40, 2), silence(1), speech(20, 3)])
+    plan = plan_segments(audio, min_seconds=30, max_seconds=60)
+    cuts = [round(end / RATE, 1) for _, end in plan]
+    assert cuts == [40.5, 81.5, 102.0], cuts
+    assert all(plan[i][1] == plan[i + 1][0] for i in range(len(plan) - 1))
+    print(f"✅ Cuts placed in silences: {cuts}")
+
+    # No silence at all: hard cuts at max with overlap
+    plan = plan_segments(speech(130), min_seconds=30, max_seconds=60, overlap_seconds=1)
+    assert [(s / RATE, e / RATE) for s, e in plan] == [(0, 60), (59, 119), (118, 130)]
+    print("✅ Hard cuts overlap by one second")
+
+
+def test_stitch_dedupes_overlap():
+    pieces = [
+        (0, 60 * RATE, [(0.0, 30.0, "we agreed on the budget"), (30.0, 59.8, "and the launch is on friday")]),
+        # Next piece starts 1s earlier and hears the cut-off words again
+        (59 * RATE, 90 * RATE, [(0.0, 1.5, "friday, right"), (1.5, 20.0, "Amr owns the checklist")]),
+    ]
+    merged = stitch(pieces)
+    assert [t for _, _, t in merged] == [
+        "we agreed on the budget", "and the launch is on friday", "right", "Amr owns the checklist"
+    ], merged
+    assert merged[-1][:2] == (60.5, 79.0)
+    print(f"✅ Stitched with absolute timestamps: {merged}")
+
+    assert drop_repeated_words("the launch is on Friday.", "on friday we ship") == "we ship"
+    assert drop_repeated_words("unrelated", "new words") == "new words"
+    print("✅ Repeated words across the cut dropped")
+
+
+def test_ring_buffer_wraps():
+    ring = PCMRingBuffer(5)
+    ring.write_pcm(np.array([0, 16384, -16384], dtype=np.int16).tobytes())
+    assert np.allclose(ring.read(2), [0.0, 0.5])
+    ring.write_pcm(np.array([8192, 8192, -32768], dtype=np.int16).tobytes())  # Wraps around the end
+    assert len(ring) == 4
+    assert np.allclose(ring.read(4), [-0.5, 0.25, 0.25, -1.0])
+    try:
+        ring.write_pcm(np.zeros(6, dtype=np.int16).tobytes())
+        assert False, "expected overflow"
+    except ValueError:
+        pass
+    print("✅ Ring buffer wraps and refuses to overflow")
+
+    pcm = (np.arange(10, dtype=np.int16) * 1000).tobytes()
+    windows = list(pcm_windows(io.BytesIO(pcm), window=4, read_bytes=6))
+    assert [len(w) for w in windows] == [4, 4, 2]
+    assert np.allclose(np.concatenate(windows) * 32768, np.arange(10) * 1000)
+    print("✅ Pipe reader yields full windows, then the remainder")
+
+
+def test_parallel_segments_on_pool():
+    audio = np.concatenate([speech(40, 1), silence(1), speech(40, 2), silence(1), speech(40, 3),
+                            silence(1), speech(20, 4)])
+    pool = ASRWorkerPool(workers=4, backend=FASTER_WHISPER, model_name="fake", loader=length_loader)
+    pool.start()
+    try:
+        progress = []
+        result = transcribe_segmented(audio, pool, on_progress=progress.append)
+        assert result["pieces"] == 4
+        assert result["text"] == "clip40 clip41 clip41 clip20", result["text"]
+        starts = [s["start"] for s in result["segments"]]
+        assert starts == sorted(starts) and starts[0] == 0.0
+        assert progress[-1] == 1.0 and progress.count(1.0) == 1
+        assert progress == sorted(progress), progress
+        assert pool.stats()["completed"] == 4
+        print(f"✅ {result['pieces']} segments transcribed on the pool: {result['text']}")
+
+        # Decoder-sized blocks give the same cuts as the whole recording
+        blocks = (audio[i:i + 10 * RATE] for i in range(0, len(audio), 10 * RATE))
+        progress = []
+        streamed = transcribe_stream(blocks, pool, on_progress=progress.append)
+        assert streamed["text"] == result["text"] and streamed["segments"] == result["segments"]
+        # Without a known length progress is measured against decoded audio, but still never drops
+        assert progress == sorted(progress) and progress[-1] == 1.0, progress
+        print("✅ Streamed blocks stitched identically")
+    finally:
+        pool.stop()
+
+
+if __name__ == "__main__":
+    test_plan_cuts_at_silences()
+    test_stitch_dedupes_overlap()
+    test_ring_buffer_wraps()
+    test_parallel_segments_on_pool()
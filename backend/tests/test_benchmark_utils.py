@@ -0,0 +1,39 @@
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from benchmarks.fakes import FakeLLMService, LatencyProfile, SimulatedFailure
+from benchmarks.stats import percentile, run_load
+from benchmarks.transcripts import generate_transcript, SIZES
+
+
+def test_benchmark_utils():
+    print("🧪 Testing benchmark helpers...\n")
+    values = [i / 100 for i in range(1, 101)]
+    assert percentile(values, 50) == 0.50
+    assert percentile(values, 95) == 0.95
+    assert percentile(values, 99) == 0.99
+    print("✅ Nearest-rank percentiles")
+
+    small = generate_transcript(SIZES["small"], seed=1)
+    assert small == generate_transcript(SIZES["small"], seed=1)
+    assert small != generate_transcript(SIZES["small"], seed=2)
+    assert len(small) >= SIZES["small"]
+    print(f"✅ Deterministic transcripts ({len(small)} chars)")
+
+    llm = FakeLLMService(LatencyProfile(failure_rate=1.0), seed=0)
+    try:
+        llm.generate_json("prompt", system_prompt="planner")
+        assert False, "expected simulated failure"
+    except SimulatedFailure:
+        pass
+
+    llm = FakeLLMService(seed=0)
+    stats = run_load(lambda t: llm.generate_json(t, system_prompt="planner"), ["a", "b", "c"], concurrency=2)
+    assert stats["completed"] == 3 and stats["errors"] == 0
+    assert llm.calls == 3
+    print(f"✅ Load runner: {stats['meetings_per_sec']:.0f} calls/s")
+
+
+if __name__ == "__main__":
+    test_benchmark_utils()
@@ -0,0 +1,88 @@
+import sys
+import os
+import time
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from backend.agents.planner_runner import GeminiPlannerAgent
+from backend.services.base import LLMService
+from backend.utils.chunking import split_transcript
+from backend.utils.normalization import merge_duplicate_tasks
+
+
+class ChunkEchoLLM(LLMService):
+    """Returns one task per 'TODO <owner>: <title>' line found in the prompt."""
+
+    def __init__(self, latency=0.0):
+        self.latency = latency
+        self.calls = 0
+
+    def generate(self, prompt, system_prompt=None):
+        return ""
+
+    def generate_json(self, prompt, system_prompt=None):
+        self.calls += 1
+        time.sleep(self.latency)
+        tasks = []
+        for line in prompt.splitlines():
+            if "TODO" in line:
+                owner, title = line.split("TODO ", 1)[1].split(": ", 1)
+                tasks.append({"title": title.strip(), "owner": owner, "description": line})
+        return tasks
+
+
+def build_transcript(turns):
+    lines = []
+    for i in range(turns):
+        speaker = ["Paarth", "Ravi", "Sarah"][i % 3]
+        lines.append(f"{speaker}: We talked through item {i} in some detail and agreed to follow up later.")
+        if i % 10 == 0:
+            lines.append(f"{speaker}: TODO {speaker}: Follow up on item {i}")
+    return "\n".join(lines)
+
+
+def test_split_transcript():
+    print("🧪 Testing transcript chunking...\n")
+    transcript = build_transcript(200)
+    chunks = split_transcript(transcript, max_chars=2000, overlap_chars=300)
+    assert len(chunks) > 1
+    assert all(len(c) <= 2000 for c in chunks)
+    # Chunks break on speaker turns, never mid-line
+    assert all(c.splitlines()[0].split(":")[0] in ("Paarth", "Ravi", "Sarah") for c in chunks)
+    # Consecutive chunks overlap
+    assert chunks[0].splitlines()[-1] in chunks[1]
+    print(f"✅ {len(chunks)} chunks, max {max(len(c) for c in chunks)} chars")
+
+
+def test_merge_duplicate_tasks():
+    print("🧪 Testing task reduce stage...\n")
+    merged = merge_duplicate_tasks([
+        {"title": "Fix login bug", "owner": "Paarth", "description": "short"},
+        {"title": "Fix the login bug", "owner": "Paarth Sharma", "deadline": "Friday", "description": "longer description"},
+        {"title": "Fix login bug", "owner": "Ravi"},
+        {"title": "Update API docs", "owner": "Unassigned"},
+    ])
+    assert len(merged) == 3
+    assert merged[0]["deadline"] == "Friday" and merged[0]["description"] == "longer description"
+    print(f"✅ Merged to {[t['title'] + ' / ' + t['owner'] for t in merged]}")
+
+
+def test_chunked_extraction():
+    print("🧪 Testing map-reduce task extraction...\n")
+    transcript = build_transcript(300)
+    llm = ChunkEchoLLM(latency=0.05)
+    planner = GeminiPlannerAgent(llm, chunk_chars=2000, overlap_chars=300, max_concurrency=8)
+
+    start = time.perf_counter()
+    tasks = planner.extract_tasks(transcript)
+    elapsed = time.perf_counter() - start
+
+    titles = sorted(t["title"] for t in tasks)
+    assert titles == sorted(f"Follow up on item {i}" for i in range(0, 300, 10))
+    assert elapsed < llm.calls * llm.latency
+    print(f"✅ {len(tasks)} tasks from {llm.calls} chunks in {elapsed:.2f}s")
+
+
+if __name__ == "__main__":
+    test_split_transcript()
+    test_merge_duplicate_tasks()
+    test_chunked_extraction()
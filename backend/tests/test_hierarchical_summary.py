@@ -0,0 +1,61 @@
+import sys
+import os
+import json
+from types import SimpleNamespace
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from backend.agents.summary_agent import GeminiSummaryAgent
+from backend.services.llm_cache import LLMResponseCache
+from backend.services.llm_service import GeminiLLMService
+
+
+class CountingModel:
+    """Records prompts that reach the model and returns a partial or final summary."""
+
+    def __init__(self):
+        self.prompts = []
+
+    def generate_content(self, prompt):
+        self.prompts.append(prompt)
+        if "ONE PART" in prompt:
+            summary = {"overview": "part", "key_points": ["kp"], "decisions": [], "action_items": []}
+        else:
+            summary = {"title": "Long Meeting", "overview": "combined", "key_points": ["kp"],
+                       "decisions": [], "action_items": [], "next_steps": ""}
+        return SimpleNamespace(text=json.dumps(summary))
+
+
+def build_transcript(turns, start=0):
+    return "\n".join(
+        f"Speaker {'AB'[i % 2]}: Discussion point number {i} went on for quite a while."
+        for i in range(start, start + turns)
+    )
+
+
+def test_hierarchical_incremental_summary():
+    print("🧪 Testing hierarchical summary...\n")
+    # A real service with an in-memory response cache; only cache misses reach the model
+    llm = GeminiLLMService(api_key="test", response_cache=LLMResponseCache(path=":memory:"))
+    model = CountingModel()
+    llm._get_model = lambda *args, **kwargs: model
+    agent = GeminiSummaryAgent(llm, window_chars=1500, max_concurrency=4)
+
+    transcript = build_transcript(120)
+    summary = agent.generate_summary(transcript, [{"title": "Ship it", "owner": "Ravi"}])
+    assert summary["overview"] == "combined"
+    window_calls = sum("ONE PART" in p for p in model.prompts)
+    assert window_calls > 1
+    assert "- Ship it (owner: Ravi)" in model.prompts[-1]
+    print(f"✅ First pass: {window_calls} window summaries + 1 reduce")
+
+    # Append to the meeting: unchanged windows come from the response cache
+    model.prompts.clear()
+    grown = transcript + "\n" + build_transcript(20, start=120)
+    agent.generate_summary(grown, [])
+    new_window_calls = sum("ONE PART" in p for p in model.prompts)
+    assert 0 < new_window_calls < window_calls
+    print(f"✅ Incremental pass: {new_window_calls} window summaries")
+
+
+if __name__ == "__main__":
+    test_hierarchical_incremental_summary()
@@ -0,0 +1,41 @@
+import sys
+import os
+import time
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from backend.agents.intent_router import IntentRouter
+
+
+def test_intent_router():
+    print("🧪 Testing local intent router...\n")
+    router = IntentRouter()
+
+    cases = {
+        "hi": "ANSWER",
+        "Thanks a lot!": "ANSWER",
+        "Summarize the meeting": "SUMMARY",
+        "Give me a recap of Monday's standup": "SUMMARY",
+        "Who owns the login bug?": "SEARCH",
+        "What did Amr advise?": "SEARCH",
+        "what did we discuss about hiring": "SEARCH",
+    }
+    start = time.perf_counter()
+    for query, expected in cases.items():
+        decision = router.route(query)
+        assert decision is not None and decision.split(":")[0] == expected, (query, decision)
+    per_query_us = (time.perf_counter() - start) / len(cases) * 1e6
+    print(f"✅ {len(cases)} common questions routed locally ({per_query_us:.0f}µs each)")
+
+    # Chatter after "ok" is not mistaken for thanks; unclear questions defer to the LLM
+    assert not router.route("ok what did Amr say").startswith("ANSWER")
+    assert router.route("What's the weather like") is None
+    router.record_llm_decision("ANSWER: It is sunny")
+
+    stats = router.stats()
+    assert stats["llm"] == 1 and stats["rule"] + stats["classifier"] == len(cases) + 1
+    assert stats["intent:ANSWER"] == 3
+    print(f"✅ Low-confidence queries fall back to the LLM: {stats}")
+
+
+if __name__ == "__main__":
+    test_intent_router()
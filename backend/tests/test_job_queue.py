@@ -0,0 +1,58 @@
+import sys
+import os
+import time
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from backend.services.job_queue import InMemoryJobQueue, JobWorkerPool, JOB_COMPLETED, JOB_FAILED
+
+
+class FakeHTTPError(Exception):
+    def __init__(self, status_code, detail):
+        self.status_code = status_code
+        self.detail = detail
+
+
+def handler(job, timings):
+    timings["planner"] = 0.01
+    if job["payload"].get("fail"):
+        raise FakeHTTPError(409, "duplicate")
+    return {"echo": job["payload"]["transcript"]}
+
+
+def wait_for(job_queue, job_id, timeout=5.0):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        job = job_queue.get_job(job_id)
+        if job["status"] in (JOB_COMPLETED, JOB_FAILED):
+            return job
+        time.sleep(0.02)
+    raise TimeoutError(job_id)
+
+
+def test_job_queue():
+    print("🧪 Testing in-process job queue...\n")
+    job_queue = InMemoryJobQueue()
+    pool = JobWorkerPool(job_queue, handler, workers=2)
+    pool.start()
+
+    try:
+        ok_id = job_queue.enqueue({"transcript": "hello"}, user_id=1)
+        fail_id = job_queue.enqueue({"transcript": "dup", "fail": True}, user_id=1)
+
+        ok = wait_for(job_queue, ok_id)
+        assert ok["status"] == JOB_COMPLETED
+        assert ok["result"] == {"echo": "hello"}
+        assert ok["timings"] == {"planner": 0.01}
+        print(f"✅ Completed job: {ok['result']}")
+
+        failed = wait_for(job_queue, fail_id)
+        assert failed["status"] == JOB_FAILED
+        assert failed["status_code"] == 409 and failed["error"] == "duplicate"
+        assert failed["timings"] == {"planner": 0.01}
+        print(f"✅ Failed job recorded: {failed['status_code']} {failed['error']}")
+    finally:
+        pool.stop()
+
+
+if __name__ == "__main__":
+    test_job_queue()
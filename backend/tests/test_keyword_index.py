@@ -0,0 +1,48 @@
+import sys
+import os
+import tempfile
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from backend.services.keyword_index import InvertedIndex, KeywordIndexStore, index_terms
+
+
+def test_inverted_index():
+    print("🧪 Testing BM25 keyword index...\n")
+    assert "amr khan" in index_terms("Advice from Amr Khan on interviews")
+
+    index = InvertedIndex()
+    index.add("Meeting: Career Guidance\nAmr Khan advised practicing system design.", {"conversation_id": 4})
+    index.add("Meeting: Budget Review\nThe budget was approved; budget owners assigned.", {"conversation_id": 1})
+    index.add("Meeting: Standup\nAmr mentioned the budget briefly.", {"conversation_id": 2})
+    assert not index.add("Meeting: Standup\nAmr mentioned the budget briefly.")
+
+    hits = index.search("Amr Khan advice", limit=2)
+    assert hits[0][1].startswith("Meeting: Career Guidance")
+    assert index.search("budget", limit=1)[0][1].startswith("Meeting: Budget Review")
+    filtered = index.search("Amr", filters={"metadata": {"conversation_id": "2"}})
+    assert [text for _, text in filtered] == ["Meeting: Standup\nAmr mentioned the budget briefly."]
+    print("✅ Entity phrases rank first, BM25 favours repeated terms, filters apply")
+
+
+def test_keyword_store_persists_and_seeds_once():
+    with tempfile.TemporaryDirectory() as tmp:
+        store = KeywordIndexStore(root=tmp)
+        store.add("user_1", "Meeting: Launch\nPriya owns the launch checklist.")
+
+        loads = []
+        def load():
+            loads.append(1)
+            return ["Meeting: Old\nAmr reviewed last quarter.", "Meeting: Launch\nPriya owns the launch checklist."]
+
+        store.seed("user_1", load)
+        store.seed("user_1", load)
+        assert len(loads) == 1 and len(store.index_for("user_1")) == 2
+
+        reopened = KeywordIndexStore(root=tmp)
+        assert reopened.index_for("user_1").search("Amr")[0][1].startswith("Meeting: Old")
+        print("✅ Index persists and backfills from existing memories once")
+
+
+if __name__ == "__main__":
+    test_inverted_index()
+    test_keyword_store_persists_and_seeds_once()
@@ -0,0 +1,101 @@
+import sys
+import os
+import time
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from types import SimpleNamespace
+
+import google.generativeai as genai
+
+from backend.services.llm_cache import LLMResponseCache
+from backend.services.llm_service import GeminiLLMService, GenerativeModelCache
+
+
+class FakeModel:
+    """Returns canned responses in order; streamed replies end with `finish`."""
+
+    def __init__(self, replies, finish=genai.protos.Candidate.FinishReason.STOP):
+        self.replies = list(replies)
+        self.finish = finish
+        self.calls = 0
+
+    def generate_content(self, prompt, stream=False):
+        self.calls += 1
+        text = self.replies.pop(0)
+        if not stream:
+            return SimpleNamespace(text=text)
+        candidate = SimpleNamespace(finish_reason=self.finish)
+        return iter([SimpleNamespace(text=text, candidates=[candidate])])
+
+
+def test_llm_cache():
+    print("🧪 Testing LLM response cache...\n")
+    cache = LLMResponseCache(path=":memory:", ttl_seconds=60, max_entries=2)
+
+    key = LLMResponseCache.make_key("gemini", "system", "transcript", {"response_mime_type": "application/json"})
+    assert key == LLMResponseCache.make_key("gemini", "system", "transcript", {"response_mime_type": "application/json"})
+    assert key != LLMResponseCache.make_key("gemini", "system", "transcript", None)
+
+    assert cache.get(key) is None
+    cache.set(key, '{"tasks": []}')
+    assert cache.get(key) == '{"tasks": []}'
+    print(f"✅ Hit after set: {cache.stats()}")
+
+    # Size bound evicts the least recently used entry
+    cache.set("b", "B")
+    time.sleep(0.01)
+    cache.get(key)
+    cache.set("c", "C")
+    assert cache.get("b") is None
+    assert cache.get(key) is not None
+    assert cache.stats()["entries"] == 2
+    print("✅ LRU eviction respected max_entries")
+
+    # TTL expiry
+    cache.ttl_seconds = 0
+    time.sleep(0.01)
+    assert cache.get("c") is None
+    print(f"✅ Expired entries are misses: {cache.stats()}")
+
+
+
+def test_gemini_caches_only_complete_output():
+    print("🧪 Testing what the Gemini service writes to the cache...\n")
+    llm = GeminiLLMService(api_key="test", response_cache=LLMResponseCache(path=":memory:"))
+
+    model = FakeModel(["not json", "{}", '{"tasks": ["ship"]}'])
+    llm._get_model = lambda *args, **kwargs: model
+    assert llm.generate_json("transcript") == {}
+    assert llm.generate_json("transcript") == {}
+    assert llm.generate_json("transcript") == {"tasks": ["ship"]}
+    assert llm.generate_json("transcript") == {"tasks": ["ship"]} and model.calls == 3
+    print("✅ Unparseable and empty JSON replies are retried, not cached")
+
+    model = FakeModel(["partial", "partial", "full"], finish=genai.protos.Candidate.FinishReason.SAFETY)
+    llm._get_model = lambda *args, **kwargs: model
+    assert list(llm.stream("question")) == ["partial"]
+    model.finish = genai.protos.Candidate.FinishReason.STOP
+    chunks = llm.stream("question")
+    assert next(chunks) == "partial"
+    chunks.close()  # Client went away mid-stream
+    assert list(llm.stream("question")) == ["full"]
+    assert list(llm.stream("question")) == ["full"] and model.calls == 3
+    print("✅ Only streams that finished with STOP are cached")
+
+
+
+def test_models_bound_to_their_own_key():
+    models = GenerativeModelCache(max_size=4)
+    alice = models.get("key-alice", "gemini-2.5-flash-lite")
+    bob = models.get("key-bob", "gemini-2.5-flash-lite")
+    assert models.get("key-alice", "gemini-2.5-flash-lite") is alice
+    assert alice._client is not None and alice._async_client is not None
+    assert alice._client is not bob._client and alice._async_client is not bob._async_client
+    assert models.get("key-alice", "gemini-2.5-flash-lite", system_prompt="json")._async_client is alice._async_client
+    print("✅ Sync and async clients are bound per API key")
+
+
+if __name__ == "__main__":
+    test_llm_cache()
+    test_gemini_caches_only_complete_output()
+    test_models_bound_to_their_own_key()
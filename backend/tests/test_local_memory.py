@@ -0,0 +1,53 @@
+import sys
+import os
+import time
+import tempfile
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from backend.services.local_memory_service import LocalMemoryService
+
+MEETINGS = [
+    (1, "2026-01-05", "Meeting: Budget Review\nSummary: Finance team discussed the Q1 budget and hiring freeze."),
+    (2, "2026-01-12", "Meeting: Career Guidance\nSummary: Amr advised Paarth to focus on system design interviews."),
+    (3, "2026-01-12", "Meeting: Cooking Club\nSummary: We planned a pasta night and a bread baking workshop."),
+]
+
+
+def test_local_memory():
+    print("🧪 Testing local vector memory...\n")
+    with tempfile.TemporaryDirectory() as tmp:
+        memory = LocalMemoryService(root=tmp, dim=1024)
+        for conversation_id, date, text in MEETINGS:
+            memory.add_memory(text, user_id="user_1", session_id=f"s{conversation_id}",
+                              metadata={"conversation_id": conversation_id, "meeting_date": date})
+        memory.add_memory("Meeting: Other user\nSummary: Amr budget", user_id="user_2")
+
+        start = time.perf_counter()
+        results = memory.search_memory("What did Amr advise about interviews?", user_id="user_1", limit=2)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        assert results[0].startswith("Meeting: Career Guidance"), results
+        assert all("Other user" not in r for r in results)
+        print(f"✅ Top hit is the right meeting ({elapsed_ms:.2f}ms)")
+
+        by_date = memory.search_memory("meeting", user_id="user_1",
+                                       filters={"metadata": {"meeting_date": "2026-01-12"}})
+        assert len(by_date) == 2 and not any("Budget" in r for r in by_date)
+        by_id = memory.get_all_memories(user_id="user_1", filters={"metadata": {"conversation_id": 1}})
+        assert by_id == [MEETINGS[0][2]]
+        assert memory.get_all_memories(user_id="user_1", limit=2) == [MEETINGS[2][2], MEETINGS[1][2]]
+        print("✅ conversation_id / meeting_date filters and newest-first history")
+
+        # Grow past the initial capacity, then reopen from disk
+        for i in range(100):
+            memory.add_memory(f"Standup {i}: deployment pipeline status", user_id="user_1")
+        # Metadata columns grew with the matrix, so filters still line up with rows
+        assert memory.search_memory("hiring freeze budget", user_id="user_1", limit=5,
+                                    filters={"metadata": {"conversation_id": 1}}) == [MEETINGS[0][2]]
+        reopened = LocalMemoryService(root=tmp, dim=1024)
+        assert len(reopened.get_all_memories(user_id="user_1", limit=None)) == 103
+        assert reopened.search_memory("hiring freeze budget", user_id="user_1", limit=1)[0] == MEETINGS[0][2]
+        print("✅ Memory-mapped store grows and reloads from disk")
+
+
+if __name__ == "__main__":
+    test_local_memory()
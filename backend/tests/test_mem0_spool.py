@@ -0,0 +1,67 @@
+import sys
+import os
+import time
+import tempfile
+import threading
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from backend.services.memory_spool import MemorySpool, MemoryWriter
+
+
+def test_mem0_spool():
+    print("🧪 Testing Mem0 write-behind spool...\n")
+    sent, lock = [], threading.Lock()
+    flaky = {"remaining": 2}
+
+    def send(payload):
+        time.sleep(0.05)  # Simulated Mem0 round trip
+        with lock:
+            if payload["text"] == "flaky" and flaky["remaining"]:
+                flaky["remaining"] -= 1
+                raise RuntimeError("503 from Mem0")
+            sent.append(payload["text"])
+
+    spool = MemorySpool(":memory:")
+    writer = MemoryWriter("acct", send, spool, batch_size=4, flush_interval=0.05, max_backoff=0.05)
+
+    start = time.perf_counter()
+    for i in range(10):
+        writer.enqueue({"text": f"memory {i}", "user_id": "user_1", "metadata": {}})
+    writer.enqueue({"text": "flaky", "user_id": "user_1", "metadata": {}})
+    enqueue_ms = (time.perf_counter() - start) * 1000
+    assert enqueue_ms < 100, "enqueue must not wait for Mem0"
+
+    assert writer.flush(timeout=5)
+    assert sorted(sent) == sorted([f"memory {i}" for i in range(10)] + ["flaky"])
+    assert spool.stats() == {"pending": 0, "dead": 0}
+    print(f"✅ 11 writes queued in {enqueue_ms:.1f}ms, flushed in batches, flaky write retried")
+    writer.stop()
+
+
+def test_mem0_spool_survives_restart():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "spool.sqlite3")
+
+        def down(payload):
+            raise RuntimeError("Mem0 unreachable")
+
+        writer = MemoryWriter("acct", down, MemorySpool(path), flush_interval=0.05, max_attempts=1)
+        writer.enqueue({"text": "kept", "user_id": "user_1", "metadata": {}})
+        writer.stop(timeout=0.3)
+
+        # Parked entries stay on disk; pending ones resume with the next writer
+        spool = MemorySpool(path)
+        assert spool.stats() == {"pending": 0, "dead": 1}
+        spool.put("acct", {"text": "later", "user_id": "user_1", "metadata": {}})
+
+        sent = []
+        resumed = MemoryWriter("acct", lambda p: sent.append(p["text"]), spool, flush_interval=0.05)
+        assert resumed.flush(timeout=5)
+        assert sent == ["later"]
+        resumed.stop()
+        print("✅ Spool survives a restart and resumes pending writes")
+
+
+if __name__ == "__main__":
+    test_mem0_spool()
+    test_mem0_spool_survives_restart()
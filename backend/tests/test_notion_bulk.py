@@ -0,0 +1,78 @@
+import sys
+import os
+import time
+import threading
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from backend.services.notion_service import NotionTaskService
+from backend.utils.rate_limit import TokenBucket
+
+
+class RateLimited(Exception):
+    status = 429
+    headers = {"retry-after": "0.05"}
+
+
+class FakePages:
+    """Stands in for client.pages: slow creates, one 429 for the task titled 'flaky'."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.flaky_attempts = 0
+
+    def create(self, parent, properties):
+        title = properties["Title"]["title"][0]["text"]["content"]
+        with self.lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            time.sleep(0.05)
+            if title == "flaky":
+                with self.lock:
+                    self.flaky_attempts += 1
+                    if self.flaky_attempts == 1:
+                        raise RateLimited()
+            if title == "broken":
+                raise ValueError("validation_error")
+            return {"id": f"page-{title}"}
+        finally:
+            with self.lock:
+                self.in_flight -= 1
+
+
+def test_create_tasks():
+    print("🧪 Testing bulk Notion task creation...\n")
+    service = NotionTaskService(auth_token="test-token", database_id="db")
+    pages = FakePages()
+    service.client = type("FakeClient", (), {"pages": pages})()
+    service.rate_limiter = TokenBucket(rate=1000, capacity=1000)
+
+    titles = [f"task-{i}" for i in range(6)] + ["flaky", "broken"]
+    start = time.perf_counter()
+    results = service.create_tasks([{"title": t} for t in titles], meeting_page_id="meeting", max_workers=4)
+    elapsed = time.perf_counter() - start
+
+    assert [r["title"] for r in results] == titles
+    assert results[0]["id"] == "page-task-0" and results[0]["error"] is None
+    assert results[-2]["id"] == "page-flaky" and pages.flaky_attempts == 2
+    assert results[-1]["id"] == "" and results[-1]["error"] == "validation_error"
+    assert pages.max_in_flight <= 4
+    print(f"✅ {len(results)} ordered results in {elapsed:.2f}s, max in flight {pages.max_in_flight}, 429 retried")
+
+
+def test_token_bucket():
+    bucket = TokenBucket(rate=20, capacity=1)
+    start = time.perf_counter()
+    for _ in range(5):
+        bucket.acquire()
+    elapsed = time.perf_counter() - start
+    # First token is free (burst 1), the other 4 wait 1/20s each
+    assert 0.18 <= elapsed < 0.5, elapsed
+    print(f"✅ Token bucket paced 5 calls at 20/s in {elapsed:.2f}s")
+
+
+if __name__ == "__main__":
+    test_create_tasks()
+    test_token_bucket()
@@ -0,0 +1,66 @@
+import sys
+import os
+import time
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from backend.services.notion_users import NotionUserCache, NotionUserDirectory
+
+
+USERS = [
+    {"id": "u1", "name": "Paarth Sharma"},
+    {"id": "u2", "name": "Sarah O'Connor"},
+    {"id": "u3", "name": "José Álvarez"},
+    {"id": "u4", "name": "Sarah Lee"},
+]
+
+
+def test_directory_resolve():
+    print("🧪 Testing Notion user directory...\n")
+    directory = NotionUserDirectory(USERS)
+
+    cases = {
+        "Paarth Sharma": "u1",      # exact
+        "paarth": "u1",             # token
+        "Paa": "u1",                # prefix
+        "Paarth Sharma (PM)": "u1", # extra words
+        "sarah lee": "u4",          # exact beats first token match
+        "Sarah": "u2",              # tie -> first listed
+        "O'Connor": "u2",           # punctuation
+        "jose alvarez": "u3",       # accents
+        "Unknown User": None,
+        "": None,
+    }
+    for name, expected in cases.items():
+        assert directory.resolve(name) == expected, (name, directory.resolve(name))
+    assert directory.name_map()["paarth sharma"] == "u1"
+
+    start = time.perf_counter()
+    for _ in range(10000):
+        directory.resolve("Paarth")
+    per_call_us = (time.perf_counter() - start) / 10000 * 1e6
+    print(f"✅ {len(cases)} names resolved, {per_call_us:.1f}µs per lookup")
+
+
+def test_cache_refresh():
+    fetches = []
+
+    def fetch():
+        fetches.append(time.monotonic())
+        return USERS[:len(fetches) + 1]
+
+    cache = NotionUserCache(ttl_seconds=0.05)
+    key = cache.workspace_key("token")
+    assert len(cache.get(key, fetch).users) == 2
+    assert len(cache.get(key, fetch).users) == 2 and len(fetches) == 1
+
+    time.sleep(0.1)
+    stale = cache.get(key, fetch)  # served immediately, refresh runs in background
+    assert len(stale.users) == 2
+    time.sleep(0.1)
+    assert len(cache.get(key, fetch).users) == 3
+    print(f"✅ Stale directory served while refreshing ({len(fetches)} fetches)")
+
+
+if __name__ == "__main__":
+    test_directory_resolve()
+    test_cache_refresh()
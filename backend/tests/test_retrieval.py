@@ -0,0 +1,79 @@
+import sys
+import os
+import asyncio
+import tempfile
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from backend.services.retrieval import HybridRetriever, reciprocal_rank_fusion, trim_to_budget
+from backend.services.local_memory_service import LocalMemoryService
+from backend.agents.meeting_query_agent import MeetingQueryAgent
+
+
+class StubLLM:
+    """Routes every question to SEARCH and returns a fixed answer."""
+
+    def __init__(self):
+        self.prompts = []
+        self.awaited = 0
+
+    def generate(self, prompt, system_prompt=None):
+        self.prompts.append(prompt)
+        return "answer" if "Relevant Meeting Context" in prompt else "SEARCH: whatever"
+
+    async def agenerate(self, prompt, system_prompt=None):
+        self.awaited += 1
+        return self.generate(prompt, system_prompt)
+
+
+def test_fusion_and_budget():
+    print("🧪 Testing hybrid retrieval...\n")
+    fused = reciprocal_rank_fusion([["a", "b", "c"], ["c", "a"], ["d"]])
+    assert fused[:2] == ["a", "c"] and set(fused) == {"a", "b", "c", "d"}
+    assert reciprocal_rank_fusion([["x", "y"], ["y", "x"]]) == ["x", "y"]
+
+    assert trim_to_budget(["a" * 40, "b" * 40, "c" * 40], token_budget=20) == ["a" * 40, "b" * 40]
+    assert trim_to_budget(["z" * 100], token_budget=5) == ["z" * 20]
+    print("✅ RRF keeps rank order and token budget trims from the tail")
+
+
+def test_hybrid_retriever_and_agent():
+    with tempfile.TemporaryDirectory() as tmp:
+        memory = LocalMemoryService(root=tmp, dim=1024)
+        memory.add_memory("Meeting: Career Guidance\nAmr advised practicing system design.", user_id="u",
+                          metadata={"conversation_id": 4, "meeting_date": "2026-02-02"})
+        memory.add_memory("Meeting: Budget Review\nThe Q1 budget was approved.", user_id="u",
+                          metadata={"conversation_id": 1, "meeting_date": "2026-01-05"})
+        memory.add_memory("Meeting: Standup\nAmr is blocked on the budget export.", user_id="u",
+                          metadata={"conversation_id": 2, "meeting_date": "2026-01-06"})
+
+        retriever = HybridRetriever(memory)
+        results = retriever.retrieve("What did Amr say about system design?", user_id="u")
+        assert results[0].startswith("Meeting: Career Guidance") and len(results) == len(set(results))
+
+        pinned = retriever.retrieve("anything at all", user_id="u", filters={"metadata": {"conversation_id": 1}})
+        assert pinned == ["Meeting: Budget Review\nThe Q1 budget was approved."]
+        print("✅ Vector + keyword + metadata lookups fused without duplicates")
+
+        cwd = os.getcwd()
+        os.chdir(tmp)  # The agent appends to backend/agent.log relative to cwd
+        try:
+            llm = StubLLM()
+            answer, sources = MeetingQueryAgent(llm, memory).run("What did Amr say about system design?", user_id="u")
+            async_llm = StubLLM()
+            async_answer, async_sources = asyncio.run(
+                MeetingQueryAgent(async_llm, memory).arun("What did Amr say about system design?", user_id="u"))
+        finally:
+            os.chdir(cwd)
+        assert answer == "answer"
+        assert sources[0] == "Career Guidance" and "Standup" in sources
+        print(f"✅ Agent answers from fused context, sources: {sources}")
+
+        # The router has learned the question by now, so only the answer call may reach the LLM
+        assert (async_answer, async_sources) == (answer, sources)
+        assert async_llm.awaited == len(async_llm.prompts) >= 1
+        print("✅ arun() awaits its LLM calls and matches run()")
+
+
+if __name__ == "__main__":
+    test_fusion_and_budget()
+    test_hybrid_retriever_and_agent()
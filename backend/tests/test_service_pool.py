@@ -0,0 +1,56 @@
+import sys
+import os
+from types import SimpleNamespace
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from backend.services import service_pool as pool_module
+from backend.services.service_pool import ServicePool
+
+
+class DummyBundle:
+    built = 0
+
+    def __init__(self, credentials):
+        DummyBundle.built += 1
+        self.credentials = credentials
+
+
+def make_settings(gemini_key):
+    return SimpleNamespace(
+        gemini_api_key=gemini_key, notion_token=None, notion_database_id=None,
+        notion_meeting_db_id=None, notion_task_db_id=None, slack_bot_token=None
+    )
+
+
+def test_service_pool():
+    print("🧪 Testing per-user service pool...\n")
+    original = pool_module.ServiceBundle
+    pool_module.ServiceBundle = DummyBundle
+    try:
+        pool = ServicePool(max_size=2)
+        first = pool.get(1, make_settings("key-a"))
+        assert pool.get(1, make_settings("key-a")) is first
+        print(f"✅ Reused bundle: {pool.stats()}")
+
+        # Changed credentials build a new bundle and drop the old one
+        rotated = pool.get(1, make_settings("key-b"))
+        assert rotated is not first and rotated.credentials["gemini_api_key"] == "key-b"
+        assert pool.stats()["size"] == 1
+
+        # LRU bound
+        pool.get(2, make_settings("key-c"))
+        pool.get(3, make_settings("key-d"))
+        assert pool.stats()["size"] == 2
+        assert pool.get(1, make_settings("key-b")) is not rotated
+
+        pool.invalidate(1)
+        built = DummyBundle.built
+        pool.get(1, make_settings("key-b"))
+        assert DummyBundle.built == built + 1
+        print(f"✅ Credential change, eviction and invalidation rebuild bundles: {pool.stats()}")
+    finally:
+        pool_module.ServiceBundle = original
+
+
+if __name__ == "__main__":
+    test_service_pool()
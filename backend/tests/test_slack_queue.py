@@ -0,0 +1,66 @@
+import sys
+import os
+import time
+import asyncio
+from types import SimpleNamespace
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from backend.services.slack_service import SlackService
+
+
+class RateLimited(Exception):
+    def __init__(self):
+        super().__init__("ratelimited")
+        self.response = SimpleNamespace(status_code=429, headers={"Retry-After": "0.1"})
+
+
+class FakeAsyncClient:
+    """Records posts with timestamps; rate-limits the first post to #busy."""
+
+    def __init__(self):
+        self.posts = []
+        self.opens = 0
+        self.limited = False
+
+    async def conversations_open(self, users):
+        self.opens += 1
+        await asyncio.sleep(0.01)
+        return {"channel": {"id": f"D-{users}"}}
+
+    async def chat_postMessage(self, channel, text=None, blocks=None):
+        await asyncio.sleep(0.02)
+        if channel == "#busy" and not self.limited:
+            self.limited = True
+            raise RateLimited()
+        self.posts.append((channel, text, time.monotonic()))
+        return {"ok": True, "channel": channel}
+
+
+def test_slack_queue():
+    print("🧪 Testing Slack outbound queue...\n")
+    slack = SlackService("xoxb-test", channel_interval=0.05, max_concurrency=4)
+    client = FakeAsyncClient()
+    slack._async_client = client
+
+    start = time.perf_counter()
+    futures = [slack.send_message("#general", text=f"msg {i}") for i in range(3)]
+    futures += [slack.send_dm(f"U{i}", text="dm") for i in range(4)]
+    futures += [slack.send_dm("U0", text="second dm")]
+    futures.append(slack.send_message("#busy", text="retried"))
+    queued_in = time.perf_counter() - start
+    assert queued_in < 0.05, "sends must not block the caller"
+
+    assert slack.flush(timeout=5)
+    assert all(f.result()["ok"] for f in futures)
+
+    general = [p for p in client.posts if p[0] == "#general"]
+    assert [p[1] for p in general] == ["msg 0", "msg 1", "msg 2"]
+    assert all(b[2] - a[2] >= 0.045 for a, b in zip(general, general[1:]))
+    assert client.opens == 4, "DM channels are opened once per user"
+    assert ("#busy", "retried") in [(p[0], p[1]) for p in client.posts]
+    print(f"✅ {len(client.posts)} messages sent in order per channel, 429 retried, "
+          f"queued in {queued_in * 1000:.1f}ms, done in {time.perf_counter() - start:.2f}s")
+
+
+if __name__ == "__main__":
+    test_slack_queue()
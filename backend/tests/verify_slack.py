@@ -31,14 +31,14 @@ try:
         slack.send_dm(
             user_id=user_id,
             text="✅ Slack DM test successful!"
-        )
+        ).result(timeout=30)
         print("✅ DM sent successfully")
     else:
         print(f"👉 Sending message to Channel ID: {channel_id}")
         slack.send_channel_message(
             channel_id=channel_id,
             text="✅ Slack channel test successful!"
-        )
+        ).result(timeout=30)
         print("✅ Channel message sent successfully")
 
 except Exception as e:
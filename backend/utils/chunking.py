@@ -0,0 +1,96 @@
+"""
+Transcript Chunking Utilities
+
+Splits long transcripts into overlapping chunks on speaker-turn and paragraph
+boundaries, so each chunk can be sent to the LLM independently.
+"""
+import re
+from typing import List
+
+# "Speaker A: ...", "Paarth: ...", "[00:12:03] Ravi: ..."
+SPEAKER_TURN_RE = re.compile(r"^\s*(\[[\d:.]+\]\s*)?[A-Z][\w .'-]{0,40}:\s")
+SENTENCE_END_RE = re.compile(r"(?<=[.!?])\s+")
+
+
+def _split_units(transcript: str) -> List[str]:
+    """Split into paragraphs, then into speaker turns within each paragraph."""
+    units = []
+    for paragraph in re.split(r"\n\s*\n", transcript):
+        current = []
+        for line in paragraph.splitlines():
+            if current and SPEAKER_TURN_RE.match(line):
+                units.append("\n".join(current))
+                current = []
+            current.append(line)
+        if current:
+            units.append("\n".join(current))
+    return [u.strip() for u in units if u.strip()]
+
+
+def _split_oversized(unit: str, max_chars: int) -> List[str]:
+    """Break a single unit longer than max_chars on sentence ends, then hard-wrap."""
+    pieces, current = [], ""
+    for sentence in SENTENCE_END_RE.split(unit):
+        while len(sentence) > max_chars:
+            if current:
+                pieces.append(current)
+                current = ""
+            pieces.append(sentence[:max_chars])
+            sentence = sentence[max_chars:]
+        if current and len(current) + 1 + len(sentence) > max_chars:
+            pieces.append(current)
+            current = sentence
+        else:
+            current = f"{current} {sentence}" if current else sentence
+    if current:
+        pieces.append(current)
+    return pieces
+
+
+def split_transcript(transcript: str, max_chars: int = 12000, overlap_chars: int = 500) -> List[str]:
+    """
+    Split a transcript into chunks of at most ~max_chars.
+
+    Chunks break only between speaker turns / paragraphs (oversized turns are
+    split on sentences). Each chunk after the first starts with the trailing
+    turns of the previous chunk, up to overlap_chars, so tasks spanning a
+    boundary are still seen whole by at least one chunk.
+
+    Args:
+        transcript: Full transcript text
+        max_chars: Target maximum chunk size in characters
+        overlap_chars: Characters of trailing context repeated in the next chunk
+
+    Returns:
+        List of chunk strings (a single chunk if the transcript already fits)
+    """
+    if len(transcript) <= max_chars:
+        return [transcript]
+
+    units = []
+    for unit in _split_units(transcript):
+        units.extend(_split_oversized(unit, max_chars) if len(unit) > max_chars else [unit])
+
+    chunks = []
+    current: List[str] = []
+    current_len = 0
+    for unit in units:
+        if current and current_len + len(unit) + 2 > max_chars:
+            chunks.append("\n\n".join(current))
+
+            # Carry trailing units into the next chunk as overlap
+            overlap: List[str] = []
+            overlap_len = 0
+            for prev in reversed(current):
+                if overlap_len + len(prev) > overlap_chars or overlap_len + len(prev) + len(unit) > max_chars:
+                    break
+                overlap.insert(0, prev)
+                overlap_len += len(prev) + 2
+            current, current_len = overlap, overlap_len
+
+        current.append(unit)
+        current_len += len(unit) + 2
+
+    if current:
+        chunks.append("\n\n".join(current))
+    return chunks
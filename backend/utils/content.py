@@ -1,17 +1,38 @@
 import os
+from typing import Callable, Optional
 import requests
 import mimetypes
 from urllib.parse import urlparse
 from fastapi import HTTPException
 
-# Optional: Import transcription module if available
+# Optional: Import transcription module if available (the model itself loads on first use)
 try:
+    from backend.asr.model_registry import OPENAI_WHISPER, backend_available
     from backend.asr.whisper_transcriber import transcribe_audio
-    HAS_WHISPER = True
+    from backend.asr.worker_pool import ASR_POOL_BACKEND, ASRPoolBusy, asr_pool_enabled, get_asr_pool
+    from backend.asr.segmented import segmented_enabled, transcribe_segmented
+    HAS_WHISPER = backend_available(OPENAI_WHISPER) or (asr_pool_enabled() and backend_available(ASR_POOL_BACKEND))
 except ImportError:
     HAS_WHISPER = False
 
-def get_content_from_url(url: str) -> str:
+
+def _transcribe(path: str, on_progress: Optional[Callable[[float], None]] = None) -> str:
+    """
+    Transcribe in the ASR worker pool when enabled (split into parallel
+    segments unless ASR_SEGMENTED=false), else inline in this thread.
+    """
+    pool = get_asr_pool()
+    if pool is None:
+        return transcribe_audio(path)
+    try:
+        if segmented_enabled(pool):
+            return transcribe_segmented(path, pool, on_progress)["text"]
+        return pool.transcribe(path, on_progress=on_progress)
+    except ASRPoolBusy as e:
+        raise HTTPException(status_code=503, detail=f"Transcription queue is full, try again later ({e})")
+
+
+def get_content_from_url(url: str, on_progress: Optional[Callable[[float], None]] = None) -> str:
     """Download content from URL."""
     try:
         response = requests.get(url, timeout=10)
@@ -33,17 +54,19 @@ def get_content_from_url(url: str) -> str:
                 tmp_path = tmp.name
             
             try:
-                text = transcribe_audio(tmp_path)
+                text = _transcribe(tmp_path, on_progress)
                 return text
             finally:
                 if os.path.exists(tmp_path):
                     os.remove(tmp_path)
                     
         return response.text
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=400, detail=f"Failed to fetch URL: {str(e)}")
 
-def get_content_from_file(file_path: str) -> str:
+def get_content_from_file(file_path: str, on_progress: Optional[Callable[[float], None]] = None) -> str:
     """Read content from local file path."""
     if not os.path.exists(file_path):
         raise HTTPException(status_code=400, detail="File not found")
@@ -61,7 +84,9 @@ def get_content_from_file(file_path: str) -> str:
     # Audio/Video
     if HAS_WHISPER and mime_type and ('audio' in mime_type or 'video' in mime_type):
         try:
-            return transcribe_audio(file_path)
+            return _transcribe(file_path, on_progress)
+        except HTTPException:
+            raise
         except Exception as e:
             raise HTTPException(status_code=400, detail=f"Transcription failed: {str(e)}")
             
@@ -1,7 +1,14 @@
 """
 Data Normalization Utilities
 """
-from typing import Dict, Any, Optional
+import re
+import hashlib
+from typing import Dict, Any, List, Optional
+
+def compute_transcript_hash(transcript: str) -> str:
+    """Content hash used for duplicate detection (ignores leading/trailing whitespace)."""
+    return hashlib.sha256((transcript or "").strip().encode("utf-8")).hexdigest()
+
 
 def normalize_task_data(raw_task: Dict[str, Any]) -> Dict[str, Any]:
     """
@@ -45,3 +52,69 @@ def normalize_task_data(raw_task: Dict[str, Any]) -> Dict[str, Any]:
         "deadline": str(deadline).strip(),
         "status": status
     }
+
+
+_TITLE_STOPWORDS = {"a", "an", "the", "to", "for", "of", "on", "in", "and", "with", "by"}
+
+
+def _title_tokens(title: str) -> set:
+    words = re.sub(r"[^a-z0-9 ]", " ", str(title or "").lower()).split()
+    return {w for w in words if w not in _TITLE_STOPWORDS}
+
+
+def _is_blank(value: Any) -> bool:
+    return str(value or "").strip().lower() in ("", "none", "null", "unassigned", "tbd")
+
+
+def _normalize_owner(owner: Optional[str]) -> str:
+    return "" if _is_blank(owner) else str(owner).strip().lower()
+
+
+def _owners_match(a: str, b: str) -> bool:
+    """Owners match if either is unknown or one name contains the other ("Paarth" vs "Paarth Sharma")."""
+    return not a or not b or a in b or b in a
+
+
+def title_similarity(a: str, b: str) -> float:
+    """
+    Similarity of two task titles in [0, 1]: Jaccard overlap of their
+    non-stopword tokens. Token-based so "item 1" and "item 10" stay distinct.
+    """
+    tokens_a, tokens_b = _title_tokens(a), _title_tokens(b)
+    if not tokens_a or not tokens_b:
+        return 0.0
+    return len(tokens_a & tokens_b) / len(tokens_a | tokens_b)
+
+
+def merge_duplicate_tasks(tasks: List[Dict[str, Any]], threshold: float = 0.75) -> List[Dict[str, Any]]:
+    """
+    Merge tasks extracted from overlapping transcript chunks.
+    
+    Two tasks are duplicates when their titles are similar (>= threshold) and
+    their owners are compatible. The merged task keeps the longer description
+    and fills missing owner/deadline from the duplicate. Order of first
+    appearance is preserved.
+    """
+    merged: List[Dict[str, Any]] = []
+    for task in tasks:
+        title = task.get("title") or task.get("task") or ""
+        owner = _normalize_owner(task.get("owner"))
+        
+        match = None
+        for existing in merged:
+            if (_owners_match(owner, _normalize_owner(existing.get("owner")))
+                    and title_similarity(title, existing.get("title") or existing.get("task")) >= threshold):
+                match = existing
+                break
+        
+        if match is None:
+            merged.append(dict(task))
+            continue
+        
+        if len(str(task.get("description") or "")) > len(str(match.get("description") or "")):
+            match["description"] = task["description"]
+        for field in ("owner", "deadline", "type"):
+            if _is_blank(match.get(field)) and not _is_blank(task.get(field)):
+                match[field] = task[field]
+    
+    return merged
@@ -0,0 +1,59 @@
+"""
+Rate Limiting Utilities
+
+Thread-safe token bucket shared by every service instance that talks to the
+same upstream account (e.g. one bucket per Notion integration token).
+"""
+import hashlib
+import threading
+import time
+from typing import Dict, Optional
+
+
+class TokenBucket:
+    """Token bucket: `rate` tokens/second, bursts up to `capacity`."""
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        """
+        Block until `tokens` are available and consume them.
+
+        Tokens are reserved before sleeping, so concurrent callers queue up
+        fairly instead of waking together. Returns the seconds waited.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= tokens
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    def penalize(self, seconds: float) -> None:
+        """Push every caller back by `seconds` (e.g. after a 429 with Retry-After)."""
+        with self._lock:
+            self._tokens = min(self._tokens, 0.0) - seconds * self.rate
+
+
+_buckets: Dict[str, TokenBucket] = {}
+_buckets_lock = threading.Lock()
+
+
+def get_token_bucket(name: str, key: str, rate: float, capacity: Optional[float] = None) -> TokenBucket:
+    """Process-wide bucket for (name, key). The key is hashed so secrets are never stored."""
+    bucket_key = f"{name}:{hashlib.sha256((key or '').encode('utf-8')).hexdigest()[:16]}"
+    with _buckets_lock:
+        bucket = _buckets.get(bucket_key)
+        if bucket is None:
+            bucket = TokenBucket(rate, capacity)
+            _buckets[bucket_key] = bucket
+        return bucket
@@ -0,0 +1,76 @@
+"""
+Benchmark the LangGraph meeting workflow (create_meeting_graph) with fake services.
+
+Usage:
+    python benchmarks/bench_graph.py --meetings 50 --concurrency 1,4,8 --size large
+"""
+import os
+import sys
+import argparse
+import contextlib
+import io
+
+# Add project root (for `backend`) and backend/ (graph.py imports `graph.nodes`) to path
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(1, os.path.join(ROOT, "backend"))
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--meetings", type=int, default=20, help="Meetings per concurrency level")
+    parser.add_argument("--concurrency", default="1,4", help="Comma-separated concurrency levels")
+    parser.add_argument("--size", default="medium", help="Transcript size: small, medium, large, xlarge")
+    parser.add_argument("--llm-latency", type=float, default=0.2, help="Base seconds per LLM call")
+    parser.add_argument("--llm-per-1k", type=float, default=0.005, help="Extra seconds per 1k prompt chars")
+    parser.add_argument("--notion-latency", type=float, default=0.05, help="Seconds per Notion call")
+    parser.add_argument("--slack-latency", type=float, default=0.05, help="Seconds per Slack call")
+    parser.add_argument("--mem0-latency", type=float, default=0.1, help="Seconds per Mem0 call")
+    parser.add_argument("--failure-rate", type=float, default=0.0, help="Failure probability for every fake call")
+    parser.add_argument("--verbose", action="store_true", help="Show node logs")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    os.environ.setdefault("LLM_CACHE_ENABLED", "false")
+    os.environ.setdefault("SLACK_TEST_USER_ID", "U-BENCH")
+
+    from backend.graph.graph import create_meeting_graph
+    from benchmarks.fakes import (
+        FakeLLMService, FakeTaskStorageService, FakeSlackService, FakeMem0Service,
+        FakeServiceContainer, LatencyProfile
+    )
+    from benchmarks.stats import run_load, format_report
+    from benchmarks.transcripts import generate_batch
+
+    container = FakeServiceContainer(
+        llm_service=FakeLLMService(LatencyProfile(args.llm_latency, args.llm_per_1k, failure_rate=args.failure_rate)),
+        task_storage=FakeTaskStorageService(LatencyProfile(args.notion_latency, failure_rate=args.failure_rate)),
+        slack_service=FakeSlackService(LatencyProfile(args.slack_latency, failure_rate=args.failure_rate)),
+        mem0_service=FakeMem0Service(LatencyProfile(args.mem0_latency, failure_rate=args.failure_rate)),
+    )
+    graph = create_meeting_graph(container)
+
+    def run(item):
+        meeting_id, transcript = item
+        graph.invoke({"meeting_id": meeting_id, "transcript": transcript})
+
+    levels = [int(c) for c in args.concurrency.split(",")]
+    print(f"⏱️  create_meeting_graph: {args.meetings} {args.size} meetings per level, "
+          f"LLM {args.llm_latency}s/call, failure rate {args.failure_rate}\n")
+
+    for i, concurrency in enumerate(levels):
+        transcripts = generate_batch(args.meetings, args.size, seed=i * args.meetings)
+        items = [(f"bench-{i}-{n}", t) for n, t in enumerate(transcripts)]
+        output = contextlib.nullcontext() if args.verbose else contextlib.redirect_stdout(io.StringIO())
+        with output:
+            stats = run_load(run, items, concurrency)
+        print(format_report(f"concurrency={concurrency}", stats))
+
+    print(f"\n   LLM calls: {container.llm_service.calls}, Notion calls: {container.task_storage.calls}, "
+          f"Slack calls: {container.slack_service.calls}, Mem0 calls: {container.mem0_service.calls}")
+
+
+if __name__ == "__main__":
+    main()
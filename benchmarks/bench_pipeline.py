@@ -0,0 +1,101 @@
+"""
+Benchmark process_meeting_pipeline end to end with fake services.
+
+Runs the real pipeline (planner, summary, DB writes, Mem0, Notion, Slack
+stages) against a throwaway SQLite database, with fake LLM/Notion/Slack/Mem0
+services, and reports p50/p95/p99 latency and meetings/sec per concurrency.
+
+Usage:
+    python benchmarks/bench_pipeline.py --meetings 50 --concurrency 1,4,8 --size medium
+    python benchmarks/bench_pipeline.py --mode parallel --llm-latency 0.5 --failure-rate 0.05
+"""
+import os
+import sys
+import argparse
+import contextlib
+import io
+import tempfile
+from types import SimpleNamespace
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--meetings", type=int, default=20, help="Meetings per concurrency level")
+    parser.add_argument("--concurrency", default="1,4", help="Comma-separated concurrency levels")
+    parser.add_argument("--size", default="medium", help="Transcript size: small, medium, large, xlarge")
+    parser.add_argument("--mode", default="sequential", help="Processing mode: sequential, parallel, combined")
+    parser.add_argument("--llm-latency", type=float, default=0.2, help="Base seconds per LLM call")
+    parser.add_argument("--llm-per-1k", type=float, default=0.005, help="Extra seconds per 1k prompt chars")
+    parser.add_argument("--notion-latency", type=float, default=0.05, help="Seconds per Notion call")
+    parser.add_argument("--slack-latency", type=float, default=0.05, help="Seconds per Slack call")
+    parser.add_argument("--mem0-latency", type=float, default=0.1, help="Seconds per Mem0 call")
+    parser.add_argument("--failure-rate", type=float, default=0.0, help="Failure probability for every fake call")
+    parser.add_argument("--database-url", default=None, help="Database URL (default: temporary SQLite file)")
+    parser.add_argument("--verbose", action="store_true", help="Show pipeline logs")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+
+    # The engine is created at import time, so point it at the benchmark DB first
+    db_dir = tempfile.mkdtemp(prefix="meeting_bench_")
+    os.environ["DATABASE_URL"] = args.database_url or f"sqlite:///{os.path.join(db_dir, 'bench.db')}"
+    os.environ.setdefault("LLM_CACHE_ENABLED", "false")
+
+    from backend.database import SessionLocal, init_db
+    from backend.models.database import User
+    from backend.models.schemas import MeetingInput
+    from backend.pipeline.meeting_pipeline import process_meeting_pipeline
+    from benchmarks.fakes import (
+        FakeLLMService, FakeTaskStorageService, FakeSlackService, FakeMem0Service, LatencyProfile
+    )
+    from benchmarks.stats import run_load, format_report
+    from benchmarks.transcripts import generate_batch
+
+    init_db()
+    db = SessionLocal()
+    user = User(email=f"bench-{os.getpid()}@example.com", hashed_password="x")
+    db.add(user)
+    db.commit()
+    user_id = user.id
+    db.close()
+
+    settings = SimpleNamespace(slack_channel_id="C-BENCH")
+    llm = FakeLLMService(LatencyProfile(args.llm_latency, args.llm_per_1k, failure_rate=args.failure_rate))
+    notion = FakeTaskStorageService(LatencyProfile(args.notion_latency, failure_rate=args.failure_rate))
+    slack = FakeSlackService(LatencyProfile(args.slack_latency, failure_rate=args.failure_rate))
+    mem0 = FakeMem0Service(LatencyProfile(args.mem0_latency, failure_rate=args.failure_rate))
+
+    def process(transcript):
+        session = SessionLocal()
+        try:
+            meeting = MeetingInput(transcript=transcript, processing_mode=args.mode)
+            process_meeting_pipeline(
+                meeting, user_id, settings, session,
+                services=(llm, notion, slack), mem0_service=mem0
+            )
+        finally:
+            session.close()
+
+    levels = [int(c) for c in args.concurrency.split(",")]
+    print(f"⏱️  process_meeting_pipeline: {args.meetings} {args.size} meetings per level, mode={args.mode}, "
+          f"LLM {args.llm_latency}s/call, failure rate {args.failure_rate}\n")
+
+    for i, concurrency in enumerate(levels):
+        # Fresh transcripts per level so duplicate detection never short-circuits
+        transcripts = generate_batch(args.meetings, args.size, seed=i * args.meetings)
+        output = contextlib.nullcontext() if args.verbose else contextlib.redirect_stdout(io.StringIO())
+        with output:
+            stats = run_load(process, transcripts, concurrency)
+        print(format_report(f"concurrency={concurrency}", stats))
+
+    print(f"\n   LLM calls: {llm.calls}, Notion calls: {notion.calls}, "
+          f"Slack calls: {slack.calls}, Mem0 calls: {mem0.calls}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,253 @@
+"""
+Fake services for offline benchmarks.
+
+Each fake sleeps for a configurable latency (plus jitter) per call and fails
+at a configurable rate, so the pipeline and graph can be measured without
+Gemini, Notion, Slack or Mem0.
+"""
+import random
+import threading
+import time
+import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+from backend.services.base import LLMService, StateStorageService, TaskStorageService
+
+
+class SimulatedFailure(Exception):
+    """Raised by a fake service to simulate an upstream error."""
+
+
+@dataclass
+class LatencyProfile:
+    """Per-call latency model: base + per_1k_chars * size/1000, +/- jitter fraction."""
+
+    base: float = 0.0
+    per_1k_chars: float = 0.0
+    jitter: float = 0.1
+    failure_rate: float = 0.0
+
+
+class FakeService:
+    """Shared latency/failure simulation and call counters."""
+
+    def __init__(self, profile: Optional[LatencyProfile] = None, seed: Optional[int] = None):
+        self.profile = profile or LatencyProfile()
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self.calls = 0
+        self.failures = 0
+
+    def _simulate(self, size: int = 0) -> None:
+        with self._lock:
+            self.calls += 1
+            jitter = self._random.uniform(-self.profile.jitter, self.profile.jitter)
+            fail = self._random.random() < self.profile.failure_rate
+            if fail:
+                self.failures += 1
+
+        delay = (self.profile.base + self.profile.per_1k_chars * size / 1000) * (1 + jitter)
+        if delay > 0:
+            time.sleep(delay)
+        if fail:
+            raise SimulatedFailure(f"{type(self).__name__} simulated failure")
+
+
+class FakeLLMService(FakeService, LLMService):
+    """Returns canned tasks / summaries shaped like the real agents expect."""
+
+    def __init__(self, profile: Optional[LatencyProfile] = None, seed: Optional[int] = None,
+                 tasks_per_call: int = 3):
+        super().__init__(profile, seed)
+        self.tasks_per_call = tasks_per_call
+
+    def _tasks(self, prompt: str) -> List[Dict[str, Any]]:
+        # Derive titles from the prompt so chunked runs produce distinct tasks
+        tag = abs(hash(prompt)) % 10000
+        return [
+            {
+                "title": f"Follow up on item {tag}-{i}",
+                "owner": "Paarth" if i % 2 == 0 else None,
+                "deadline": "Friday" if i % 3 == 0 else None,
+                "description": "Generated by FakeLLMService",
+                "type": "Action Item"
+            }
+            for i in range(self.tasks_per_call)
+        ]
+
+    def _summary(self) -> Dict[str, Any]:
+        return {
+            "title": "Synthetic Sync",
+            "overview": "The team reviewed progress and agreed on next steps.",
+            "key_points": ["Release is on track", "Login bug needs an owner"],
+            "decisions": ["Ship on Friday"],
+            "action_items": ["Fix login bug"],
+            "next_steps": "Reconvene next week"
+        }
+
+    def generate(self, prompt: str, system_prompt: Optional[str] = None, use_cache: bool = True) -> str:
+        self._simulate(len(prompt))
+        return "SEARCH"
+
+    def generate_json(self, prompt: str, system_prompt: Optional[str] = None, use_cache: bool = True) -> Any:
+        self._simulate(len(prompt) + len(system_prompt or ""))
+        if system_prompt and '"summary"' in system_prompt:
+            return {"tasks": self._tasks(prompt), "summary": self._summary()}
+        if system_prompt:
+            return self._tasks(prompt)
+        return self._summary()
+
+
+class FakeTaskStorageService(FakeService, TaskStorageService):
+    """In-memory stand-in for NotionTaskService."""
+
+    def __init__(self, profile: Optional[LatencyProfile] = None, seed: Optional[int] = None):
+        super().__init__(profile, seed)
+        self.tasks: Dict[str, Dict[str, Any]] = {}
+        self.pages: Dict[str, Any] = {}
+
+    def create_task(self, task: Dict[str, Any], meeting_page_id: str = None,
+                    meeting_sequence_id: int = None) -> str:
+        self._simulate()
+        task_id = str(uuid.uuid4())
+        with self._lock:
+            self.tasks[task_id] = dict(task, meeting_page_id=meeting_page_id)
+        return task_id
+
+    def create_tasks(self, tasks: List[Dict[str, Any]], meeting_page_id: str = None,
+                     meeting_sequence_id: int = None, max_workers: int = 3) -> List[Dict[str, Any]]:
+        """Same contract as NotionTaskService.create_tasks (ordered per-task results)."""
+        def create(task):
+            try:
+                return {"title": task.get("title"), "id": self.create_task(task, meeting_page_id), "error": None}
+            except SimulatedFailure as e:
+                return {"title": task.get("title"), "id": "", "error": str(e)}
+
+        if not tasks:
+            return []
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(tasks))) as executor:
+            return list(executor.map(create, tasks))
+
+    def update_task(self, task_id: str, updates: Dict[str, Any]) -> None:
+        self._simulate()
+        with self._lock:
+            self.tasks[task_id].update(updates)
+
+    def get_task(self, task_id: str) -> Dict[str, Any]:
+        self._simulate()
+        return self.tasks[task_id]
+
+    def create_meeting_row(self, meeting_id: int, transcript: str = "") -> str:
+        self._simulate()
+        page_id = str(uuid.uuid4())
+        with self._lock:
+            self.pages[page_id] = meeting_id
+        return page_id
+
+    def create_meeting_summary(self, summary: Dict[str, Any], page_id: str) -> str:
+        self._simulate()
+        return page_id
+
+    def map_agent_task_to_notion(self, agent_task: Dict[str, Any], meeting_id: str = None) -> Dict[str, Any]:
+        return {
+            "title": agent_task.get("title") or agent_task.get("task") or "Untitled Task",
+            "status": "Not started",
+            "task_type": agent_task.get("task_type", "Action Item"),
+            "description": agent_task.get("description", ""),
+            "due_date": None,
+            "meeting_id": meeting_id
+        }
+
+
+class FakeSlackService(FakeService):
+    """Records messages instead of posting them (SlackService interface)."""
+
+    def __init__(self, profile: Optional[LatencyProfile] = None, seed: Optional[int] = None):
+        super().__init__(profile, seed)
+        self.sent: List[Dict[str, Any]] = []
+
+    def _record(self, channel: str, text: str = None, blocks: list = None) -> Future:
+        # Like SlackService, return a Future; the simulated latency is paid here
+        future = Future()
+        try:
+            self._simulate()
+            with self._lock:
+                self.sent.append({"channel": channel, "text": text, "blocks": blocks})
+            future.set_result({"ok": True, "channel": channel})
+        except SimulatedFailure as e:
+            future.set_exception(e)
+        return future
+
+    def send_dm(self, user_id: str, text: str = None, blocks: list = None) -> Future:
+        return self._record(user_id, text, blocks)
+
+    def send_channel_message(self, channel_id: str, text: str = None, blocks: list = None) -> Future:
+        return self._record(channel_id, text, blocks)
+
+    def send_message(self, channel: str, blocks: list = None, text: str = None) -> Future:
+        return self._record(channel, text, blocks)
+
+
+class FakeMem0Service(FakeService):
+    """In-memory stand-in for Mem0Service (substring search)."""
+
+    def __init__(self, profile: Optional[LatencyProfile] = None, seed: Optional[int] = None):
+        super().__init__(profile, seed)
+        self.client = self  # Pipeline checks `mem0.client` before writing
+        self.memories: List[Dict[str, Any]] = []
+
+    def add_memory(self, text: str, user_id: str = "default_user", session_id: str = None,
+                   metadata: Dict[str, Any] = None):
+        self._simulate(len(text))
+        with self._lock:
+            self.memories.append({"text": text, "user_id": user_id, "metadata": metadata or {}})
+
+    def search_memory(self, query: str, user_id: str = "default_user", filters: Dict[str, Any] = None,
+                      limit: int = 5):
+        self._simulate(len(query))
+        words = set(query.lower().split())
+        with self._lock:
+            matches = [m["text"] for m in self.memories
+                       if m["user_id"] == user_id and words & set(m["text"].lower().split())]
+        return matches[:limit]
+
+    def get_all_memories(self, user_id: str = "default_user", filters: dict = None, limit: int = 100) -> List[str]:
+        self._simulate()
+        with self._lock:
+            return [m["text"] for m in self.memories if m["user_id"] == user_id][:limit]
+
+
+class InMemoryStateStorage(StateStorageService):
+    """StateStorageService that keeps states in a dict (no disk I/O)."""
+
+    def __init__(self):
+        self.states: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def save_state(self, meeting_id: str, state: Dict[str, Any]) -> None:
+        with self._lock:
+            self.states[meeting_id] = state
+
+    def load_state(self, meeting_id: str) -> Dict[str, Any]:
+        return self.states[meeting_id]
+
+    def list_states(self) -> List[str]:
+        return list(self.states)
+
+
+class FakeServiceContainer:
+    """Duck-typed ServiceContainer exposing fake services to create_meeting_graph."""
+
+    def __init__(self, llm_service: FakeLLMService, task_storage: FakeTaskStorageService,
+                 slack_service: FakeSlackService, mem0_service: Optional[FakeMem0Service] = None,
+                 slack_channel_id: str = "C-BENCH"):
+        from types import SimpleNamespace
+
+        self.config = SimpleNamespace(slack_channel_id=slack_channel_id)
+        self.llm_service = llm_service
+        self.task_storage = task_storage
+        self.slack_service = slack_service
+        self.mem0_service = mem0_service
+        self.state_storage = InMemoryStateStorage()
@@ -0,0 +1,69 @@
+"""
+Latency statistics and concurrent load runner for benchmarks.
+"""
+import math
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Sequence
+
+
+def percentile(values: Sequence[float], pct: float) -> float:
+    """Nearest-rank percentile (pct in 0-100)."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def summarize(latencies: List[float], wall_seconds: float, errors: int = 0) -> Dict[str, Any]:
+    """p50/p95/p99/mean latency and throughput for one run."""
+    completed = len(latencies)
+    return {
+        "completed": completed,
+        "errors": errors,
+        "p50": percentile(latencies, 50),
+        "p95": percentile(latencies, 95),
+        "p99": percentile(latencies, 99),
+        "mean": sum(latencies) / completed if completed else 0.0,
+        "wall_seconds": wall_seconds,
+        "meetings_per_sec": completed / wall_seconds if wall_seconds > 0 else 0.0,
+    }
+
+
+def run_load(fn: Callable[[Any], Any], items: Sequence[Any], concurrency: int) -> Dict[str, Any]:
+    """
+    Call fn(item) for every item on `concurrency` threads and summarize.
+
+    Exceptions count as errors and are excluded from the latency figures.
+    """
+    latencies: List[float] = []
+    errors = 0
+
+    def timed(item):
+        start = time.perf_counter()
+        fn(item)
+        return time.perf_counter() - start
+
+    wall_start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        futures = [executor.submit(timed, item) for item in items]
+        for future in futures:
+            try:
+                latencies.append(future.result())
+            except Exception:
+                errors += 1
+    wall = time.perf_counter() - wall_start
+
+    return summarize(latencies, wall, errors)
+
+
+def format_report(label: str, stats: Dict[str, Any]) -> str:
+    return (
+        f"   {label:<28} "
+        f"p50 {stats['p50'] * 1000:8.1f}ms  "
+        f"p95 {stats['p95'] * 1000:8.1f}ms  "
+        f"p99 {stats['p99'] * 1000:8.1f}ms  "
+        f"{stats['meetings_per_sec']:7.2f} meetings/s  "
+        f"({stats['completed']} ok, {stats['errors']} errors)"
+    )
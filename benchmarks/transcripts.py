@@ -0,0 +1,59 @@
+"""
+Synthetic meeting transcript generators.
+
+Transcripts use "Speaker: text" turns like real input, so chunking and
+windowing code paths are exercised the same way.
+"""
+import random
+from typing import List, Optional
+
+SPEAKERS = ["Paarth", "Ravi", "Ananya", "Maya", "Tom", "Priya"]
+
+SENTENCES = [
+    "We need to fix the login bug before the release.",
+    "I can take the onboarding flow redesign this sprint.",
+    "The API latency went up after the last deploy.",
+    "Let's schedule a follow-up with the design team on Thursday.",
+    "Can someone own the migration script for the billing tables?",
+    "The customer demo is moving to next Monday.",
+    "I'll update the dashboard metrics by Friday.",
+    "We decided to drop support for the legacy export format.",
+    "QA found two regressions in the checkout page.",
+    "Marketing wants the launch blog post reviewed by Wednesday.",
+    "Let's keep the scope small and ship the MVP first.",
+    "I'm blocked on access to the staging database.",
+]
+
+# Approximate transcript sizes in characters
+SIZES = {
+    "small": 2_000,       # ~5 minute standup
+    "medium": 10_000,     # ~30 minute meeting
+    "large": 40_000,      # ~2 hour meeting, chunked by the planner
+    "xlarge": 120_000,    # all-day workshop
+}
+
+
+def generate_transcript(target_chars: int, seed: Optional[int] = None, speakers: Optional[List[str]] = None) -> str:
+    """
+    Generate a transcript of roughly target_chars characters.
+
+    The same seed always produces the same transcript; different seeds give
+    distinct transcripts (and therefore distinct transcript hashes).
+    """
+    rng = random.Random(seed)
+    speakers = speakers or SPEAKERS
+    turns = [f"Meeting reference: {seed if seed is not None else rng.random()}"]
+    length = len(turns[0])
+
+    while length < target_chars:
+        sentences = " ".join(rng.choice(SENTENCES) for _ in range(rng.randint(1, 4)))
+        turn = f"{rng.choice(speakers)}: {sentences}"
+        turns.append(turn)
+        length += len(turn) + 1
+
+    return "\n".join(turns)
+
+
+def generate_batch(count: int, size: str = "medium", seed: int = 0) -> List[str]:
+    """Generate `count` distinct transcripts of a named size (see SIZES)."""
+    return [generate_transcript(SIZES[size], seed=seed + i) for i in range(count)]
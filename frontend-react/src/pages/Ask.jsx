@@ -4,10 +4,22 @@ import { motion, AnimatePresence } from 'framer-motion'
 import { Send, Loader2, MessageSquare, Brain, Sparkles, Filter } from 'lucide-react'
 import './Ask.css'
 
+// Parse one SSE frame ("event: x\ndata: {...}") into { event, data }
+const parseEvent = (frame) => {
+    let event = 'message'
+    let data = ''
+    for (const line of frame.split('\n')) {
+        if (line.startsWith('event:')) event = line.slice(6).trim()
+        else if (line.startsWith('data:')) data += line.slice(5).trim()
+    }
+    return { event, data: data ? JSON.parse(data) : {} }
+}
+
 export default function AskPage() {
     const { token } = useAuth()
     const [question, setQuestion] = useState('')
     const [loading, setLoading] = useState(false)
+    const [streaming, setStreaming] = useState(false)
     const [conversation, setConversation] = useState([])
     const [error, setError] = useState('')
     const [meetings, setMeetings] = useState([])
@@ -25,15 +37,24 @@ export default function AskPage() {
         fetchMeetings()
     }, [])
 
+    // Follow X-Next-Cursor (as History does) so the filters list every meeting,
+    // not just the newest page; each page shows up as soon as it arrives
     const fetchMeetings = async () => {
         try {
-            const res = await fetch('/api/meetings/conversations', {
-                headers: { 'Authorization': `Bearer ${token}` }
-            })
-            if (res.ok) {
+            let cursor = null
+            do {
+                const page = cursor
+                const url = page
+                    ? `/api/meetings/conversations?limit=200&cursor=${encodeURIComponent(page)}`
+                    : '/api/meetings/conversations?limit=200'
+                const res = await fetch(url, {
+                    headers: { 'Authorization': `Bearer ${token}` }
+                })
+                if (!res.ok) break
                 const data = await res.json()
-                setMeetings(data)
-            }
+                setMeetings(prev => page ? [...prev, ...data] : data)
+                cursor = res.headers.get('X-Next-Cursor')
+            } while (cursor)
         } catch (err) {
             console.error("Failed to fetch meetings", err)
         }
@@ -50,8 +71,16 @@ export default function AskPage() {
         // Add user message to conversation
         setConversation(prev => [...prev, { role: 'user', content: userQuestion }])
 
+        // Set once the assistant message exists, so errors can remove it too
+        let assistantAdded = false
+        const updateAssistant = (update) => setConversation(prev => {
+            const next = [...prev]
+            next[next.length - 1] = { ...next[next.length - 1], ...update(next[next.length - 1]) }
+            return next
+        })
+
         try {
-            const res = await fetch('/api/ask', {
+            const res = await fetch('/api/ask/stream', {
                 method: 'POST',
                 headers: {
                     'Authorization': `Bearer ${token}`,
@@ -69,20 +98,42 @@ export default function AskPage() {
                 throw new Error(err.detail || 'Failed to get answer')
             }
 
-            const data = await res.json()
+            // Server-Sent Events: sources first, then answer tokens as they are generated
+            const reader = res.body.getReader()
+            const decoder = new TextDecoder()
+            let buffer = ''
 
-            // Add AI response to conversation
-            setConversation(prev => [...prev, {
-                role: 'assistant',
-                content: data.answer,
-                sources: data.sources
-            }])
+            while (true) {
+                const { value, done } = await reader.read()
+                if (done) break
+                buffer += decoder.decode(value, { stream: true })
+
+                const frames = buffer.split('\n\n')
+                buffer = frames.pop()
+                for (const frame of frames) {
+                    const { event, data } = parseEvent(frame)
+                    if (event === 'sources') {
+                        assistantAdded = true
+                        setStreaming(true)
+                        setConversation(prev => [...prev, {
+                            role: 'assistant',
+                            content: '',
+                            sources: data.sources
+                        }])
+                    } else if (event === 'token') {
+                        updateAssistant(last => ({ content: last.content + data.text }))
+                    } else if (event === 'error') {
+                        throw new Error(data.detail || 'Failed to get answer')
+                    }
+                }
+            }
         } catch (err) {
             setError(err.message)
-            // Remove the user's question if there was an error
-            setConversation(prev => prev.slice(0, -1))
+            // Remove the user's question (and any partial answer) if there was an error
+            setConversation(prev => prev.slice(0, assistantAdded ? -2 : -1))
         } finally {
             setLoading(false)
+            setStreaming(false)
         }
     }
 
@@ -174,7 +225,9 @@ export default function AskPage() {
                                         {msg.role === 'user' ? '👤' : '🤖'}
                                     </div>
                                     <div className="message-content">
-                                        <div className="message-text">{msg.content}</div>
+                                        <div className={`message-text ${streaming && i === conversation.length - 1 ? 'streaming' : ''}`}>
+                                            {msg.content}
+                                        </div>
                                         {msg.sources && msg.sources.length > 0 && (
                                             <div className="message-sources">
                                                 <span className="sources-label">Sources:</span>
@@ -189,7 +242,7 @@ export default function AskPage() {
                         </AnimatePresence>
                     )}
 
-                    {loading && (
+                    {loading && !streaming && (
                         <motion.div
                             className="chat-message assistant loading"
                             initial={{ opacity: 0 }}
@@ -11,18 +11,23 @@ export default function HistoryPage() {
     const [conversations, setConversations] = useState([])
     const [loading, setLoading] = useState(true)
     const [selected, setSelected] = useState(null)
+    const [nextCursor, setNextCursor] = useState(null)
 
     useEffect(() => {
         fetchConversations()
     }, [])
 
-    const fetchConversations = async () => {
+    const fetchConversations = async (cursor = null) => {
         try {
-            const res = await fetch('/api/meetings/conversations', {
+            const url = cursor
+                ? `/api/meetings/conversations?cursor=${encodeURIComponent(cursor)}`
+                : '/api/meetings/conversations'
+            const res = await fetch(url, {
                 headers: { Authorization: `Bearer ${token}` }
             })
             const data = await res.json()
-            setConversations(data)
+            setConversations(prev => cursor ? [...prev, ...data] : data)
+            setNextCursor(res.headers.get('X-Next-Cursor'))
         } catch (err) {
             console.error(err)
         } finally {
@@ -120,6 +125,11 @@ export default function HistoryPage() {
                             </motion.div>
                         ))
                     )}
+                    {nextCursor && (
+                        <button className="load-more-btn" onClick={() => fetchConversations(nextCursor)}>
+                            Load more
+                        </button>
+                    )}
                 </div>
 
                 {/* Detail */}
@@ -4,6 +4,8 @@ import { motion, AnimatePresence } from 'framer-motion'
 import { Send, Loader2, CheckCircle2, User, Calendar, FileText } from 'lucide-react'
 import './Process.css'
 
+const POLL_INTERVAL_MS = 1500
+
 export default function ProcessPage() {
     const { token } = useAuth()
     const [inputType, setInputType] = useState('text') // text, link, file
@@ -71,8 +73,24 @@ export default function ProcessPage() {
                 }
             }
 
-            const data = await res.json()
-            setResult(data)
+            // Processing runs as a background job - poll until it finishes
+            let job = await res.json()
+            while (job.status === 'queued' || job.status === 'running') {
+                await new Promise(resolve => setTimeout(resolve, POLL_INTERVAL_MS))
+                const jobRes = await fetch(`/api/meetings/jobs/${job.job_id}`, {
+                    headers: { 'Authorization': `Bearer ${token}` }
+                })
+                if (!jobRes.ok) {
+                    throw new Error(`Failed to fetch job status (${jobRes.status})`)
+                }
+                job = await jobRes.json()
+            }
+
+            if (job.status === 'failed') {
+                throw new Error(job.error || 'Processing failed')
+            }
+
+            setResult(job.result)
             setTranscript('')
             setFileUrl('')
             setFilePath('')